@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from shared.domain.enums import UserRole
+
+
+@dataclass(frozen=True)
+class AuthUser:
+    """What authorizing a request needs to know about its user."""
+    id: UUID
+    role: UserRole
+    is_banned: bool
+
+
+class UserAuthCacheInterface(ABC):
+    @abstractmethod
+    def get(self, user_id: UUID) -> Optional[AuthUser]:
+        ...
+
+    @abstractmethod
+    def put(self, user: AuthUser) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, user_id: UUID) -> None:
+        ...
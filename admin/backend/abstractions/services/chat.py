@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from uuid import UUID
 
+from shared.abstractions.repositories import Cursor, Page
 from shared.domain.dto import UpdateChatDTO
 from shared.domain.models import Chat
 
@@ -9,7 +10,7 @@ from shared.domain.models import Chat
 class ChatServiceInterface(ABC):
 
     @abstractmethod
-    async def get_chats(self) -> list[Chat]:
+    async def get_chats(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[Chat]:
         ...
 
     @abstractmethod
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import NoReturn
+
+
+class MediaGarbageCollectorInterface(ABC):
+    @abstractmethod
+    async def collect(self) -> int:
+        """Remove uploaded files no post, story, emoji or queued message refers to."""
+        ...
+
+    @abstractmethod
+    async def start(self) -> NoReturn:
+        ...
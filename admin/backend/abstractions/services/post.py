@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from shared.abstractions.repositories import Cursor, Page
 from shared.domain.dto import CreatePostDTO, UpdatePostDTO
 from shared.domain.models import post, Post
 
@@ -9,7 +10,7 @@ from shared.domain.models import post, Post
 class PostServiceInterface(ABC):
 
     @abstractmethod
-    async def get_all_posts(self) -> List[post]:
+    async def get_all_posts(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[Post]:
         ...
 
     @abstractmethod
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Optional
 from uuid import UUID
 
+from shared.abstractions.repositories import Cursor, Page
 from shared.domain.dto.post_to_publish import CreatePostToPublishDTO, UpdatePostToPublishDTO
 from shared.domain.models.post_to_publish import PostToPublish
 
@@ -9,7 +10,12 @@ from shared.domain.models.post_to_publish import PostToPublish
 class PostToPublishServiceInterface(ABC):
 
     @abstractmethod
-    async def get_posts_to_publish(self, user_id: UUID) -> List[PostToPublish]:
+    async def get_posts_to_publish(
+            self,
+            user_id: UUID,
+            limit: int = 100,
+            after: Optional[Cursor] = None,
+    ) -> Page[PostToPublish]:
         ...
 
     @abstractmethod
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    last_modified: Optional[datetime]
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class ResponseCacheInterface(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, response: CachedResponse) -> None:
+        ...
@@ -2,16 +2,19 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
+from shared.abstractions.repositories import Cursor, Page
 from shared.domain.dto import CreateUserDTO, UpdateUserDTO
 from shared.domain.models import User
 
+from abstractions.services.auth.cache import AuthUser
+
 
 class UserServiceInterface(ABC):
     @abstractmethod
-    async def get_all_users(self) -> List[User]:
-        (...
+    async def get_all_users(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[User]:
+        ...
 
-    @abstractmethod)
+    @abstractmethod
     async def get_managers(self) -> List[User]:
         ...
 
@@ -23,6 +26,10 @@ class UserServiceInterface(ABC):
     async def get_user(self, user_id: UUID) -> User:
         ...
 
+    @abstractmethod
+    async def get_auth_user(self, user_id: UUID) -> AuthUser:
+        ...
+
     @abstractmethod
     async def get_user_by_telegram_id(self, telegram_id: int) -> User:
         ...
@@ -0,0 +1,13 @@
+from abstractions.services.auth.cache import UserAuthCacheInterface
+from services.auth.cache import TTLUserAuthCache
+from settings import settings
+
+# shared by the per-request auth and user services, so invalidations reach the middleware
+_user_auth_cache = TTLUserAuthCache(
+    maxsize=settings.auth_cache.maxsize,
+    ttl=settings.auth_cache.ttl,
+)
+
+
+def get_user_auth_cache() -> UserAuthCacheInterface:
+    return _user_auth_cache
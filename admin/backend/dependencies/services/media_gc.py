@@ -0,0 +1,15 @@
+from shared.dependencies.repositories import get_media_reference_repository
+
+from abstractions.services.media_gc import MediaGarbageCollectorInterface
+from services.media_gc import MediaGarbageCollector
+from settings import settings
+from .upload import get_upload_service
+
+
+def get_media_garbage_collector() -> MediaGarbageCollectorInterface:
+    return MediaGarbageCollector(
+        media_reference_repository=get_media_reference_repository(),
+        upload_service=get_upload_service(),
+        interval=settings.media_gc.interval,
+        grace=settings.media_gc.grace,
+    )
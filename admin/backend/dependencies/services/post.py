@@ -4,12 +4,14 @@ from abstractions.services.post import PostServiceInterface
 from dependencies.services.update_post import get_update_post_service
 from dependencies.services.upload import get_upload_service
 from services.post import PostService
+from settings import settings
 
 
 def get_post_service() -> PostServiceInterface:
     return PostService(
         post_repository=get_post_repository(),
         upload_service=get_upload_service(),
-        update_post_service=get_update_post_service()
+        update_post_service=get_update_post_service(),
+        preview_size=settings.previews.list_size,
     )
 
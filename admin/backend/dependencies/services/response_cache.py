@@ -0,0 +1,9 @@
+from abstractions.services.response_cache import ResponseCacheInterface
+from services.response_cache import LRUResponseCache
+
+# responses are cached for the process lifetime, not per request
+_response_cache = LRUResponseCache()
+
+
+def get_response_cache() -> ResponseCacheInterface:
+    return _response_cache
@@ -1,9 +1,26 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 from shared.abstractions.services import UploadServiceInterface
 from shared.dependencies.services import get_upload_service as get_base_upload_service
 from settings import settings
 
+# previews are CPU bound, so they are rendered away from the event loop;
+# workers are spawned on the first upload and live until the app shuts down
+_preview_pool = ProcessPoolExecutor(
+    max_workers=settings.previews.workers,
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
 
 def get_upload_service() -> UploadServiceInterface:
     return get_base_upload_service(
         public_backend_base_url=settings.environment.api_host,
+        preview_pool=_preview_pool,
+        max_file_size=settings.upload.max_file_size,
     )
+
+
+def shutdown_preview_pool() -> None:
+    # renders still queued are dropped, the originals are stored and pages fall back to them
+    _preview_pool.shutdown(cancel_futures=True)
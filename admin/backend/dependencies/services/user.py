@@ -1,6 +1,7 @@
 from shared.dependencies.repositories import get_user_repository, get_proxy_repository
 
 from abstractions.services.user import UserServiceInterface
+from dependencies.services.auth_cache import get_user_auth_cache
 from dependencies.services.telegram import get_telegram_service
 from services.user import UserService
 
@@ -10,4 +11,5 @@ def get_user_service() -> UserServiceInterface:
         user_repository=get_user_repository(),
         telegram_service=get_telegram_service(),
         proxy_repository=get_proxy_repository(),
+        auth_cache=get_user_auth_cache(),
     )
\ No newline at end of file
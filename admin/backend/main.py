@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -7,8 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 # from fastapi.openapi.utils import get_openapi
 from shared.infrastructure.main_db import init_db
 from settings import settings
+from dependencies.services.media_gc import get_media_garbage_collector
+from dependencies.services.upload import shutdown_preview_pool
 from middlewares.auth_middleware import check_for_auth
 # from middlewares import check_for_auth
+from routes.utils import NEXT_CURSOR_HEADER
 from routes import (
     api_router,
 )
@@ -25,7 +29,12 @@ logging.basicConfig(
 async def lifespan(_) -> AsyncGenerator[None, None]:
     init_db(settings.db.url)
 
-    yield
+    media_gc = asyncio.create_task(get_media_garbage_collector().start())
+    try:
+        yield
+    finally:
+        media_gc.cancel()
+        shutdown_preview_pool()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -38,6 +47,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS", "PATCH", "DELETE"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
 app.include_router(api_router)
@@ -1,12 +1,16 @@
 import logging
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, Response
+from fastapi import APIRouter, HTTPException, status, Request, Response, Query
+from pydantic import TypeAdapter
 from shared.domain.dto import UpdateChatDTO
 from shared.domain.models import Chat
 from shared.domain.requests.chat import CreateChatRequest
 
 from dependencies.services.chat import get_chat_service
+from routes.utils import parse_cursor, page_headers
+from routes.utils.conditional import conditional_json
 from services.exceptions import ChatAlreadyExistsError, InvalidInviteLinkError
 
 router = APIRouter(
@@ -17,10 +21,23 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 
-@router.get('')
-async def get_chats() -> list[Chat]:
-    chat_service = get_chat_service()
-    return await chat_service.get_chats()
+CHATS = TypeAdapter(list[Chat])
+
+
+@router.get('', response_model=list[Chat])
+async def get_chats(
+        request: Request,
+        limit: int = Query(100, ge=1, le=500),
+        cursor: Optional[str] = None,
+) -> Response:
+    after = parse_cursor(cursor)
+
+    async def load():
+        chat_service = get_chat_service()
+        page = await chat_service.get_chats(limit=limit, after=after)
+        return page.items, page_headers(page)
+
+    return await conditional_json(request, ("chats",), CHATS, load)
 
 
 @router.get('/type/{chat_type_id}')
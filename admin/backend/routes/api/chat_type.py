@@ -1,11 +1,13 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from pydantic import TypeAdapter
 from shared.domain.dto.chat_type import CreateChatTypeDTO, UpdateChatTypeDTO
 from shared.domain.models.chat_type import ChatType
 
 from dependencies.services.chat_type import get_chat_type_service
+from routes.utils.conditional import conditional_json
 
 router = APIRouter(
     prefix="/chat_type",
@@ -15,10 +17,17 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 
-@router.get('')
-async def get_chats_types() -> list[ChatType]:
-    chat_type_service = get_chat_type_service()
-    return await chat_type_service.get_chats_types()
+CHAT_TYPES = TypeAdapter(list[ChatType])
+
+
+@router.get('', response_model=list[ChatType])
+async def get_chats_types(request: Request) -> Response:
+    async def load():
+        chat_type_service = get_chat_type_service()
+        return await chat_type_service.get_chats_types(), {}
+
+    # chat types are listed together with their chats
+    return await conditional_json(request, ("chat_type", "chats"), CHAT_TYPES, load)
 
 
 @router.post("")
@@ -1,16 +1,33 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, Query
+from pydantic import TypeAdapter
 from shared.dependencies.services.emoji import get_emoji_service
 from shared.domain.models.emoji import Emoji
 
+from routes.utils import parse_cursor, page_headers
+from routes.utils.conditional import conditional_json
+
 router = APIRouter(
     prefix="/emoji",
     tags=["emoji"]
 )
 
 
-@router.get("")
-async def list_emojis() -> List[Emoji]:
-    emoji_service = get_emoji_service()
-    return await emoji_service.get_all_emojis()
+EMOJIS = TypeAdapter(List[Emoji])
+
+
+@router.get("", response_model=List[Emoji])
+async def list_emojis(
+        request: Request,
+        limit: int = Query(100, ge=1, le=500),
+        cursor: Optional[str] = None,
+) -> Response:
+    after = parse_cursor(cursor)
+
+    async def load():
+        emoji_service = get_emoji_service()
+        page = await emoji_service.get_all_emojis(limit=limit, after=after)
+        return page.items, page_headers(page)
+
+    return await conditional_json(request, ("emojis",), EMOJIS, load)
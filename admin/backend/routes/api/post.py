@@ -3,16 +3,19 @@ import logging
 from typing import Optional, Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Form, UploadFile, File, Depends, HTTPException, Request, Response
+from fastapi import APIRouter, Form, UploadFile, File, Depends, HTTPException, Request, Response, Query
+from pydantic import TypeAdapter
 from shared.abstractions.services import UploadServiceInterface
 from shared.domain.dto import UpdatePostDTO, CreatePostDTO
 from shared.domain.dto.post_to_publish import MessageEntityDTO
 from shared.domain.models import Post
+from shared.services.upload.exceptions import FileTooLargeException
 
 from dependencies.services.post import get_post_service
 from dependencies.services.upload import get_upload_service
 from forms.update_post_form import UpdatePostForm
-from routes.utils import get_user_id_from_request
+from routes.utils import get_user_id_from_request, parse_cursor, set_next_cursor
+from routes.utils.conditional import conditional_json
 
 router = APIRouter(
     prefix="/post",
@@ -41,19 +44,20 @@ async def create_post(
     if image is not None:
         try:
             extension = upload_service.get_extension(image.filename)
-            image_filename = await upload_service.upload(image.file.read(), extension)
+            image_filename = (await upload_service.upload_stream(image, extension)).filename
+        except FileTooLargeException as e:
+            raise HTTPException(
+                status_code=413,
+                detail="Файл слишком большой"
+            ) from e
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail="Не удалось сохранить файл"
             ) from e
     elif image_path:
-        # clone existing stored filename (no upload). Accept raw filename or full URL.
-        try:
-            # avoid importing os.path just for basename; simple split works
-            image_filename = image_path.split('/')[-1]
-        except Exception:
-            image_filename = image_path
+        # clone existing stored filename (no upload). Accept raw filename, full URL or a preview URL.
+        image_filename = upload_service.get_filename(image_path)
 
     dsrslzd_entities = json.loads(entities)
     entities = [MessageEntityDTO.model_validate(e) for e in dsrslzd_entities]
@@ -70,15 +74,27 @@ async def create_post(
 
 
 @router.get('/all')
-async def get_post():
+async def get_post(
+        response: Response,
+        limit: int = Query(100, ge=1, le=500),
+        cursor: Optional[str] = None,
+) -> list[Post]:
     post_service = get_post_service()
-    return await post_service.get_all_posts()
+    page = await post_service.get_all_posts(limit=limit, after=parse_cursor(cursor))
+    set_next_cursor(response, page)
+    return page.items
 
 
-@router.get('/templates')
-async def get_templates():
-    post_service = get_post_service()
-    return await post_service.get_templates()
+TEMPLATES = TypeAdapter(list[Post])
+
+
+@router.get('/templates', response_model=list[Post])
+async def get_templates(request: Request) -> Response:
+    async def load():
+        post_service = get_post_service()
+        return await post_service.get_templates(), {}
+
+    return await conditional_json(request, ("posts",), TEMPLATES, load)
 
 
 @router.get('')
@@ -101,8 +117,14 @@ async def update_post(
 
     if data.image:
         extension = upload_service.get_extension(data.image.filename)
-        image_path = await upload_service.upload(data.image.file.read(), extension)
-        data_dump["image_path"] = image_path
+        try:
+            uploaded = await upload_service.upload_stream(data.image, extension)
+        except FileTooLargeException as e:
+            raise HTTPException(
+                status_code=413,
+                detail="Файл слишком большой"
+            ) from e
+        data_dump["image_path"] = uploaded.filename
 
     if data.entities:
         entities = [MessageEntityDTO.model_validate(e) for e in json.loads(data.entities)]
@@ -1,7 +1,8 @@
 import logging
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response, Query
 from shared.domain.dto.post_to_publish import CreatePostToPublishDTO, UpdatePostToPublishDTO
 
 from dependencies.services.post import get_post_service
@@ -9,7 +10,7 @@ from dependencies.services.post_to_publish import get_post_to_publish_service
 
 from shared.domain.models import PostToPublish
 
-from routes.utils import get_user_id_from_request
+from routes.utils import get_user_id_from_request, parse_cursor, set_next_cursor
 from shared.dependencies.repositories.post import get_post_repository
 from shared.domain.dto import CreatePostDTO
 
@@ -64,10 +65,17 @@ async def create_post_to_publish(request: Request, post_to_publish: CreatePostTo
 
 
 @router.get('/all')
-async def get_posts_to_publish(request: Request) -> list[PostToPublish]:
+async def get_posts_to_publish(
+        request: Request,
+        response: Response,
+        limit: int = Query(100, ge=1, le=500),
+        cursor: Optional[str] = None,
+) -> list[PostToPublish]:
     user_id = get_user_id_from_request(request)
     post_to_publish_service = get_post_to_publish_service()
-    return await post_to_publish_service.get_posts_to_publish(user_id)
+    page = await post_to_publish_service.get_posts_to_publish(user_id, limit=limit, after=parse_cursor(cursor))
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.get('')
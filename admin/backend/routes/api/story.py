@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Form, UploadFile, File, Depends, HTTPException
 from shared.abstractions.services import UploadServiceInterface
 from shared.domain.dto.story import CreateStoryDTO, UpdateStoryDTO
+from shared.services.upload.exceptions import FileTooLargeException
 
 from dependencies.services.story import get_story_service
 from dependencies.services.upload import get_upload_service
@@ -29,7 +30,12 @@ async def create_story(
     if image is not None:
         try:
             extension = upload_service.get_extension(image.filename)
-            image_path = await upload_service.upload(image.file.read(), extension)
+            image_path = (await upload_service.upload_stream(image, extension)).filename
+        except FileTooLargeException as e:
+            raise HTTPException(
+                status_code=413,
+                detail="Файл слишком большой"
+            ) from e
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -15,13 +15,18 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 
-@router.get('/{filename}')
+# content-addressed files live in sharded subdirectories
+@router.get('/{filename:path}')
 async def get_file(
         filename: str,
 ) -> FileResponse:
     upload_service = get_upload_service()
 
-    file_path = upload_service.get_file_path(filename)
+    try:
+        file_path = upload_service.get_file_path(filename)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="File not found")
+
     if not os.path.isfile(file_path):
         raise HTTPException(status_code=404, detail="File not found")
 
@@ -1,14 +1,15 @@
 import logging
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Response, Query
 from shared.domain.dto import CreateUserDTO, UpdateUserDTO
 from shared.domain.models import User
 from shared.infrastructure.main_db import NoFreeProxiesException
 
 from dependencies.services.user import get_user_service
 from routes.requests.user import VerifyAuthCodeRequest
-from routes.utils import get_user_id_from_request
+from routes.utils import get_user_id_from_request, parse_cursor, set_next_cursor
 from services.exceptions import UserHasNoProxyException
 
 router = APIRouter(
@@ -26,9 +27,15 @@ async def create_user(user: CreateUserDTO) -> UUID:
 
 
 @router.get('/all')
-async def get_users():
+async def get_users(
+        response: Response,
+        limit: int = Query(100, ge=1, le=500),
+        cursor: Optional[str] = None,
+) -> list[User]:
     user_service = get_user_service()
-    return await user_service.get_all_users()
+    page = await user_service.get_all_users(limit=limit, after=parse_cursor(cursor))
+    set_next_cursor(response, page)
+    return page.items
 
 @router.get('/managers')
 async def get_managers():
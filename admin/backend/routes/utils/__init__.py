@@ -1,8 +1,35 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Request
+from fastapi import Request, Response, HTTPException, status
+from shared.abstractions.repositories import Cursor, Page
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
 
 
 def get_user_id_from_request(request: Request) -> Optional[UUID]:
     return request.scope.get('x_user_id', None)
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    if cursor is None:
+        return None
+
+    try:
+        return Cursor.decode(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def set_next_cursor(response: Response, page: Page) -> None:
+    """Listings stay plain JSON arrays; the position of the next page travels in a header."""
+    response.headers.update(page_headers(page))
+
+
+def page_headers(page: Page) -> dict[str, str]:
+    if page.next_cursor is None:
+        return {}
+    return {NEXT_CURSOR_HEADER: page.next_cursor.encode()}
@@ -0,0 +1,74 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from shared.dependencies.repositories import get_table_version_repository
+
+from abstractions.services.response_cache import CachedResponse
+from dependencies.services.response_cache import get_response_cache
+
+
+async def conditional_json(
+        request: Request,
+        tables: tuple[str, ...],
+        adapter: TypeAdapter,
+        load: Callable[[], Awaitable[tuple[Any, dict[str, str]]]],
+) -> Response:
+    """
+    Serves a JSON listing that only changes with `tables`.
+    Revalidations get 304 after a single version query, other requests the cached body
+    unless a write changed the tables since it was rendered.
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    version = await get_table_version_repository().get_version(tables)
+    etag = '"' + hashlib.sha256(f"{key}|{version.tag}".encode()).hexdigest()[:32] + '"'
+
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is None or cached.etag != etag:
+        # rendered after the version was read, so a concurrent write can only make the body newer than its tag
+        content, headers = await load()
+        cached = CachedResponse(
+            etag=etag,
+            last_modified=version.last_modified,
+            body=adapter.dump_json(content, by_alias=True),
+            headers=headers,
+        )
+        cache.put(key, cached)
+
+    headers = {
+        **cached.headers,
+        "ETag": cached.etag,
+        # the browser keeps the body but has to revalidate it every time
+        "Cache-Control": "private, no-cache",
+    }
+    if cached.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(cached.last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+    if _is_not_modified(request, cached):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _is_not_modified(request: Request, cached: CachedResponse) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        # If-Modified-Since is ignored whenever If-None-Match is present (RFC 9110)
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or cached.etag in tags
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since is None or cached.last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    last_modified = cached.last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+    return since.tzinfo is not None and last_modified <= since
@@ -0,0 +1,41 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from abstractions.services.auth.cache import UserAuthCacheInterface, AuthUser
+
+
+@dataclass
+class TTLUserAuthCache(UserAuthCacheInterface):
+    """
+    Bounded LRU of authorized users. Entries expire after `ttl` seconds,
+    which bounds staleness for changes made outside of this process.
+    """
+    maxsize: int = 10000
+    ttl: float = 60
+
+    _entries: OrderedDict[UUID, tuple[float, AuthUser]] = field(default_factory=OrderedDict, init=False)
+
+    def get(self, user_id: UUID) -> Optional[AuthUser]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return user
+
+    def put(self, user: AuthUser) -> None:
+        self._entries[user.id] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
@@ -12,6 +12,7 @@ from shared.domain.dto import CreateUserDTO
 from shared.domain.enums import UserRole
 from shared.infrastructure.sqlalchemy import NotFoundException
 
+from abstractions.services.auth.cache import UserAuthCacheInterface, AuthUser
 from abstractions.services.auth.service import AuthServiceInterface
 from abstractions.services.auth.tokens import TokenServiceInterface
 from abstractions.services.user import UserServiceInterface
@@ -27,6 +28,7 @@ class AuthService(AuthServiceInterface):
     bot_token: str
     token_service: TokenServiceInterface
     user_service: UserServiceInterface
+    user_cache: UserAuthCacheInterface
 
     async def get_user_id_from_jwt(self, token: str) -> UUID:
         try:
@@ -35,12 +37,22 @@ class AuthService(AuthServiceInterface):
             if not user_id:
                 raise InvalidTokenException()
 
-            user = await self.user_service.get_user(UUID(user_id))  # todo: pk type
+            user = await self._get_auth_user(UUID(user_id))  # todo: pk type
+            if user.is_banned:
+                raise BannedUserException()
 
             return user.id
         except (InvalidTokenException, NotFoundException):
             raise
 
+    async def _get_auth_user(self, user_id: UUID) -> AuthUser:
+        # runs on every API request, so a hit must not touch the database
+        user = self.user_cache.get(user_id)
+        if user is None:
+            user = await self.user_service.get_auth_user(user_id)
+            self.user_cache.put(user)
+        return user
+
     async def create_token(self, init_data: str) -> AuthTokens:
         """Verifies Telegram Mini App auth data properly."""
         # Parse initData properly (decode URL params)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
-from shared.abstractions.repositories import ChatRepositoryInterface
+from shared.abstractions.repositories import ChatRepositoryInterface, Cursor, Page
 from shared.domain.dto import CreateChatDTO, UpdateChatDTO
 from shared.domain.models import Chat
 
@@ -20,8 +20,8 @@ class ChatService(ChatServiceInterface):
     chats_repository: ChatRepositoryInterface
     telegram_service: TelegramServiceInterface
 
-    async def get_chats(self) -> list[Chat]:
-        return await self.chats_repository.get_all()
+    async def get_chats(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[Chat]:
+        return await self.chats_repository.get_page(limit=limit, after=after)
 
     async def update_chat(self, chat_id: UUID, chat: UpdateChatDTO) -> Chat:
         return await self.chats_repository.update(chat_id, chat)
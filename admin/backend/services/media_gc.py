@@ -0,0 +1,44 @@
+import logging
+from asyncio import sleep
+from dataclasses import dataclass
+from typing import NoReturn
+
+from shared.abstractions.repositories import MediaReferenceRepositoryInterface
+from shared.abstractions.services import UploadServiceInterface
+
+from abstractions.services.media_gc import MediaGarbageCollectorInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MediaGarbageCollector(MediaGarbageCollectorInterface):
+    """
+    Mark and sweep over the upload directory: references are read from the rows themselves,
+    so there is no counter to drift when a row is deleted outside of the admin.
+    """
+    media_reference_repository: MediaReferenceRepositoryInterface
+    upload_service: UploadServiceInterface
+
+    interval: float
+    grace: float
+
+    async def collect(self) -> int:
+        references = {
+            self.upload_service.get_filename(reference)
+            for reference in await self.media_reference_repository.get_references()
+        }
+        removed = await self.upload_service.collect_garbage(references, self.grace)
+
+        logger.info(f"Removed {removed} unreferenced media files, {len(references)} are in use")
+        return removed
+
+    async def start(self) -> NoReturn:
+        logger.info("Starting media garbage collector")
+        while True:
+            try:
+                await self.collect()
+            except Exception:
+                logger.error("Failed to collect unreferenced media", exc_info=True)
+
+            await sleep(self.interval)
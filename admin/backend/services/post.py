@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from shared.abstractions.repositories import PostRepositoryInterface
+from shared.abstractions.repositories import PostRepositoryInterface, Cursor, Page
 from shared.domain.dto import CreatePostDTO, UpdatePostDTO
 from shared.domain.dto.update_post import CreateUpdatePostDTO, UpdateUpdatePostDTO
 from shared.domain.models import Post
@@ -19,11 +19,19 @@ class PostService(PostServiceInterface):
     upload_service: UploadServiceInterface
     update_post_service: UpdatePostServiceInterface
 
-    async def get_all_posts(self) -> List[Post]:
-        return await self.post_repository.get_all()
+    preview_size: int
+
+    async def get_all_posts(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[Post]:
+        return await self.post_repository.get_page(limit=limit, after=after)
 
     async def get_templates(self) -> List[Post]:
-        return await self.post_repository.get_templates()
+        templates = await self.post_repository.get_templates()
+        for template in templates:
+            # list views only need a thumbnail
+            if template.image_path:
+                template.image_path = self.upload_service.get_file_url(template.image_path, size=self.preview_size)
+
+        return templates
 
     async def create_post(self, post: CreatePostDTO, author_id: UUID) -> UUID:
         update_post = CreateUpdatePostDTO(
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Optional
 from uuid import UUID
 
+from shared.abstractions.repositories import Cursor, Page
 from shared.abstractions.repositories.post_to_publish import PostToPublishRepositoryInterface
 from shared.domain.dto.post_to_publish import CreatePostToPublishDTO, UpdatePostToPublishDTO
 from shared.domain.enums import UserRole
@@ -19,12 +20,17 @@ class PostToPublishService(PostToPublishServiceInterface):
     user_service: UserServiceInterface
     upload_service: UploadServiceInterface
 
-    async def get_posts_to_publish(self, user_id: UUID) -> List[PostToPublish]:
+    async def get_posts_to_publish(
+            self,
+            user_id: UUID,
+            limit: int = 100,
+            after: Optional[Cursor] = None,
+    ) -> Page[PostToPublish]:
         user = await self.user_service.get_user(user_id)
         if user.role == UserRole.MANAGER:
-            return await self.post_to_publish_repository.get_posts_by_manager(user_id)
+            return await self.post_to_publish_repository.get_manager_page(user_id, limit=limit, after=after)
 
-        return await self.post_to_publish_repository.get_all()
+        return await self.post_to_publish_repository.get_page(limit=limit, after=after)
 
     async def create_post_to_publish(self, post_to_publish: CreatePostToPublishDTO) -> UUID:
         return await self.post_to_publish_repository.create(post_to_publish)
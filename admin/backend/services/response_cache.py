@@ -0,0 +1,28 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from abstractions.services.response_cache import ResponseCacheInterface, CachedResponse
+
+
+@dataclass
+class LRUResponseCache(ResponseCacheInterface):
+    """
+    Serialized responses by request key. Entries are never stale by time:
+    callers compare the stored ETag with the current table version and replace mismatches.
+    """
+    maxsize: int = 256
+
+    _entries: OrderedDict[str, CachedResponse] = field(default_factory=OrderedDict, init=False)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
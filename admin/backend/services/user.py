@@ -3,25 +3,34 @@ from dataclasses import dataclass
 from typing import List, Optional
 from uuid import UUID
 
-from shared.abstractions.repositories import UserRepositoryInterface, ProxyRepositoryInterface
+from shared.abstractions.repositories import UserRepositoryInterface, ProxyRepositoryInterface, Cursor, Page, Projection
 from shared.domain.dto import CreateUserDTO, UpdateUserDTO
 from shared.domain.models import User
 from shared.infrastructure.main_db import NoFreeProxiesException
 
+from abstractions.services.auth.cache import UserAuthCacheInterface, AuthUser
 from abstractions.services.telegram import TelegramServiceInterface
 from abstractions.services.user import UserServiceInterface
 from services.exceptions import UserHasNoProxyException
 
 logger = logging.getLogger(__name__)
 
+# authorization skips the proxy and chats a full user read joins
+AUTH_USER_PROJECTION = Projection(
+    model=User,
+    columns=("id", "role", "is_banned"),
+)
+
+
 @dataclass
 class UserService(UserServiceInterface):
     user_repository: UserRepositoryInterface
     telegram_service: TelegramServiceInterface
     proxy_repository: ProxyRepositoryInterface
+    auth_cache: Optional[UserAuthCacheInterface] = None
 
-    async def get_all_users(self) -> List[User]:
-        return await self.user_repository.get_all()
+    async def get_all_users(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[User]:
+        return await self.user_repository.get_page(limit=limit, after=after)
 
     async def get_managers(self) -> List[User]:
         return await self.user_repository.get_managers()
@@ -32,14 +41,25 @@ class UserService(UserServiceInterface):
     async def get_user(self, user_id: UUID) -> User:
         return await self.user_repository.get(user_id)
 
+    async def get_auth_user(self, user_id: UUID) -> AuthUser:
+        user = await self.user_repository.get_projected(user_id, AUTH_USER_PROJECTION)
+        return AuthUser(id=user.id, role=user.role, is_banned=bool(user.is_banned))
+
     async def get_user_by_telegram_id(self, telegram_id: int) -> User:
         return await self.user_repository.get_by_telegram_id(telegram_id)
 
     async def update_user(self, user_id: UUID, user: UpdateUserDTO) -> User:
-        return await self.user_repository.update(user_id, user)
+        updated = await self.user_repository.update(user_id, user)
+        self._invalidate_auth(user_id)
+        return updated
 
     async def delete_user(self, user_id: UUID) -> None:
-        return await self.user_repository.delete(user_id)
+        await self.user_repository.delete(user_id)
+        self._invalidate_auth(user_id)
+
+    def _invalidate_auth(self, user_id: UUID) -> None:
+        if self.auth_cache is not None:
+            self.auth_cache.invalidate(user_id)
 
     async def ensure_user(self, dto: CreateUserDTO) -> User:
         logger.info(f"Ensuring user {dto.telegram_id}")
@@ -5,7 +5,11 @@ from pydantic_settings import SettingsConfigDict
 
 from shared.settings import AbstractSettings, JwtSettings, EnvironmentSettings, BotSettings
 from shared.infrastructure.main_db import MainDBSettings
+from shared.services.upload.settings import UploadSettings
 
+from .auth_cache import AuthCacheSettings
+from .media_gc import MediaGCSettings
+from .previews import PreviewSettings
 from .service_account import ServiceAccountSettings
 
 
@@ -15,6 +19,10 @@ class Settings(AbstractSettings):
     environment: EnvironmentSettings
     bot: BotSettings = Field(default_factory=BotSettings)
     service_account: ServiceAccountSettings
+    auth_cache: AuthCacheSettings = Field(default_factory=AuthCacheSettings)
+    media_gc: MediaGCSettings = Field(default_factory=MediaGCSettings)
+    previews: PreviewSettings = Field(default_factory=PreviewSettings)
+    upload: UploadSettings = Field(default_factory=UploadSettings)
 
     model_config = SettingsConfigDict(
         extra="ignore",
@@ -0,0 +1,9 @@
+from pydantic import Field
+from shared.settings import AbstractSettings
+
+
+class AuthCacheSettings(AbstractSettings):
+    # users whose auth status is kept in memory
+    maxsize: int = Field(default=10000)
+    # seconds before a cached user is re-read, bounds staleness of changes made elsewhere
+    ttl: float = Field(default=60)
@@ -0,0 +1,9 @@
+from pydantic import Field
+from shared.settings import AbstractSettings
+
+
+class MediaGCSettings(AbstractSettings):
+    # seconds between sweeps of the upload directory
+    interval: float = Field(default=6 * 60 * 60)
+    # files younger than this are kept, their rows may not be committed yet
+    grace: float = Field(default=24 * 60 * 60)
@@ -0,0 +1,9 @@
+from pydantic import Field
+from shared.settings import AbstractSettings
+
+
+class PreviewSettings(AbstractSettings):
+    # processes rendering thumbnails and video poster frames
+    workers: int = Field(default=2)
+    # longest side of the images in admin list views
+    list_size: int = Field(default=256)
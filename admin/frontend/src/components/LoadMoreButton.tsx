@@ -0,0 +1,29 @@
+interface LoadMoreButtonProps {
+    // курсор следующей страницы из X-Next-Cursor; без него кнопка не показывается
+    cursor?: string;
+    isLoading?: boolean;
+    onLoadMore: (cursor: string) => void;
+}
+
+const LoadMoreButton: React.FC<LoadMoreButtonProps> = ({
+                                                           cursor,
+                                                           isLoading,
+                                                           onLoadMore
+                                                       }) => {
+    if (!cursor) return null;
+
+    return (
+        <div className="flex justify-center mt-4">
+            <button
+                type="button"
+                onClick={() => onLoadMore(cursor)}
+                disabled={isLoading}
+                className="px-6 py-2 border-2 border-brand text-brand bg-white rounded-lg hover:bg-brandlight transition disabled:opacity-50"
+            >
+                {isLoading ? "Загрузка..." : "Загрузить ещё"}
+            </button>
+        </div>
+    );
+};
+
+export default LoadMoreButton;
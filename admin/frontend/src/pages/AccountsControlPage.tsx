@@ -4,6 +4,7 @@ import {useNavigate} from 'react-router-dom';
 import {getAuthCode, getUsers, sendAuthCode, updateUser, type User as APIUser,} from '../services/api';
 import {AxiosError} from 'axios';
 import type {UserRole} from "../types/UserRole";
+import LoadMoreButton from "../components/LoadMoreButton";
 
 const roles: UserRole[] = ['admin', 'manager', 'publications_manager'];
 
@@ -25,14 +26,21 @@ export default function AccountsControlPage() {
     const [error, setError] = useState('');
     const [proxyError, setProxyError] = useState(false);
     const [roleUpdatingId, setRoleUpdatingId] = useState<string | null>(null);
+    const [nextCursor, setNextCursor] = useState<string | undefined>();
+    const [isPageLoading, setIsPageLoading] = useState(false);
     const navigate = useNavigate();
 
-    const fetchAccounts = async () => {
+    // без курсора — первая страница заново, с курсором — дописываем следующую
+    const fetchAccounts = async (cursor?: string) => {
+        setIsPageLoading(true);
         try {
-            const users = await getUsers(); // APIUser[]
-            setAccounts(users);
+            const page = await getUsers(cursor);
+            setAccounts(prev => (cursor ? [...prev, ...page.items] : page.items));
+            setNextCursor(page.nextCursor);
         } catch (e) {
             console.error('Не удалось получить пользователей', e);
+        } finally {
+            setIsPageLoading(false);
         }
     };
 
@@ -210,6 +218,8 @@ export default function AccountsControlPage() {
                 ))}
             </div>
 
+            <LoadMoreButton cursor={nextCursor} isLoading={isPageLoading} onLoadMore={fetchAccounts}/>
+
             {/* Модалка подключения нового аккаунта */}
             {isModalOpen && (
                 <div className="fixed inset-0 bg-black/30 flex items-center justify-center z-50">
@@ -17,6 +17,7 @@ import {
 import {useAuth} from "../contexts/auth";
 import {on} from "@telegram-apps/sdk";
 import {EmojiPicker} from "../components/EmojiPicker";
+import LoadMoreButton from "../components/LoadMoreButton";
 import {normalizeLineBreaksToDivBr} from "../utils/normalizeHtml";
 
 interface PostDetailsPageProps {
@@ -44,6 +45,7 @@ export default function PostDetailsPage({emojis}: PostDetailsPageProps) {
 
     // чаты
     const [chats, setChats] = useState<{ id: string; name: string; chat_type_id?: string | null }[]>([]);
+    const [chatsCursor, setChatsCursor] = useState<string | undefined>();
     const [selectedChats, setSelectedChats] = useState<string[]>([]);
     const [chatSearch, setChatSearch] = useState<string>("");
     const [chatTypes, setChatTypes] = useState<{ id: string; name: string }[]>([]);
@@ -84,9 +86,17 @@ const preview = (s?: string, n = 220) =>
     //     if (openCreate) setActiveTab("create");
     // }, [openCreate]);
 
-    // загрузить все чаты из API
+    // чаты грузятся страницами: первая сразу, следующие по кнопке
+    const fetchChats = (cursor?: string) =>
+        getChats(cursor)
+            .then((page) => {
+                setChats((prev) => (cursor ? [...prev, ...page.items] : page.items));
+                setChatsCursor(page.nextCursor);
+            })
+            .catch(() => alert("Не удалось загрузить чаты"));
+
     useEffect(() => {
-        getChats().then(setChats).catch(() => alert("Не удалось загрузить чаты"));
+        fetchChats();
         getChatTypes().then(setChatTypes).catch(() => {});
     }, []);
 
@@ -479,6 +489,7 @@ const handleSave = async () => {
                             </div>
                         </div>
                     ))}
+                    <LoadMoreButton cursor={chatsCursor} onLoadMore={fetchChats}/>
                 </div>
             </div>
 
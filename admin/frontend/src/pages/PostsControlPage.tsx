@@ -13,6 +13,7 @@ import {
     getChatTypes,
     getManagers,
     getPostsToPublish,
+    type PostToPublish,
     updatePost,
 } from "../services/api";
 import {useAuth} from "../contexts/auth";
@@ -21,6 +22,7 @@ import type {RichEditorHandle} from "../components/RichEditor";
 import {RichEditor} from "../components/RichEditor";
 import type {UserRole} from "../types/UserRole";
 import {EmojiPicker} from "../components/EmojiPicker";
+import LoadMoreButton from "../components/LoadMoreButton";
 
 /* ───────── Типы ───────── */
 type EventItem = {
@@ -104,6 +106,7 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
 
     /* ───────── Chats ───────── */
     const [chats, setChats] = useState<ChatItem[]>([]);
+    const [chatsCursor, setChatsCursor] = useState<string | undefined>();
     const [selectedChats, setSelectedChats] = useState<string[]>([]);
     const [chatSearch, setChatSearch] = useState("");
 
@@ -115,6 +118,10 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
     const [chatTypes, setChatTypes] = useState<ChatTypeItem[]>([]);
 
     /* ───────── Schedule list ───────── */
+    // публикации грузятся страницами, расписание строится по уже загруженным
+    const [publications, setPublications] = useState<PostToPublish[]>([]);
+    const [publicationsCursor, setPublicationsCursor] = useState<string | undefined>();
+    const [isMoreLoading, setIsMoreLoading] = useState(false);
     const [schedule, setSchedule] = useState<Record<string, EventItem[]>>({});
     const [openDays, setOpenDays] = useState<Record<string, boolean>>({});
     const [scheduledAt, setScheduledAt] = useState<Date | null>(null);
@@ -237,182 +244,187 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
         );
     };
 
-    /* ───────── Schedule fetch ───────── */
-    const fetchSchedule = useCallback(async () => {
+    /* ───────── Publications fetch ───────── */
+    // без курсора — первая страница заново, с курсором — дописываем следующую
+    const loadPublications = useCallback(async (cursor?: string) => {
+        const setLoading = cursor ? setIsMoreLoading : setIsLoading;
         try {
-            setIsLoading(true);
-            const raw = await getPostsToPublish();
-
-            // 1) общий фильтр по менеджеру/чат-типу/чату
-            const pre = raw
-                .filter(p => {
-                    if (managerFilter && p.responsible_manager_id !== managerFilter) return false;
-                    if (chatTypeFilter && !p.chats.some(c => c.chat_type_id === chatTypeFilter)) return false;
-                    if (chatFilter && !p.chats.some(c => c.id === chatFilter)) return false;
-                    return true;
-                });
+            setLoading(true);
+            const page = await getPostsToPublish(cursor);
+            setPublications(prev => (cursor ? [...prev, ...page.items] : page.items));
+            setPublicationsCursor(page.nextCursor);
+        } catch (err) {
+            console.error(err);
+            alert("Не удалось загрузить публикации");
+        } finally {
+            setLoading(false);
+        }
+    }, []);
 
-            // 2) собираем заголовки из уже вложенного p.post (избегаем N+1)
-            const titles = new Map<string, string>();
-            for (const p of pre) {
-                if (!titles.has(p.post_id) && p.post?.name) {
-                    titles.set(p.post_id, p.post.name);
-                }
+    // дни, которые уже были на экране, не схлопываются при подгрузке следующей страницы
+    const showDays = useCallback((map: Record<string, EventItem[]>) => {
+        setSchedule(map);
+        const todayIso = new Date().toLocaleDateString("sv-SE");
+        setOpenDays(prev => Object.fromEntries(Object.keys(map).map(d => [d, prev[d] ?? d === todayIso])));
+    }, []);
+
+    /* ───────── Schedule ───────── */
+    const buildSchedule = useCallback((raw: PostToPublish[]) => {
+        // 1) общий фильтр по менеджеру/чат-типу/чату
+        const pre = raw
+            .filter(p => {
+                if (managerFilter && p.responsible_manager_id !== managerFilter) return false;
+                if (chatTypeFilter && !p.chats.some(c => c.chat_type_id === chatTypeFilter)) return false;
+                if (chatFilter && !p.chats.some(c => c.id === chatFilter)) return false;
+                return true;
+            });
+
+        // 2) собираем заголовки из уже вложенного p.post (избегаем N+1)
+        const titles = new Map<string, string>();
+        for (const p of pre) {
+            if (!titles.has(p.post_id) && p.post?.name) {
+                titles.set(p.post_id, p.post.name);
             }
+        }
 
-            const map: Record<string, EventItem[]> = {};
+        const map: Record<string, EventItem[]> = {};
 
-            for (const p of pre) {
-                const base: EventItem = {
-                    id: p.id,
-                    postId: p.post_id,
-                    title: titles.get(p.post_id)!,
-                    time: p.scheduled_time.slice(0, 5),
-                    scheduledType: p.scheduled_type
-                };
-                const now = new Date();
+        for (const p of pre) {
+            const base: EventItem = {
+                id: p.id,
+                postId: p.post_id,
+                title: titles.get(p.post_id)!,
+                time: p.scheduled_time.slice(0, 5),
+                scheduledType: p.scheduled_type
+            };
+            const now = new Date();
 
 
-                if (p.scheduled_type === "single") {
-                    if (!p.scheduled_date) continue;
-                    const dt = new Date(`${p.scheduled_date}T${p.scheduled_time}`);
-                    if (dt < now) continue;            // <-- отрезаем прошлые
-                    const isoLocal = dt.toLocaleDateString("sv-SE");
+            if (p.scheduled_type === "single") {
+                if (!p.scheduled_date) continue;
+                const dt = new Date(`${p.scheduled_date}T${p.scheduled_time}`);
+                if (dt < now) continue;            // <-- отрезаем прошлые
+                const isoLocal = dt.toLocaleDateString("sv-SE");
+                map[isoLocal] = (map[isoLocal] || []).concat(base);
+            } else {
+                for (let i = 0; i < 7; i++) {
+                    const baseDay = new Date();
+                    baseDay.setHours(0, 0, 0, 0);
+                    baseDay.setDate(baseDay.getDate() + i);
+                    const isoLocal = baseDay.toLocaleDateString("sv-SE");
+                    const dt = new Date(`${isoLocal}T${p.scheduled_time}`);
+                    if (dt < now) continue;          // <-- отрезаем прошлые
                     map[isoLocal] = (map[isoLocal] || []).concat(base);
-                } else {
-                    for (let i = 0; i < 7; i++) {
-                        const baseDay = new Date();
-                        baseDay.setHours(0, 0, 0, 0);
-                        baseDay.setDate(baseDay.getDate() + i);
-                        const isoLocal = baseDay.toLocaleDateString("sv-SE");
-                        const dt = new Date(`${isoLocal}T${p.scheduled_time}`);
-                        if (dt < now) continue;          // <-- отрезаем прошлые
-                        map[isoLocal] = (map[isoLocal] || []).concat(base);
-                    }
                 }
-
             }
 
-            // 5) сортировка по времени
-            Object.values(map).forEach(arr =>
-                arr.sort((a, b) => a.time.localeCompare(b.time))
-            );
-
-            setSchedule(map);
-            const todayIsoSent = new Date().toLocaleDateString("sv-SE");
-            setOpenDays(Object.fromEntries(Object.keys(map).map(d => [d, d === todayIsoSent])));
-        } catch (err) {
-            console.error(err);
-            alert("Не удалось загрузить запланированные посты");
-        } finally {
-            setIsLoading(false);
         }
-    }, [managerFilter, chatTypeFilter, chatFilter]);
 
-    const fetchSent = useCallback(async () => {
-        try {
-            setIsLoading(true);
-            const raw = await getPostsToPublish();
+        // 5) сортировка по времени
+        Object.values(map).forEach(arr =>
+            arr.sort((a, b) => a.time.localeCompare(b.time))
+        );
 
-            // 1) общий фильтр по менеджеру/чат-типу/чату
-            const pre = raw.filter(p => {
-                if (managerFilter && p.responsible_manager_id !== managerFilter) return false;
-                if (chatTypeFilter && !p.chats.some(c => c.chat_type_id === chatTypeFilter)) return false;
-                if (chatFilter && !p.chats.some(c => c.id === chatFilter)) return false;
-                return true;
-            });
+        showDays(map);
+    }, [managerFilter, chatTypeFilter, chatFilter, showDays]);
 
-            // 2) собираем заголовки из вложенного p.post (без дополнительных запросов)
-            const titles = new Map<string, string>();
-            for (const p of pre) {
-                if (!titles.has(p.post_id) && p.post?.name) {
-                    titles.set(p.post_id, p.post.name);
-                }
+    const buildSent = useCallback((raw: PostToPublish[]) => {
+        // 1) общий фильтр по менеджеру/чат-типу/чату
+        const pre = raw.filter(p => {
+            if (managerFilter && p.responsible_manager_id !== managerFilter) return false;
+            if (chatTypeFilter && !p.chats.some(c => c.chat_type_id === chatTypeFilter)) return false;
+            if (chatFilter && !p.chats.some(c => c.id === chatFilter)) return false;
+            return true;
+        });
+
+        // 2) собираем заголовки из вложенного p.post (без дополнительных запросов)
+        const titles = new Map<string, string>();
+        for (const p of pre) {
+            if (!titles.has(p.post_id) && p.post?.name) {
+                titles.set(p.post_id, p.post.name);
             }
+        }
 
-            const map: Record<string, EventItem[]> = {};
-            const now = new Date();
+        const map: Record<string, EventItem[]> = {};
+        const now = new Date();
 
 
-            // 3) одиночные до текущего момента (прошедшие)
-            pre
-                .filter(p => p.scheduled_type === "single" && p.scheduled_date)
-                .forEach(p => {
-                    const dt = new Date(`${p.scheduled_date!}T${p.scheduled_time}`);
-                    if (dt >= now) return;           // <-- остаются только прошлые
-                    const iso = dt.toLocaleDateString("sv-SE");
+        // 3) одиночные до текущего момента (прошедшие)
+        pre
+            .filter(p => p.scheduled_type === "single" && p.scheduled_date)
+            .forEach(p => {
+                const dt = new Date(`${p.scheduled_date!}T${p.scheduled_time}`);
+                if (dt >= now) return;           // <-- остаются только прошлые
+                const iso = dt.toLocaleDateString("sv-SE");
+                map[iso] = (map[iso] || []).concat({
+                    id: p.id,
+                    postId: p.post_id,
+                    title: titles.get(p.post_id)!,
+                    time: p.scheduled_time.slice(0, 5),
+                    scheduledType: "single"
+                });
+            });
+
+        // 4) ежедневные: сегодняшний день и предыдущие 6 (всего 7), но не раньше created_at записи
+        pre
+            .filter(p => p.scheduled_type === "everyday")
+            .forEach(p => {
+                // дата создания записи — ограничиваем историю не старше неё
+                const created = new Date(p.created_at);
+                created.setHours(0, 0, 0, 0);
+                // включаем сегодняшний день (i = 0), если время уже прошло
+                for (let i = 0; i < 7; i++) {
+                    const baseDay = new Date();
+                    baseDay.setHours(0, 0, 0, 0);
+                    baseDay.setDate(baseDay.getDate() - i);
+                    if (baseDay < created) break;   // не показываем дни ранее создания записи
+                    const iso = baseDay.toLocaleDateString("sv-SE");
+                    const dt = new Date(`${iso}T${p.scheduled_time}`);
+                    if (dt >= now) continue;       // <-- оставляем только прошлые
                     map[iso] = (map[iso] || []).concat({
                         id: p.id,
                         postId: p.post_id,
                         title: titles.get(p.post_id)!,
                         time: p.scheduled_time.slice(0, 5),
-                        scheduledType: "single"
+                        scheduledType: "everyday"
                     });
-                });
+                }
+            });
 
-            // 4) ежедневные: сегодняшний день и предыдущие 6 (всего 7), но не раньше created_at записи
-            pre
-                .filter(p => p.scheduled_type === "everyday")
-                .forEach(p => {
-                    // дата создания записи — ограничиваем историю не старше неё
-                    const created = new Date(p.created_at);
-                    created.setHours(0, 0, 0, 0);
-                    // включаем сегодняшний день (i = 0), если время уже прошло
-                    for (let i = 0; i < 7; i++) {
-                        const baseDay = new Date();
-                        baseDay.setHours(0, 0, 0, 0);
-                        baseDay.setDate(baseDay.getDate() - i);
-                        if (baseDay < created) break;   // не показываем дни ранее создания записи
-                        const iso = baseDay.toLocaleDateString("sv-SE");
-                        const dt = new Date(`${iso}T${p.scheduled_time}`);
-                        if (dt >= now) continue;       // <-- оставляем только прошлые
-                        map[iso] = (map[iso] || []).concat({
-                            id: p.id,
-                            postId: p.post_id,
-                            title: titles.get(p.post_id)!,
-                            time: p.scheduled_time.slice(0, 5),
-                            scheduledType: "everyday"
-                        });
-                    }
-                });
+        // 5) удаляем любые будущие даты (для вкладки «Отправленные» должны быть только прошедшие)
+        const todayIsoFilter = new Date().toLocaleDateString("sv-SE");
+        Object.keys(map).forEach((iso) => {
+            if (iso > todayIsoFilter) delete map[iso];
+        });
 
-            // 5) удаляем любые будущие даты (для вкладки «Отправленные» должны быть только прошедшие)
-            const todayIsoFilter = new Date().toLocaleDateString("sv-SE");
-            Object.keys(map).forEach((iso) => {
-                if (iso > todayIsoFilter) delete map[iso];
-            });
+        // 6) сортировка
+        Object.values(map).forEach(arr =>
+            arr.sort((a, b) => a.time.localeCompare(b.time))
+        );
 
-            // 6) сортировка
-            Object.values(map).forEach(arr =>
-                arr.sort((a, b) => a.time.localeCompare(b.time))
-            );
+        showDays(map);
+    }, [managerFilter, chatTypeFilter, chatFilter, showDays]);
 
-            setSchedule(map);
-            const todayIsoOpen = new Date().toLocaleDateString("sv-SE");
-            setOpenDays(Object.fromEntries(Object.keys(map).map(d => [d, d === todayIsoOpen])));
-        } catch (err) {
-            console.error(err);
-            alert("Не удалось загрузить отправленные посты");
-        } finally {
-            setIsLoading(false);
-        }
-    }, [managerFilter, chatTypeFilter, chatFilter]);
 
+    useEffect(() => {
+        loadPublications();
+    }, [loadPublications]);
 
     useEffect(() => {
         if (viewMode === "scheduled") {
-            fetchSchedule();
+            buildSchedule(publications);
         } else {
-            fetchSent();
+            buildSent(publications);
         }
-    }, [viewMode, fetchSchedule, fetchSent]);
+    }, [viewMode, publications, buildSchedule, buildSent]);
 
 
     /* ───────── Chats fetch ───────── */
-    const fetchChats = useCallback(async () => {
+    const fetchChats = useCallback(async (cursor?: string) => {
         try {
-            const data = await getChats();
-            setChats(data);
+            const page = await getChats(cursor);
+            setChats(prev => (cursor ? [...prev, ...page.items] : page.items));
+            setChatsCursor(page.nextCursor);
         } catch (err) {
             console.error("Не удалось загрузить список чатов", err);
         }
@@ -536,7 +548,7 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
             };
 
             await createPostToPublish(dto);
-            await fetchSchedule();
+            await loadPublications();
 
             /* reset */
             setPhotoFile(null);
@@ -562,16 +574,12 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
 
 
     /* ───────── Delete Schedule Item ───────── */
-    const handleDelete = async (day: string, ev: EventItem) => {
+    const handleDelete = async (ev: EventItem) => {
         if (!window.confirm(`Удалить пост «${ev.title}» из расписания?`)) return;
         try {
             await deletePostToPublish(ev.id);
-            setSchedule((prev) => {
-                const next = {...prev};
-                next[day] = next[day].filter((i) => i.id !== ev.id);
-                if (next[day].length === 0) delete next[day];
-                return next;
-            });
+            // расписание перестроится из оставшихся публикаций
+            setPublications((prev) => prev.filter((p) => p.id !== ev.id));
         } catch {
             alert("Ошибка при удалении.");
         }
@@ -800,6 +808,7 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
                             {filteredChats.length === 0 && (
                                 <div className="text-gray-500 italic">Чаты не найдены</div>
                             )}
+                            <LoadMoreButton cursor={chatsCursor} onLoadMore={fetchChats}/>
                         </div>
 
                     </div>
@@ -1029,7 +1038,7 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
                                                         className="h-5 w-5 opacity-60 hover:opacity-100"
                                                         onClick={(e) => {
                                                             e.stopPropagation();
-                                                            handleDelete(iso, ev);
+                                                            handleDelete(ev);
                                                         }}
                                                     />
                                                 </li>
@@ -1039,6 +1048,14 @@ export default function PostsControlPage({emojis}: PostsControlPageProps) {
                                 </div>
                             );
                         })}
+
+                    {!isLoading && (
+                        <LoadMoreButton
+                            cursor={publicationsCursor}
+                            isLoading={isMoreLoading}
+                            onLoadMore={loadPublications}
+                        />
+                    )}
                 </div>
             )}
         </div>
@@ -1,4 +1,4 @@
-import {apiClient, getWithRetry} from "./apiClient";
+import {apiClient, getWithRetry, getPage, getAllPages, type Page} from "./apiClient";
 import type {MeResponse} from "../types/MeResponse";
 import type {UserRole} from "../types/UserRole";
 
@@ -291,8 +291,8 @@ export async function getMe(): Promise<MeResponse> {
     return (await apiClient.get<MeResponse>(`users/me`)).data;
 }
 
-export async function getUsers(): Promise<User[]> {
-    return (await apiClient.get(`users/all`)).data;
+export async function getUsers(cursor?: string): Promise<Page<User>> {
+    return await getPage<User>(`users/all`, cursor);
 }
 
 export async function updateUser(
@@ -314,25 +314,25 @@ export async function deleteUser(userId: string) {
     })).data;
 }
 
-export async function getPostsToPublish(): Promise<PostToPublish[]> {
+export async function getPostsToPublish(cursor?: string): Promise<Page<PostToPublish>> {
     // с ретраями для проблемной сети/телеги/интернета
-    return await getWithRetry<PostToPublish[]>("/post-to-publish/all");
+    return await getPage<PostToPublish>("/post-to-publish/all", cursor);
 }
 
 export async function getPost(postId: string): Promise<Post> {
     return await getWithRetry<Post>("post", {params: {post_id: postId}});
 }
 
-export async function getPosts(): Promise<Post[]> {
-    return await getWithRetry<Post[]>("post/all");
+export async function getPosts(cursor?: string): Promise<Page<Post>> {
+    return await getPage<Post>("post/all", cursor);
 }
 
 export async function getTemplates(): Promise<Post[]> {
     return await getWithRetry<Post[]>("post/templates");
 }
 
-export async function getChats(): Promise<ChatItem[]> {
-    return await getWithRetry<ChatItem[]>("chat");
+export async function getChats(cursor?: string): Promise<Page<ChatItem>> {
+    return await getPage<ChatItem>("chat", cursor);
 }
 
 export type CreateChatByLinkDTO = {
@@ -368,7 +368,7 @@ export async function sendAuthCode(phone: string, code: string, password?: strin
 }
 
 export async function listEmojis(): Promise<Emoji[]> {
-    const res = (await apiClient.get<Emoji[]>('emoji')).data
+    const res = await getAllPages<Emoji>('emoji')
     console.log("emojis!!", res);
     return res;
 }
@@ -1,5 +1,5 @@
 import axios, { AxiosError } from "axios";
-import type { AxiosInstance } from "axios";
+import type { AxiosInstance, AxiosResponse } from "axios";
 import createAuthRefreshInterceptor from "axios-auth-refresh";
 
 const BASE_URL = import.meta.env.VITE_API_BASE || "";
@@ -80,11 +80,11 @@ type RetryOptions = {
     retryOnStatus?: number[];
 };
 
-async function getWithRetry<T>(
+async function getResponseWithRetry<T>(
     url: string,
     config?: Parameters<AxiosInstance["get"]>[1],
     opts: RetryOptions = {}
-): Promise<T> {
+): Promise<AxiosResponse<T>> {
     const {
         retries = 3,
         baseDelayMs = 300,
@@ -97,8 +97,7 @@ async function getWithRetry<T>(
     // eslint-disable-next-line no-constant-condition
     while (true) {
         try {
-            const res = await apiClient.get<T>(url, config);
-            return res.data;
+            return await apiClient.get<T>(url, config);
         } catch (e) {
             attempt += 1;
             // если исчерпали попытки — пробрасываем ошибку
@@ -119,4 +118,52 @@ async function getWithRetry<T>(
     }
 }
 
-export { getWithRetry };
+async function getWithRetry<T>(
+    url: string,
+    config?: Parameters<AxiosInstance["get"]>[1],
+    opts: RetryOptions = {}
+): Promise<T> {
+    return (await getResponseWithRetry<T>(url, config, opts)).data;
+}
+
+// ─────────────────────────────────────────────────────────────────────────────
+// Списки отдаются страницами: курсор следующей страницы приходит в X-Next-Cursor
+// ─────────────────────────────────────────────────────────────────────────────
+
+type Page<T> = {
+    items: T[];
+    // нет курсора — это последняя страница
+    nextCursor?: string;
+};
+
+async function getPage<T>(
+    url: string,
+    cursor?: string,
+    config?: Parameters<AxiosInstance["get"]>[1],
+    opts: RetryOptions = {}
+): Promise<Page<T>> {
+    const res = await getResponseWithRetry<T[]>(url, {
+        ...config,
+        params: {...config?.params, cursor},
+    }, opts);
+    return {items: res.data, nextCursor: res.headers["x-next-cursor"] || undefined};
+}
+
+// Только для справочников, которые нужны целиком (эмодзи для редактора)
+async function getAllPages<T>(
+    url: string,
+    config?: Parameters<AxiosInstance["get"]>[1],
+    opts: RetryOptions = {}
+): Promise<T[]> {
+    const items: T[] = [];
+    let cursor: string | undefined;
+    do {
+        const page = await getPage<T>(url, cursor, config, opts);
+        items.push(...page.items);
+        cursor = page.nextCursor;
+    } while (cursor);
+    return items;
+}
+
+export { getWithRetry, getPage, getAllPages };
+export type { Page };
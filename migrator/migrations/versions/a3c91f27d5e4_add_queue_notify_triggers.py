@@ -0,0 +1,56 @@
+"""add queue notify triggers
+
+Revision ID: a3c91f27d5e4
+Revises: 86ebde41e948
+Create Date: 2025-09-18 14:02:11.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91f27d5e4'
+down_revision: Union[str, None] = '86ebde41e948'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> column sent as the NOTIFY payload (None for an empty payload)
+QUEUE_TABLES = {
+    'send_post_requests': None,
+    'worker_messages': 'user_id',
+    'posts_to_publish': None,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Channel name is the table name; identical payloads within one transaction are
+    # collapsed by Postgres, so multi-row inserts wake listeners only once.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION queue_notify() RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS > 0 THEN
+                PERFORM pg_notify(TG_TABLE_NAME, COALESCE(to_jsonb(NEW) ->> TG_ARGV[0], ''));
+            ELSE
+                PERFORM pg_notify(TG_TABLE_NAME, '');
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, payload_column in QUEUE_TABLES.items():
+        args = f"'{payload_column}'" if payload_column else ''
+        op.execute(f"""
+            CREATE TRIGGER {table}_queue_notify
+            AFTER INSERT ON {table}
+            FOR EACH ROW EXECUTE FUNCTION queue_notify({args})
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in QUEUE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_queue_notify ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS queue_notify()")
@@ -0,0 +1,111 @@
+"""count cancelled requests separately
+
+Revision ID: a9d3f1c5e7b2
+Revises: f2c8e4a1b7d3
+Create Date: 2025-09-29 12:41:27.093518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3f1c5e7b2'
+down_revision: Union[str, None] = 'f2c8e4a1b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same as e5b8a6d19c03, with CANCELLED counted on its own instead of as failed,
+# so the watcher can leave such publications untouched.
+APPLY_CHANGES = """
+    UPDATE posts_to_publish p SET
+        requests_planned = p.requests_planned + d.planned,
+        requests_sent = p.requests_sent + d.sent,
+        requests_failed = p.requests_failed + d.failed,
+        requests_stale = p.requests_stale + d.stale,
+        requests_cancelled = p.requests_cancelled + d.cancelled
+    FROM (
+        SELECT
+            publication_id,
+            COALESCE(sum(sign) FILTER (WHERE status IN ('PLANNED', 'IN_PROGRESS')), 0) AS planned,
+            COALESCE(sum(sign) FILTER (WHERE status = 'SENT'), 0) AS sent,
+            COALESCE(sum(sign) FILTER (WHERE status = 'FAILED'), 0) AS failed,
+            COALESCE(sum(sign) FILTER (WHERE status = 'STALE'), 0) AS stale,
+            COALESCE(sum(sign) FILTER (WHERE status = 'CANCELLED'), 0) AS cancelled
+        FROM ({changes}) changes
+        GROUP BY publication_id
+    ) d
+    WHERE p.id = d.publication_id
+      AND (d.planned <> 0 OR d.sent <> 0 OR d.failed <> 0 OR d.stale <> 0 OR d.cancelled <> 0);
+"""
+PREVIOUS_APPLY_CHANGES = """
+    UPDATE posts_to_publish p SET
+        requests_planned = p.requests_planned + d.planned,
+        requests_sent = p.requests_sent + d.sent,
+        requests_failed = p.requests_failed + d.failed,
+        requests_stale = p.requests_stale + d.stale
+    FROM (
+        SELECT
+            publication_id,
+            COALESCE(sum(sign) FILTER (WHERE status IN ('PLANNED', 'IN_PROGRESS')), 0) AS planned,
+            COALESCE(sum(sign) FILTER (WHERE status = 'SENT'), 0) AS sent,
+            COALESCE(sum(sign) FILTER (WHERE status IN ('FAILED', 'CANCELLED')), 0) AS failed,
+            COALESCE(sum(sign) FILTER (WHERE status = 'STALE'), 0) AS stale
+        FROM ({changes}) changes
+        GROUP BY publication_id
+    ) d
+    WHERE p.id = d.publication_id
+      AND (d.planned <> 0 OR d.sent <> 0 OR d.failed <> 0 OR d.stale <> 0);
+"""
+NEW_ROWS = "SELECT publication_id, status, 1 AS sign FROM new_rows WHERE deleted_at IS NULL"
+OLD_ROWS = "SELECT publication_id, status, -1 AS sign FROM old_rows WHERE deleted_at IS NULL"
+
+
+def _replace_function(apply_changes: str) -> None:
+    # the triggers call the function by name, replacing it is enough
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION send_post_requests_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {apply_changes.format(changes=NEW_ROWS)}
+            ELSIF TG_OP = 'UPDATE' THEN
+                {apply_changes.format(changes=f"{NEW_ROWS} UNION ALL {OLD_ROWS}")}
+            ELSE
+                {apply_changes.format(changes=OLD_ROWS)}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'posts_to_publish',
+        sa.Column('requests_cancelled', sa.Integer(), server_default='0', nullable=False),
+    )
+    _replace_function(APPLY_CHANGES)
+
+    # move cancelled requests out of the failed counter
+    op.execute("""
+        UPDATE posts_to_publish p SET
+            requests_failed = p.requests_failed - c.cancelled,
+            requests_cancelled = c.cancelled
+        FROM (
+            SELECT publication_id, count(*) AS cancelled
+            FROM send_post_requests
+            WHERE deleted_at IS NULL AND status = 'CANCELLED'
+            GROUP BY publication_id
+        ) c
+        WHERE p.id = c.publication_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_function(PREVIOUS_APPLY_CHANGES)
+    op.execute("UPDATE posts_to_publish SET requests_failed = requests_failed + requests_cancelled")
+    op.drop_column('posts_to_publish', 'requests_cancelled')
@@ -0,0 +1,39 @@
+"""cancel deleted publications
+
+Revision ID: c3e8b5d2f9a4
+Revises: a9d3f1c5e7b2
+Create Date: 2025-09-29 15:02:44.731905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8b5d2f9a4'
+down_revision: Union[str, None] = 'a9d3f1c5e7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # publications deleted before deletion cleared the schedule kept coming due
+    op.execute("""
+        UPDATE posts_to_publish SET
+            next_run_at = NULL,
+            status = CASE
+                WHEN status IN ('PENDING', 'SCHEDULING', 'SCHEDULED') THEN 'CANCELED'::publicationstatus
+                ELSE status
+            END
+        WHERE deleted_at IS NOT NULL
+          AND (next_run_at IS NOT NULL OR status IN ('PENDING', 'SCHEDULING', 'SCHEDULED'))
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # the cleared schedules were never meant to run, there is nothing to restore
+    pass
@@ -0,0 +1,78 @@
+"""add posts_to_publish next_run_at
+
+Revision ID: d4e7f2a1c6b8
+Revises: b81f4c2e9a57
+Create Date: 2025-09-24 11:37:52.164093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e7f2a1c6b8'
+down_revision: Union[str, None] = 'b81f4c2e9a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# schedules are kept in Moscow wall-clock time, like the APScheduler store they replace
+LOCAL_NOW = "(now() AT TIME ZONE 'Europe/Moscow')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts_to_publish', sa.Column('next_run_at', sa.TIMESTAMP(), nullable=True))
+    op.create_index(
+        'ix_posts_to_publish_next_run_at',
+        'posts_to_publish',
+        ['next_run_at'],
+        unique=False,
+        postgresql_where=sa.text('next_run_at IS NOT NULL'),
+    )
+
+    # Wakes every posts-service replica when a run is scheduled, so none of them
+    # sleeps past it; claims collapse into one notification per transaction.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION posts_to_publish_due_notify() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('posts_to_publish_due', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER posts_to_publish_due_notify
+        AFTER UPDATE OF next_run_at ON posts_to_publish
+        FOR EACH ROW
+        WHEN (NEW.next_run_at IS NOT NULL AND NEW.next_run_at IS DISTINCT FROM OLD.next_run_at)
+        EXECUTE FUNCTION posts_to_publish_due_notify()
+    """)
+
+    # carry over the runs the SQLite job store was holding
+    op.execute("""
+        UPDATE posts_to_publish SET next_run_at = scheduled_date + scheduled_time
+        WHERE deleted_at IS NULL
+          AND scheduled_type = 'SINGLE'
+          AND scheduled_date IS NOT NULL
+          AND status IN ('SCHEDULING', 'SCHEDULED')
+    """)
+    op.execute(f"""
+        UPDATE posts_to_publish SET next_run_at = CASE
+            WHEN {LOCAL_NOW}::date + scheduled_time > {LOCAL_NOW}
+                THEN {LOCAL_NOW}::date + scheduled_time
+            ELSE {LOCAL_NOW}::date + 1 + scheduled_time
+        END
+        WHERE deleted_at IS NULL
+          AND scheduled_type = 'EVERYDAY'
+          AND status NOT IN ('PENDING', 'CANCELED')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS posts_to_publish_due_notify ON posts_to_publish")
+    op.execute("DROP FUNCTION IF EXISTS posts_to_publish_due_notify()")
+    op.drop_index('ix_posts_to_publish_next_run_at', table_name='posts_to_publish')
+    op.drop_column('posts_to_publish', 'next_run_at')
@@ -0,0 +1,114 @@
+"""add publication request counters
+
+Revision ID: e5b8a6d19c03
+Revises: c7d20e8b41f6
+Create Date: 2025-09-22 16:48:03.551872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8a6d19c03'
+down_revision: Union[str, None] = 'c7d20e8b41f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = ('requests_planned', 'requests_sent', 'requests_failed', 'requests_stale')
+
+# Applies signed per-publication deltas of `changes(publication_id, status, sign)`.
+# PLANNED -> IN_PROGRESS keeps every counter unchanged, so claiming never touches posts_to_publish.
+APPLY_CHANGES = """
+    UPDATE posts_to_publish p SET
+        requests_planned = p.requests_planned + d.planned,
+        requests_sent = p.requests_sent + d.sent,
+        requests_failed = p.requests_failed + d.failed,
+        requests_stale = p.requests_stale + d.stale
+    FROM (
+        SELECT
+            publication_id,
+            COALESCE(sum(sign) FILTER (WHERE status IN ('PLANNED', 'IN_PROGRESS')), 0) AS planned,
+            COALESCE(sum(sign) FILTER (WHERE status = 'SENT'), 0) AS sent,
+            COALESCE(sum(sign) FILTER (WHERE status IN ('FAILED', 'CANCELLED')), 0) AS failed,
+            COALESCE(sum(sign) FILTER (WHERE status = 'STALE'), 0) AS stale
+        FROM ({changes}) changes
+        GROUP BY publication_id
+    ) d
+    WHERE p.id = d.publication_id
+      AND (d.planned <> 0 OR d.sent <> 0 OR d.failed <> 0 OR d.stale <> 0);
+"""
+NEW_ROWS = "SELECT publication_id, status, 1 AS sign FROM new_rows WHERE deleted_at IS NULL"
+OLD_ROWS = "SELECT publication_id, status, -1 AS sign FROM old_rows WHERE deleted_at IS NULL"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for counter in COUNTERS:
+        op.add_column('posts_to_publish', sa.Column(counter, sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION send_post_requests_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {APPLY_CHANGES.format(changes=NEW_ROWS)}
+            ELSIF TG_OP = 'UPDATE' THEN
+                {APPLY_CHANGES.format(changes=f"{NEW_ROWS} UNION ALL {OLD_ROWS}")}
+            ELSE
+                {APPLY_CHANGES.format(changes=OLD_ROWS)}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER send_post_requests_counters_insert
+        AFTER INSERT ON send_post_requests
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION send_post_requests_counters()
+    """)
+    op.execute("""
+        CREATE TRIGGER send_post_requests_counters_update
+        AFTER UPDATE ON send_post_requests
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION send_post_requests_counters()
+    """)
+    op.execute("""
+        CREATE TRIGGER send_post_requests_counters_delete
+        AFTER DELETE ON send_post_requests
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION send_post_requests_counters()
+    """)
+
+    # backfill existing publications
+    op.execute("""
+        UPDATE posts_to_publish p SET
+            requests_planned = c.planned,
+            requests_sent = c.sent,
+            requests_failed = c.failed,
+            requests_stale = c.stale
+        FROM (
+            SELECT
+                publication_id,
+                count(*) FILTER (WHERE status IN ('PLANNED', 'IN_PROGRESS')) AS planned,
+                count(*) FILTER (WHERE status = 'SENT') AS sent,
+                count(*) FILTER (WHERE status IN ('FAILED', 'CANCELLED')) AS failed,
+                count(*) FILTER (WHERE status = 'STALE') AS stale
+            FROM send_post_requests
+            WHERE deleted_at IS NULL
+            GROUP BY publication_id
+        ) c
+        WHERE p.id = c.publication_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for operation in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS send_post_requests_counters_{operation} ON send_post_requests")
+    op.execute("DROP FUNCTION IF EXISTS send_post_requests_counters()")
+
+    for counter in COUNTERS:
+        op.drop_column('posts_to_publish', counter)
@@ -0,0 +1,34 @@
+"""add send_post_requests claimed_at
+
+Revision ID: f2c8e4a1b7d3
+Revises: d4e7f2a1c6b8
+Create Date: 2025-09-29 10:14:06.518327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8e4a1b7d3'
+down_revision: Union[str, None] = 'd4e7f2a1c6b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('send_post_requests', sa.Column('claimed_at', sa.TIMESTAMP(), nullable=True))
+
+    # requests already stuck IN_PROGRESS become reclaimable as well
+    op.execute("""
+        UPDATE send_post_requests SET claimed_at = updated_at
+        WHERE status = 'IN_PROGRESS'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('send_post_requests', 'claimed_at')
@@ -0,0 +1,12 @@
+from abc import ABC
+
+from shared.abstractions.services import ConsumerInterface
+
+from abstractions.services.posting import PostingServiceInterface
+
+
+class DuePublicationsConsumerInterface(
+    ConsumerInterface[PostingServiceInterface],
+    ABC,
+):
+    ...
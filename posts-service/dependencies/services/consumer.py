@@ -1,12 +1,19 @@
 from shared.dependencies.repositories.post_to_publish import get_post_to_publish_repository
+from shared.dependencies.services.notifications import get_notification_listener
+from shared.infrastructure.main_db.notifications import NotificationChannel
 
 from abstractions.services.cosumer import PostsConsumerInterface
 from dependencies.services.posting import get_posting_service
 from services.consumer import PostsConsumer
+from settings import settings
 
 
 def get_posts_consumer() -> PostsConsumerInterface:
     return PostsConsumer(
         posting_service=get_posting_service(),
         posts_to_publish_repository=get_post_to_publish_repository(),
+        notifications=get_notification_listener(
+            dsn=settings.db.dsn,
+            channel=NotificationChannel.POSTS_TO_PUBLISH,
+        ),
     )
@@ -0,0 +1,26 @@
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
+from shared.dependencies.repositories.post_to_publish import get_post_to_publish_repository
+from shared.dependencies.services.notifications import get_notification_listener
+from shared.infrastructure.main_db.notifications import NotificationChannel
+
+from abstractions.services.due_publications import DuePublicationsConsumerInterface
+from services.due_publications import DuePublicationsConsumer
+from settings import settings
+
+
+def get_due_publications_consumer() -> DuePublicationsConsumerInterface:
+    return DuePublicationsConsumer(
+        posts_to_publish_repository=get_post_to_publish_repository(),
+        notifications=get_notification_listener(
+            dsn=settings.db.dsn,
+            channel=NotificationChannel.POSTS_TO_PUBLISH_DUE,
+        ),
+        timezone=ZoneInfo(settings.scheduler.timezone),
+        poll_interval=settings.scheduler.poll_interval,
+        claim_batch_size=settings.scheduler.claim_batch_size,
+        single_misfire_grace=timedelta(seconds=settings.scheduler.single_misfire_grace),
+        daily_misfire_grace=timedelta(seconds=settings.scheduler.daily_misfire_grace),
+        single_claim_lease=timedelta(seconds=settings.scheduler.single_claim_lease),
+    )
@@ -1,5 +1,7 @@
+from zoneinfo import ZoneInfo
+
 from shared.dependencies.repositories import get_post_request_repository
-from shared.dependencies.services.get_scheduler import get_scheduler
+from shared.dependencies.repositories.post_to_publish import get_post_to_publish_repository
 
 from abstractions.services.posting import PostingServiceInterface
 from services.posting import PostingService
@@ -9,5 +11,6 @@ from settings import settings
 def get_posting_service() -> PostingServiceInterface:
     return PostingService(
         posts_requests_repository=get_post_request_repository(),
-        scheduler=get_scheduler(settings.scheduler.job_store_sqlite_path),
+        posts_to_publish_repository=get_post_to_publish_repository(),
+        timezone=ZoneInfo(settings.scheduler.timezone),
     )
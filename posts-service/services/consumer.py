@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import NoReturn
 
 from shared.abstractions.repositories import PostToPublishRepositoryInterface
+from shared.abstractions.services.notifications import NotificationListenerInterface
 from shared.domain.enums import PublicationStatus
 
 from abstractions.services.cosumer import PostsConsumerInterface
@@ -17,9 +18,10 @@ class PostsConsumer(PostsConsumerInterface):
     posting_service: PostingServiceInterface
 
     posts_to_publish_repository: PostToPublishRepositoryInterface
+    notifications: NotificationListenerInterface
 
     idle_delay: int = 10
-    global_delay: int = 10
+    global_delay: int = 0
 
     async def execute(self) -> NoReturn:
         logger.info("Consumer started")
@@ -27,7 +29,7 @@ class PostsConsumer(PostsConsumerInterface):
             post_to_publish = await self.posts_to_publish_repository.get_queued_post()
             if not post_to_publish:
                 logger.info("No posts to publish")
-                await sleep(self.idle_delay)
+                await self.notifications.wait(self.idle_delay)
                 continue
 
             logger.info("Scheduling post")
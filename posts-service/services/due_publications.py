@@ -0,0 +1,94 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import NoReturn
+from zoneinfo import ZoneInfo
+
+from shared.abstractions.repositories import PostToPublishRepositoryInterface
+from shared.abstractions.services.notifications import NotificationListenerInterface
+from shared.domain.enums import PublicationStatus, ScheduledType
+from shared.domain.models import DuePublication
+
+from abstractions.services.due_publications import DuePublicationsConsumerInterface
+from services.posting.jobs import publish
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DuePublicationsConsumer(DuePublicationsConsumerInterface):
+    posts_to_publish_repository: PostToPublishRepositoryInterface
+    notifications: NotificationListenerInterface
+
+    timezone: ZoneInfo
+
+    poll_interval: float = 30
+    claim_batch_size: int = 100
+    single_misfire_grace: timedelta = timedelta(seconds=60)
+    daily_misfire_grace: timedelta = timedelta(hours=1)
+    # how long a claimed one-off run is reserved for this replica before others may run it
+    single_claim_lease: timedelta = timedelta(minutes=10)
+
+    async def execute(self) -> NoReturn:
+        logger.info("Due publications consumer started")
+        while True:
+            claimed_at = self._now()
+            try:
+                due = await self.posts_to_publish_repository.claim_due(
+                    claimed_at,
+                    self.claim_batch_size,
+                    lease=self.single_claim_lease,
+                )
+            except Exception:
+                logger.error("Failed to claim due publications", exc_info=True)
+                await self.notifications.wait(self.poll_interval)
+                continue
+
+            for publication in due:
+                await self._run(publication, claimed_at)
+
+            # a full batch means more runs are already due
+            if len(due) == self.claim_batch_size:
+                continue
+
+            await self.notifications.wait(await self._idle_timeout())
+
+    async def _run(self, publication: DuePublication, claimed_at: datetime) -> None:
+        # the rest of the batch is not late for having waited behind the runs before it
+        late = claimed_at - publication.due_at
+        single = publication.scheduled_type == ScheduledType.SINGLE
+        try:
+            if single and late > self.single_misfire_grace:
+                logger.info(f"Marking missed one-off publication {publication.id} as STALE, {late} late")
+                # the claim goes first, a crash in between leaves the publication to the bootstrap
+                await self.posts_to_publish_repository.set_next_run_at(publication.id, None)
+                await self.posts_to_publish_repository.set_status(publication.id, PublicationStatus.STALE)
+                return
+
+            if not single and late > self.daily_misfire_grace:
+                logger.info(f"Skipping missed daily run of publication {publication.id}, {late} late")
+                return
+
+            await publish(publication.id)
+            if single:
+                # a published run is released by publish itself, this covers cancelled and failed ones
+                await self.posts_to_publish_repository.set_next_run_at(publication.id, None)
+        except Exception:
+            # a one-off run keeps its lease and is claimed again once it expires
+            logger.error(f"Failed to run publication {publication.id}", exc_info=True)
+
+    async def _idle_timeout(self) -> float:
+        try:
+            next_run_at = await self.posts_to_publish_repository.get_next_run_at()
+        except Exception:
+            logger.error("Failed to get the next due run", exc_info=True)
+            return self.poll_interval
+
+        if next_run_at is None:
+            return self.poll_interval
+
+        # notifications cover runs scheduled meanwhile, the poll only backs them up
+        return min(max((next_run_at - self._now()).total_seconds(), 0), self.poll_interval)
+
+    def _now(self) -> datetime:
+        return datetime.now(self.timezone).replace(tzinfo=None)
@@ -16,6 +16,8 @@ class BootstrapSettings(AbstractSettings):
     # How many minutes past the scheduled time a SINGLE post is allowed to be
     # before being considered stale during bootstrap restore.
     single_miss_grace_minutes: int = Field(default=60)
+    # rows fetched per round trip while restoring next runs
+    batch_size: int = Field(default=500)
 
 
 class Settings(AbstractSettings):
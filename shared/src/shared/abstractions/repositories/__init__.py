@@ -8,6 +8,10 @@ from .user import UserRepositoryInterface
 from .story import StoryRepositoryInterface
 from .worker_message import WorkerMessageRepositoryInterface
 from .proxy import ProxyRepositoryInterface
+from .projection import Projection
+from .pagination import Cursor, Page
+from .table_version import TableVersionRepositoryInterface, TableVersion
+from .media_reference import MediaReferenceRepositoryInterface
 
 
 __all__ = [
@@ -21,4 +25,10 @@ __all__ = [
     "StoryToPublishRepositoryInterface",
     "WorkerMessageRepositoryInterface",
     "ProxyRepositoryInterface",
+    "Projection",
+    "Cursor",
+    "Page",
+    "TableVersionRepositoryInterface",
+    "TableVersion",
+    "MediaReferenceRepositoryInterface",
 ]
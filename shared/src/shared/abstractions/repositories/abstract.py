@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+from .pagination import Cursor, Page
+from .projection import Projection
+
 
 class CRUDRepositoryInterface[PK_TYPE, Model, CreateDTO, UpdateDTO](ABC):
     @abstractmethod
@@ -10,6 +13,10 @@ class CRUDRepositoryInterface[PK_TYPE, Model, CreateDTO, UpdateDTO](ABC):
     async def get(self, obj_id: PK_TYPE) -> Model:
         pass
 
+    @abstractmethod
+    async def get_projected(self, obj_id: PK_TYPE, projection: Projection) -> Model:
+        pass
+
     @abstractmethod
     async def update(self, obj_id: PK_TYPE, obj: UpdateDTO) -> Model:
         pass
@@ -22,6 +29,11 @@ class CRUDRepositoryInterface[PK_TYPE, Model, CreateDTO, UpdateDTO](ABC):
     async def get_all(self, limit: int = 100, offset: int = 0) -> list[Model]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int = 100, after: Cursor | None = None) -> Page[Model]:
+        """Newest first, continuing strictly after `after`."""
+        pass
+
 
 class UOWInterface(ABC):
     @abstractmethod
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class MediaReferenceRepositoryInterface(ABC):
+    @abstractmethod
+    async def get_references(self) -> set[str]:
+        """
+        Every stored file a live row still points at: bare filenames of posts, stories
+        and queued worker messages, and the public URLs of emojis.
+        Deleted posts count while a live publication or a planned send still uses them.
+        """
+        ...
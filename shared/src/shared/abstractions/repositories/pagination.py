@@ -0,0 +1,32 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Keyset position in a (created_at, id) ordered listing.
+    Pages continue strictly after it, so they stay stable while rows are inserted.
+    """
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        try:
+            created_at, obj_id = base64.urlsafe_b64decode(value.encode()).decode().split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(obj_id))
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid cursor: {value}") from e
+
+
+@dataclass
+class Page[Model]:
+    items: list[Model]
+    next_cursor: Cursor | None = None
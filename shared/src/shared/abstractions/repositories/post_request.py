@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -15,6 +16,48 @@ class SendPostRequestRepositoryInterface(
     async def get_queued_message(self) -> Optional[SendPostRequest]:
         pass
 
+    @abstractmethod
+    async def claim_batch(self, limit: int, created_after: Optional[datetime] = None) -> list[SendPostRequest]:
+        """
+        Atomically mark up to `limit` PLANNED requests as IN_PROGRESS and return them.
+        Requests created before `created_after` are left for the stale sweep.
+        The claim is a lease, see `reclaim_expired`.
+        """
+        ...
+
+    @abstractmethod
+    async def reclaim_expired(self, claimed_before: datetime, limit: int = 1000) -> list[UUID]:
+        """
+        Put requests claimed before `claimed_before` that never reached a worker back to PLANNED,
+        returns their ids. Recovers batches of a worker-manager that crashed mid-way.
+        """
+        ...
+
+    @abstractmethod
+    async def mark_stale(self, created_before: datetime, limit: int = 1000) -> list[UUID]:
+        """Mark up to `limit` PLANNED requests created before `created_before` as STALE, returns their ids."""
+        ...
+
+    @abstractmethod
+    async def create_publication_requests(
+            self,
+            publication_id: UUID,
+            requests: list[CreateSendPostRequestDTO],
+    ) -> list[UUID]:
+        """
+        Insert all child requests of a publication and mark it IN_PROGRESS in one transaction.
+        A one-off publication also loses its next run there, ending its due-run claim.
+        """
+        ...
+
+    @abstractmethod
+    async def get_upcoming_senders(self, until: datetime, publication_sender_id: Optional[UUID] = None) -> list[UUID]:
+        """
+        Accounts expected to send before `until`: senders of planned requests,
+        plus `publication_sender_id` if a publication is due to run by then.
+        """
+        ...
+
     @abstractmethod
     async def get_requests_from_same_publication(self, request_id: UUID) -> list[SendPostRequest]:
         ...
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
 from shared.domain.dto import CreatePostToPublishDTO, UpdatePostToPublishDTO
 from shared.domain.enums import PublicationStatus
-from shared.domain.models import PostToPublish
+from shared.domain.models import PostToPublish, PublicationRequestCounters, DuePublication
+from .pagination import Cursor, Page
+from .projection import Projection
 from .uuid_pk_abstract import UUIDPKRepositoryInterface
 
 
@@ -20,7 +24,53 @@ class PostToPublishRepositoryInterface(
     async def set_status(self, post_id: UUID, status: PublicationStatus) -> None:
         ...
 
+    @abstractmethod
+    async def set_next_run_at(self, post_id: UUID, next_run_at: Optional[datetime]) -> None:
+        ...
+
+    @abstractmethod
+    async def claim_due(
+            self,
+            now: datetime,
+            limit: int = 100,
+            lease: timedelta = timedelta(minutes=10),
+    ) -> list[DuePublication]:
+        """
+        Claim live publications due by `now`, safe to call from several replicas at once.
+        Everyday publications are moved to their first run after `now`. One-off publications
+        are leased until `now + lease`: the claimer clears their next run once it is done with them,
+        otherwise they are claimed again when the lease expires.
+        """
+        ...
+
+    @abstractmethod
+    async def mark_overdue_stale(self, scheduled_before: datetime) -> int:
+        """Mark live one-off publications scheduled before `scheduled_before` as STALE, returns how many."""
+        ...
+
+    @abstractmethod
+    def stream_unscheduled(self, projection: Projection, batch_size: int = 500) -> AsyncIterator[PostToPublish]:
+        """Live publications without a next run, fetched `batch_size` rows at a time."""
+        ...
+
+    @abstractmethod
+    async def get_next_run_at(self) -> Optional[datetime]:
+        ...
+
+    @abstractmethod
+    async def get_request_counters(self, post_id: UUID) -> PublicationRequestCounters:
+        ...
+
     @abstractmethod
     async def get_posts_by_manager(self, responsible_manager_id: UUID) -> list[PostToPublish]:
         ...
 
+    @abstractmethod
+    async def get_manager_page(
+            self,
+            responsible_manager_id: UUID,
+            limit: int = 100,
+            after: Optional[Cursor] = None,
+    ) -> Page[PostToPublish]:
+        ...
+
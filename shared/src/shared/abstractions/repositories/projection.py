@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Declares which columns (and which relations, recursively) a caller needs.
+    Projected reads return `model.model_construct(...)` objects holding only these fields, without validation.
+    """
+    model: type[BaseModel]
+    columns: tuple[str, ...]
+    relations: dict[str, "Projection"] = field(default_factory=dict)
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TableVersion:
+    """
+    Cheap fingerprint of a set of tables: any insert, update or delete changes it.
+    Row counts catch hard deletes, which leave the latest updated_at untouched.
+    """
+    counts: tuple[int, ...]
+    last_modified: Optional[datetime]
+
+    @property
+    def tag(self) -> str:
+        last_modified = self.last_modified.isoformat() if self.last_modified else ""
+        return f"{','.join(map(str, self.counts))}|{last_modified}"
+
+
+class TableVersionRepositoryInterface(ABC):
+    @abstractmethod
+    async def get_version(self, tables: tuple[str, ...]) -> TableVersion:
+        ...
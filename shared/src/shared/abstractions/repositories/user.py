@@ -19,6 +19,11 @@ class UserRepositoryInterface(
     async def get_managers(self) -> List[User]:
         ...
 
+    @abstractmethod
+    async def get_senders(self) -> List[User]:
+        """Accounts with a Telegram session that are not banned, i.e. the ones workers can send from."""
+        ...
+
     @abstractmethod
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         ...
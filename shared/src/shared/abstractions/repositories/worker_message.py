@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 from shared.abstractions.repositories.uuid_pk_abstract import UUIDPKRepositoryInterface
@@ -17,6 +17,32 @@ class WorkerMessageRepositoryInterface(
     async def get_queued_message(self) -> Optional[WorkerMessage]:
         ...
 
+    @abstractmethod
+    async def claim_batch(
+            self,
+            user_ids: list[UUID],
+            limit: int = 1,
+            busy_chats: Sequence[tuple[UUID, int]] = (),
+    ) -> list[WorkerMessage]:
+        """
+        Atomically mark up to `limit` PENDING messages of the accounts as IN_PROGRESS and return them.
+        Messages of the (account, chat) pairs in `busy_chats` are skipped.
+        """
+        ...
+
+    @abstractmethod
+    async def release_claimed(self, user_ids: list[UUID]) -> int:
+        """
+        Put IN_PROGRESS messages of the accounts back to PENDING, returns how many.
+        Only safe while no worker sends from these accounts, e.g. at worker startup.
+        """
+        ...
+
+    @abstractmethod
+    async def fail_queued(self, user_ids: list[UUID]) -> int:
+        """Mark PENDING and IN_PROGRESS messages of the accounts as FAILED, returns how many."""
+        ...
+
     @abstractmethod
     async def set_message_status(
             self,
@@ -1,7 +1,9 @@
-from .upload import UploadServiceInterface
+from .upload import UploadServiceInterface, UploadedFile, AsyncReadable
 from .consumer import ConsumerInterface
 
 __all__ = [
     "UploadServiceInterface",
+    "UploadedFile",
+    "AsyncReadable",
     "ConsumerInterface",
 ]
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 from typing import Optional
 
+from shared.abstractions.repositories.pagination import Cursor, Page
 from shared.domain.dto.emoji import CreateEmojiDTO
 from shared.domain.models.emoji import Emoji
 
@@ -12,7 +13,7 @@ class EmojiServiceInterface(ABC):
         ...
 
     @abstractmethod
-    async def get_all_emojis(self) -> list[Emoji]:
+    async def get_all_emojis(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[Emoji]:
         ...
 
     @abstractmethod
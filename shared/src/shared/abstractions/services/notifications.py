@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class NotificationListenerInterface(ABC):
+    @abstractmethod
+    async def wait(self, timeout: float) -> bool:
+        """Block until a notification arrives or `timeout` seconds pass. Returns True if notified."""
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        ...
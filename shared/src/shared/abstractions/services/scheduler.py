@@ -1,38 +0,0 @@
-from abc import ABC, abstractmethod
-from collections.abc import Callable
-from datetime import datetime
-from typing import Coroutine, Any
-
-
-class SchedulerInterface(ABC):
-    @abstractmethod
-    def schedule_once(
-            self,
-            callback: Callable[[Any], Coroutine[Any, Any, None]],
-            runs_on: datetime,
-            args: tuple[Any, ...] = (),
-            job_id: str = None,
-            misfire_grace_time: int = 60,
-    ) -> None:
-        ...
-
-    @abstractmethod
-    def initialize(self) -> None:
-        ...
-
-    @abstractmethod
-    def schedule_daily(
-            self,
-            callback: Callable[[Any], Coroutine[Any, Any, None]],
-            hour: int,
-            minute: int,
-            args: tuple[Any, ...] = (),
-            job_id: str | None = None,
-            misfire_grace_time: int = 3600,
-    ) -> None:
-        ...
-
-    @abstractmethod
-    def add_listener(self, callback: Callable[[Any], None], mask: int) -> None:
-        """Attach a scheduler event listener (e.g., for EVENT_JOB_MISSED)."""
-        ...
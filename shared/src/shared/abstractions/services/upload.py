@@ -1,4 +1,19 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+
+class AsyncReadable(Protocol):
+    """Anything read chunk by chunk, e.g. a FastAPI `UploadFile`."""
+    async def read(self, size: int = -1) -> bytes:
+        ...
+
+
+@dataclass(frozen=True)
+class UploadedFile:
+    filename: str
+    size: int
+    sha256: str
 
 
 class UploadServiceInterface(ABC):
@@ -6,8 +21,30 @@ class UploadServiceInterface(ABC):
     async def upload(self, file: bytes, extension: str) -> str:
         ...
 
+    @abstractmethod
+    async def upload_stream(
+            self,
+            stream: AsyncReadable,
+            extension: str,
+            max_size: Optional[int] = None,
+    ) -> UploadedFile:
+        """
+        Copy `stream` to storage in fixed-size chunks, hashing it on the way.
+        Raises `FileTooLargeException` as soon as more than `max_size` bytes were read.
+        """
+        ...
+
     @abstractmethod
     def get_file_path(self, filename: str) -> str:
+        """Raises `ValueError` for names pointing outside of the storage."""
+        ...
+
+    @abstractmethod
+    async def collect_garbage(self, references: set[str], grace: float) -> int:
+        """
+        Remove stored files missing from `references` and untouched for `grace` seconds.
+        Returns how many were removed.
+        """
         ...
 
     @abstractmethod
@@ -15,7 +52,16 @@ class UploadServiceInterface(ABC):
         ...
 
     @abstractmethod
-    def get_file_url(self, name: str) -> str:
+    def get_file_url(self, name: str, size: Optional[int] = None) -> str:
+        """
+        With `size`, the URL of the smallest WebP preview at least that many px on each side,
+        or of the original while no such preview was rendered.
+        """
+        ...
+
+    @abstractmethod
+    def get_filename(self, reference: str) -> str:
+        """Filename behind a stored reference, which is either the filename itself or its URL."""
         ...
 
     @staticmethod
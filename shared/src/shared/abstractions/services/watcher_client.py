@@ -19,3 +19,17 @@ class WatcherClientInterface(ABC):
     @abstractmethod
     async def report_request_status_changed(self, request: RequestStatusChangedRequest) -> None:
         ...
+
+    @abstractmethod
+    async def report_requests_status_changed(self, requests: list[RequestStatusChangedRequest]) -> None:
+        """Report many status changes at once, sent to the watcher as a single batch."""
+        ...
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Send all buffered reports right away."""
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        ...
@@ -1,5 +1,6 @@
 from .chat import get_chat_repository
 from .emoji import get_emoji_repository
+from .media_reference import get_media_reference_repository
 from .post import get_post_repository
 from .post_request import get_post_request_repository
 from .post_to_publish import get_post_to_publish_repository
@@ -7,6 +8,7 @@ from .proxy import get_proxy_repository
 from .story import get_story_repository
 from .story_request import get_story_request_repository
 from .story_to_publish import get_story_to_publish_repository
+from .table_version import get_table_version_repository
 from .user import get_user_repository
 
 __all__ = [
@@ -20,4 +22,6 @@ __all__ = [
     "get_post_to_publish_repository",
     "get_emoji_repository",
     "get_story_request_repository",
+    "get_table_version_repository",
+    "get_media_reference_repository",
 ]
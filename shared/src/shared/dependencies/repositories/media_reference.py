@@ -0,0 +1,9 @@
+from shared.abstractions.repositories import MediaReferenceRepositoryInterface
+from shared.infrastructure.main_db.repositories import MediaReferenceRepository
+from .sessionmaker import get_session_maker
+
+
+def get_media_reference_repository() -> MediaReferenceRepositoryInterface:
+    return MediaReferenceRepository(
+        session_maker=get_session_maker(),
+    )
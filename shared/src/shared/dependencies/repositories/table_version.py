@@ -0,0 +1,9 @@
+from shared.abstractions.repositories import TableVersionRepositoryInterface
+from shared.infrastructure.main_db.repositories import TableVersionRepository
+from .sessionmaker import get_session_maker
+
+
+def get_table_version_repository() -> TableVersionRepositoryInterface:
+    return TableVersionRepository(
+        session_maker=get_session_maker(),
+    )
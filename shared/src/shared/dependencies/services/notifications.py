@@ -0,0 +1,16 @@
+from typing import Optional, Iterable
+
+from shared.abstractions.services.notifications import NotificationListenerInterface
+from shared.infrastructure.main_db.notifications import NotificationChannel, PostgresNotificationListener
+
+
+def get_notification_listener(
+        dsn: str,
+        channel: NotificationChannel,
+        payloads: Optional[Iterable[str]] = None,
+) -> NotificationListenerInterface:
+    return PostgresNotificationListener(
+        dsn=dsn,
+        channel=channel,
+        payloads=frozenset(payloads) if payloads is not None else None,
+    )
@@ -1,16 +1,26 @@
+from concurrent.futures import Executor
 from typing import Optional
 
 from shared.abstractions.services import UploadServiceInterface
 from shared.services import UploadService
 
 
-def get_upload_service(public_backend_base_url: str, app_upload_dir: Optional[str] = None) -> UploadServiceInterface:
+def get_upload_service(
+        public_backend_base_url: str,
+        app_upload_dir: Optional[str] = None,
+        preview_pool: Optional[Executor] = None,
+        max_file_size: Optional[int] = None,
+) -> UploadServiceInterface:
     if app_upload_dir is None:
         return UploadService(
             public_backend_base_url=public_backend_base_url,
+            preview_pool=preview_pool,
+            max_file_size=max_file_size,
         )
 
     return UploadService(
         images_dir=app_upload_dir,
         public_backend_base_url=public_backend_base_url,
+        preview_pool=preview_pool,
+        max_file_size=max_file_size,
     )
@@ -5,7 +5,7 @@ from .post_request import SendPostRequest
 from .worker_message import WorkerMessage
 from .story_request import PublishStoryRequest
 from .analytics_service import Service
-from .post_to_publish import PostToPublish
+from .post_to_publish import PostToPublish, PublicationRequestCounters, DuePublication
 from .story_to_publish import StoryToPublish
 from .story import Story
 from .proxy import Proxy
@@ -36,6 +36,8 @@ __all__ = [
     "SendingRequest",
     "Service",
     "PostToPublish",
+    "PublicationRequestCounters",
+    "DuePublication",
     "StoryToPublish",
     "Story",
     "Proxy"
@@ -2,7 +2,7 @@ from datetime import date, time, datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import ConfigDict
+from pydantic import BaseModel, ConfigDict
 
 from shared.domain.enums import ScheduledType, PublicationStatus
 from .abstract import Model
@@ -19,6 +19,7 @@ class PostToPublish(Model):
     scheduled_date: Optional[date]
     scheduled_time: time
     status: PublicationStatus
+    next_run_at: Optional[datetime] = None
 
     creator: User
     responsible_manager: User
@@ -27,4 +28,30 @@ class PostToPublish(Model):
 
     deleted_at: Optional[datetime] = None
 
+    requests_planned: int = 0
+    requests_sent: int = 0
+    requests_failed: int = 0
+    requests_stale: int = 0
+    requests_cancelled: int = 0
+
     model_config = ConfigDict(from_attributes=True)
+
+
+class DuePublication(BaseModel):
+    id: UUID
+    scheduled_type: ScheduledType
+    # the run time the publication was claimed for, not the claim time
+    due_at: datetime
+
+
+class PublicationRequestCounters(BaseModel):
+    # planned also covers requests that are IN_PROGRESS
+    planned: int = 0
+    sent: int = 0
+    failed: int = 0
+    stale: int = 0
+    cancelled: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.planned + self.sent + self.failed + self.stale + self.cancelled
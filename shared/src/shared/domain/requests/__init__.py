@@ -4,6 +4,7 @@ from .watcher import (
     RequestProcessingStartedRequest,
     MessageSentRequest,
     RequestStatusChangedRequest,
+    WatcherBatchRequest,
     PostPublicationStartedRequest,
     PostRequestProcessingStartedRequest,
     PostMessageSentRequest,
@@ -20,6 +21,7 @@ __all__ = [
     "RequestProcessingStartedRequest",
     "MessageSentRequest",
     "RequestStatusChangedRequest",
+    "WatcherBatchRequest",
     'PostPublicationStartedRequest',
     'PostRequestProcessingStartedRequest',
     'PostMessageSentRequest',
@@ -1,4 +1,10 @@
-from .base import PublicationStartedRequest, RequestProcessingStartedRequest, MessageSentRequest, RequestStatusChangedRequest
+from .base import (
+    PublicationStartedRequest,
+    RequestProcessingStartedRequest,
+    MessageSentRequest,
+    RequestStatusChangedRequest,
+    WatcherBatchRequest,
+)
 from .posts import (
     PostPublicationStartedRequest,
     PostRequestProcessingStartedRequest,
@@ -12,6 +18,7 @@ __all__ = (
     'RequestProcessingStartedRequest',
     'MessageSentRequest',
     'RequestStatusChangedRequest',
+    'WatcherBatchRequest',
     'PostPublicationStartedRequest',
     'PostRequestProcessingStartedRequest',
     'PostMessageSentRequest',
@@ -25,3 +25,8 @@ class MessageSentRequest(BaseModel):
 class RequestStatusChangedRequest(BaseModel):
     type: PublicationType
     request_id: UUID
+
+
+class WatcherBatchRequest(BaseModel):
+    messages: list[MessageSentRequest] = []
+    request_statuses: list[RequestStatusChangedRequest] = []
@@ -3,7 +3,7 @@ from enum import StrEnum
 from typing import Optional
 from uuid import UUID as pyUUID
 
-from sqlalchemy import ForeignKey, UUID, Enum, func, BigInteger, Table, Column
+from sqlalchemy import ForeignKey, UUID, Enum, func, BigInteger, Table, Column, Index, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -50,6 +50,10 @@ class UserChat(AbstractBase):
 
 class User(AbstractBase):
     __tablename__ = "users"
+    __table_args__ = (
+        # keyset pagination of admin listings
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True)
     telegram_username: Mapped[Optional[str]]
@@ -85,6 +89,10 @@ class ChatType(AbstractBase):
 
 class Chat(AbstractBase):
     __tablename__ = "chats"
+    __table_args__ = (
+        # keyset pagination of admin listings
+        Index("ix_chats_created_at_id", "created_at", "id"),
+    )
 
     chat_type_id: Mapped[UUID] = mapped_column(ForeignKey('chat_type.id'), nullable=True)
     name: Mapped[str]
@@ -109,6 +117,10 @@ class Chat(AbstractBase):
 
 class Post(AbstractBase):
     __tablename__ = "posts"
+    __table_args__ = (
+        # keyset pagination of admin listings
+        Index("ix_posts_created_at_id", "created_at", "id"),
+    )
 
     name: Mapped[str]
     text: Mapped[str]
@@ -137,6 +149,17 @@ class UpdatePost(AbstractBase):
 
 class PostToPublish(AbstractBase):
     __tablename__ = "posts_to_publish"
+    __table_args__ = (
+        # keyset pagination of admin listings
+        Index("ix_posts_to_publish_created_at_id", "created_at", "id"),
+        Index("ix_posts_to_publish_manager_created_at_id", "responsible_manager_id", "created_at", "id"),
+        # due-run claims only ever look at publications that still have a run ahead
+        Index(
+            "ix_posts_to_publish_next_run_at",
+            "next_run_at",
+            postgresql_where=text("next_run_at IS NOT NULL"),
+        ),
+    )
 
     post_id: Mapped[pyUUID] = mapped_column(ForeignKey("posts.id"))
     creator_id: Mapped[pyUUID] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"),
@@ -146,6 +169,8 @@ class PostToPublish(AbstractBase):
     scheduled_date: Mapped[Optional[date]]
     scheduled_time: Mapped[time]
     status: Mapped[PublicationStatus]
+    # next due run, moved a day ahead on every claim of an everyday publication
+    next_run_at: Mapped[Optional[datetime]]
 
     responsible_manager: Mapped[User] = relationship("User", foreign_keys=[responsible_manager_id],
                                                      passive_deletes="all")
@@ -154,6 +179,13 @@ class PostToPublish(AbstractBase):
     chats: Mapped[list[Chat]] = relationship("Chat", secondary=post_to_publish_chat_association)
     deleted_at: Mapped[Optional[datetime]]
 
+    # maintained by the send_post_requests_counters trigger, never written by the application
+    requests_planned: Mapped[int] = mapped_column(default=0, server_default='0')
+    requests_sent: Mapped[int] = mapped_column(default=0, server_default='0')
+    requests_failed: Mapped[int] = mapped_column(default=0, server_default='0')
+    requests_stale: Mapped[int] = mapped_column(default=0, server_default='0')
+    requests_cancelled: Mapped[int] = mapped_column(default=0, server_default='0')
+
 
 class SendPostRequest(AbstractBase):
     __tablename__ = "send_post_requests"
@@ -169,6 +201,8 @@ class SendPostRequest(AbstractBase):
     status: Mapped[SendPostRequestStatus] = mapped_column(Enum(SendPostRequestStatus))
     sent_at: Mapped[Optional[datetime]]
     stale_at: Mapped[Optional[datetime]]
+    # lease of the worker-manager that moved it to IN_PROGRESS
+    claimed_at: Mapped[Optional[datetime]]
 
     user: Mapped["User"] = relationship("User", passive_deletes="all")
     chat: Mapped["Chat"] = relationship("Chat")
@@ -221,6 +255,10 @@ class EmojiFormat(StrEnum):
 
 class Emoji(AbstractBase):
     __tablename__ = "emojis"
+    __table_args__ = (
+        # keyset pagination of admin listings
+        Index("ix_emojis_created_at_id", "created_at", "id"),
+    )
 
     name: Mapped[str]
     custom_emoji_id: Mapped[str] = mapped_column(unique=True)
@@ -235,6 +273,10 @@ class Emoji(AbstractBase):
 # internal workers data
 class WorkerMessage(AbstractBase):
     __tablename__ = "worker_messages"
+    __table_args__ = (
+        # each account worker claims only its own queue head
+        Index("ix_worker_messages_user_id_status_created_at", "user_id", "status", "created_at"),
+    )
 
     user_id: Mapped[Optional[pyUUID]] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     chat_id: Mapped[int] = mapped_column(BigInteger)
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Optional
+
+import asyncpg
+
+from shared.abstractions.services.notifications import NotificationListenerInterface
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationChannel(StrEnum):
+    # channel names match the tables whose inserts fire NOTIFY (see the queue_notify trigger)
+    SEND_POST_REQUESTS = "send_post_requests"
+    WORKER_MESSAGES = "worker_messages"
+    POSTS_TO_PUBLISH = "posts_to_publish"
+    # fired by posts_to_publish_due_notify when a publication gets a new next run
+    POSTS_TO_PUBLISH_DUE = "posts_to_publish_due"
+
+
+@dataclass
+class PostgresNotificationListener(NotificationListenerInterface):
+    dsn: str
+    channel: NotificationChannel
+    # when set, only notifications carrying one of these payloads wake the listener
+    payloads: Optional[frozenset[str]] = None
+
+    _connection: Optional[asyncpg.Connection] = field(default=None, init=False)
+    _event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+
+    async def wait(self, timeout: float) -> bool:
+        await self._ensure_connected()
+
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            notified = True
+        except asyncio.TimeoutError:
+            notified = False
+
+        self._event.clear()
+        return notified
+
+    async def close(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def _ensure_connected(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            return
+
+        try:
+            self._connection = await asyncpg.connect(self.dsn)
+            await self._connection.add_listener(self.channel, self._on_notification)
+            logger.info(f"Listening for notifications on {self.channel}")
+        except Exception:
+            # Consumers keep working on the fallback poll until the next reconnect attempt
+            logger.warning(f"Cannot listen on {self.channel}, falling back to polling", exc_info=True)
+            self._connection = None
+            return
+
+        # Anything inserted while we were disconnected was not announced
+        self._event.set()
+
+    def _on_notification(self, _connection, _pid: int, _channel: str, payload: str) -> None:
+        if self.payloads is None or payload in self.payloads:
+            self._event.set()
@@ -8,6 +8,8 @@ from .story_to_publish import StoryToPublishRepository
 from .post_to_publish import PostToPublishRepository
 from .worker_message import WorkerMessageRepository
 from .proxy import ProxyRepository
+from .table_version import TableVersionRepository
+from .media_reference import MediaReferenceRepository
 
 from .exceptions import NoFreeProxiesException
 
@@ -22,5 +24,7 @@ __all__ = [
     "PostToPublishRepository",
     "WorkerMessageRepository",
     "ProxyRepository",
+    "TableVersionRepository",
+    "MediaReferenceRepository",
     "NoFreeProxiesException",
 ]
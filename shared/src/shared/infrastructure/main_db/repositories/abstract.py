@@ -1,6 +1,7 @@
 from abc import ABC
+from typing import Any, Sequence
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, update
 from shared.infrastructure.sqlalchemy.repository import AbstractSQLAlchemyRepository
 
 
@@ -34,3 +35,42 @@ class AbstractMainDBRepository[Entity, Model, CreateDTO, UpdateDTO](
                 self.entity_to_model(entity)
                 for entity in res
             ]
+
+    async def _claim(
+            self,
+            conditions: Sequence[Any],
+            values: dict[str, Any],
+            limit: int,
+            options: Sequence[Any] = (),
+    ) -> list[Entity]:
+        """
+        Set `values` on up to `limit` of the oldest rows matching `conditions` and return them.
+        SKIP LOCKED lets several consumers claim disjoint rows concurrently.
+        """
+        async with self.session_maker() as session:
+            async with session.begin():
+                to_claim = (
+                    select(self.entity.id)
+                    .where(*conditions)
+                    .order_by(self.entity.created_at)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                claimed_ids = (await session.execute(
+                    update(self.entity)
+                    .where(self.entity.id.in_(to_claim))
+                    .values(**values)
+                    .returning(self.entity.id)
+                    .execution_options(synchronize_session=False)
+                )).scalars().all()
+
+                if not claimed_ids:
+                    return []
+
+                result = await session.execute(
+                    select(self.entity)
+                    .where(self.entity.id.in_(claimed_ids))
+                    .order_by(self.entity.created_at)
+                    .options(*options)
+                )
+                return list(result.unique().scalars().all())
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+
+from sqlalchemy import select, union, or_
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from shared.abstractions.repositories.media_reference import MediaReferenceRepositoryInterface
+from shared.domain.enums import SendPostRequestStatus, WorkerMessageStatus
+from shared.infrastructure.main_db.entities import Post, PostToPublish, SendPostRequest, Story, Emoji, WorkerMessage
+
+
+@dataclass
+class MediaReferenceRepository(MediaReferenceRepositoryInterface):
+    session_maker: async_sessionmaker
+
+    async def get_references(self) -> set[str]:
+        # a deleted post keeps its media while a live publication or a pending send still points at it
+        publication_pending = (
+            select(PostToPublish.id)
+            .where(PostToPublish.post_id == Post.id, PostToPublish.deleted_at.is_(None))
+            .exists()
+        )
+        send_pending = (
+            select(SendPostRequest.id)
+            .where(
+                SendPostRequest.post_id == Post.id,
+                SendPostRequest.deleted_at.is_(None),
+                SendPostRequest.status.in_([SendPostRequestStatus.PLANNED, SendPostRequestStatus.IN_PROGRESS]),
+            )
+            .exists()
+        )
+        query = union(
+            select(Post.image_path.label("reference"))
+            .where(
+                Post.image_path.is_not(None),
+                or_(Post.deleted_at.is_(None), publication_pending, send_pending),
+            ),
+            select(Story.file_path),
+            select(Emoji.img_url),
+            select(WorkerMessage.media_path)
+            .where(
+                WorkerMessage.media_path.is_not(None),
+                WorkerMessage.status.in_([WorkerMessageStatus.PENDING, WorkerMessageStatus.IN_PROGRESS]),
+            ),
+        )
+
+        async with self.session_maker() as session:
+            return set((await session.scalars(query)).all())
@@ -1,22 +1,36 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from shared.abstractions.repositories import SendPostRequestRepositoryInterface
+from shared.abstractions.repositories import SendPostRequestRepositoryInterface, Projection
 from shared.domain.dto import CreateSendPostRequestDTO, UpdateSendPostRequestDTO
 from shared.domain.dto.post_to_publish import MessageEntityDTO
-from shared.domain.enums import SendPostRequestStatus
+from shared.domain.enums import SendPostRequestStatus, PublicationStatus, ScheduledType
 from shared.domain.models import (
     Chat as ChatModel,
     Post as PostModel,
     SendPostRequest as SendPostRequestModel,
     User as UserModel, SendingRequest,
 )
-from shared.infrastructure.main_db.entities import Chat, Post, SendPostRequest, User
-from sqlalchemy import select
+from shared.infrastructure.main_db.entities import Chat, Post, SendPostRequest, User, PostToPublish, WorkerMessage
+from sqlalchemy import select, update, distinct, case
 
 from .abstract import AbstractMainDBRepository
 
+# What the sending loop actually reads: no creator/sender user row, only the chat id and the post content
+QUEUED_REQUEST_PROJECTION = Projection(
+    model=SendPostRequestModel,
+    columns=(
+        "id", "post_id", "chat_id", "user_id", "scheduled_at", "publication_id",
+        "status", "sent_at", "stale_at", "created_at", "updated_at",
+    ),
+    relations={
+        "chat": Projection(model=ChatModel, columns=("id", "chat_id")),
+        "post": Projection(model=PostModel, columns=("id", "text", "entities", "image_path")),
+    },
+)
+
 
 @dataclass
 class SendPostRequestRepository(
@@ -31,6 +45,32 @@ class SendPostRequestRepository(
 
     _soft_delete: bool = field(default=True)
 
+    async def create_publication_requests(
+            self,
+            publication_id: UUID,
+            requests: list[CreateSendPostRequestDTO],
+    ) -> list[UUID]:
+        async with self.session_maker() as session:
+            async with session.begin():
+                await session.execute(
+                    update(PostToPublish)
+                    .where(PostToPublish.id == publication_id)
+                    .values(
+                        status=PublicationStatus.IN_PROGRESS,
+                        # ends the claim of a one-off run together with the requests it produced
+                        next_run_at=case(
+                            (PostToPublish.scheduled_type == ScheduledType.SINGLE, None),
+                            else_=PostToPublish.next_run_at,
+                        ),
+                    )
+                )
+
+                entities = [self.create_dto_to_entity(request) for request in requests]
+                # primary keys come from the DTOs, so the flush is a single multi-row INSERT
+                session.add_all(entities)
+
+        return [entity.id for entity in entities]
+
     async def get_requests_from_same_publication(self, request_id: UUID) -> list[SendPostRequestModel]:
         async with self.session_maker() as session:
             request = await session.get(self.entity, request_id)
@@ -60,6 +100,101 @@ class SendPostRequestRepository(
 
         return self.entity_to_model(message) if message else None
 
+    async def get_upcoming_senders(self, until: datetime, publication_sender_id: Optional[UUID] = None) -> list[UUID]:
+        async with self.session_maker() as session:
+            result = await session.execute(
+                select(distinct(self.entity.user_id))
+                .where(
+                    self.entity.user_id.is_not(None),
+                    self.entity.deleted_at.is_(None),
+                    self.entity.status == SendPostRequestStatus.PLANNED,
+                    self.entity.scheduled_at <= until,
+                )
+            )
+            senders = list(result.scalars().all())
+
+            if publication_sender_id is not None and publication_sender_id not in senders:
+                # send requests of a publication only appear once it runs, its schedule is in posts_to_publish
+                publication_due = await session.scalar(
+                    select(
+                        select(PostToPublish.id)
+                        .where(
+                            PostToPublish.deleted_at.is_(None),
+                            PostToPublish.next_run_at <= until,
+                        )
+                        .exists()
+                    )
+                )
+                if publication_due:
+                    senders.append(publication_sender_id)
+
+        return senders
+
+    async def claim_batch(self, limit: int, created_after: Optional[datetime] = None) -> list[SendPostRequestModel]:
+        conditions = [self.entity.status == SendPostRequestStatus.PLANNED, self.entity.deleted_at.is_(None)]
+        if created_after is not None:
+            conditions.append(self.entity.created_at >= created_after)
+
+        # several worker-manager replicas claim disjoint batches concurrently
+        requests = await self._claim(
+            conditions,
+            values={"status": SendPostRequestStatus.IN_PROGRESS, "claimed_at": datetime.now()},
+            limit=limit,
+            options=self._projection_options(QUEUED_REQUEST_PROJECTION),
+        )
+
+        return [self._from_projection(request, QUEUED_REQUEST_PROJECTION) for request in requests]
+
+    async def reclaim_expired(self, claimed_before: datetime, limit: int = 1000) -> list[UUID]:
+        # a request that reached a worker has a message row; the rest died with their worker-manager
+        handed_over = select(WorkerMessage.id).where(WorkerMessage.request_id == self.entity.id)
+
+        async with self.session_maker() as session:
+            async with session.begin():
+                to_reclaim = (
+                    select(self.entity.id)
+                    .where(
+                        self.entity.status == SendPostRequestStatus.IN_PROGRESS,
+                        self.entity.deleted_at.is_(None),
+                        self.entity.claimed_at < claimed_before,
+                        ~handed_over.exists(),
+                    )
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                reclaimed_ids = (await session.execute(
+                    update(self.entity)
+                    .where(self.entity.id.in_(to_reclaim))
+                    .values(status=SendPostRequestStatus.PLANNED, claimed_at=None)
+                    .returning(self.entity.id)
+                    .execution_options(synchronize_session=False)
+                )).scalars().all()
+
+        return list(reclaimed_ids)
+
+    async def mark_stale(self, created_before: datetime, limit: int = 1000) -> list[UUID]:
+        async with self.session_maker() as session:
+            async with session.begin():
+                to_mark = (
+                    select(self.entity.id)
+                    .where(
+                        self.entity.status == SendPostRequestStatus.PLANNED,
+                        self.entity.deleted_at.is_(None),
+                        self.entity.created_at < created_before,
+                    )
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                marked_ids = (await session.execute(
+                    update(self.entity)
+                    .where(self.entity.id.in_(to_mark))
+                    .values(status=SendPostRequestStatus.STALE, stale_at=datetime.now())
+                    .returning(self.entity.id)
+                    .execution_options(synchronize_session=False)
+                )).scalars().all()
+
+        return list(marked_ids)
+
     def create_dto_to_entity(self, dto: CreateSendPostRequestDTO) -> SendPostRequest:
         return SendPostRequest(
             id=dto.id,
@@ -1,22 +1,41 @@
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update, func, case, cast, literal, Integer, DateTime
+from sqlalchemy.exc import NoResultFound
 
-from shared.abstractions.repositories import PostToPublishRepositoryInterface
+from shared.abstractions.repositories import PostToPublishRepositoryInterface, Cursor, Page, Projection
 from shared.domain.dto import CreatePostToPublishDTO, UpdatePostToPublishDTO
 from shared.domain.dto.post_to_publish import MessageEntityDTO
-from shared.domain.enums import PublicationStatus
+from shared.domain.enums import PublicationStatus, ScheduledType
 from shared.domain.models import (
     PostToPublish as PostToPublishModel,
+    PublicationRequestCounters,
+    DuePublication,
     User as UserModel,
     Chat as ChatModel,
     Post as PostModel
 )
 from shared.infrastructure.main_db.entities import PostToPublish, User, Chat, Post
+from shared.infrastructure.sqlalchemy.exceptions import NotFoundException
 from .abstract import AbstractMainDBRepository
 
+# publications in these statuses never run again
+TERMINAL_STATUSES = (
+    PublicationStatus.POSTED,
+    PublicationStatus.FAILED,
+    PublicationStatus.CANCELED,
+    PublicationStatus.STALE,
+)
+# publications that have not produced any send requests yet
+NOT_STARTED_STATUSES = (
+    PublicationStatus.PENDING,
+    PublicationStatus.SCHEDULING,
+    PublicationStatus.SCHEDULED,
+)
 
 @dataclass
 class PostToPublishRepository(
@@ -56,6 +75,19 @@ class PostToPublishRepository(
             return [self.entity_to_model(entity) for entity in objs]
 
 
+    async def delete(self, obj_id: UUID) -> None:
+        async with self.session_maker() as session:
+            async with session.begin():
+                post = await session.get(self.entity, obj_id)
+                if not post or post.deleted_at:
+                    raise NotFoundException
+
+                post.deleted_at = datetime.now()
+                # the due-run loop never sees a deleted publication again
+                post.next_run_at = None
+                if post.status in NOT_STARTED_STATUSES:
+                    post.status = PublicationStatus.CANCELED
+
     async def get_posts_by_manager(self, responsible_manager_id: UUID) -> list[PostToPublishModel]:
         async with self.session_maker() as session:
             result = await session.execute(
@@ -71,6 +103,14 @@ class PostToPublishRepository(
 
         return [self.entity_to_model(post) for post in posts]
 
+    async def get_manager_page(
+            self,
+            responsible_manager_id: UUID,
+            limit: int = 100,
+            after: Optional[Cursor] = None,
+    ) -> Page[PostToPublishModel]:
+        return await self._get_page(limit, after, self.entity.responsible_manager_id == responsible_manager_id)
+
     async def get_queued_post(self) -> Optional[PostToPublish]:
         async with self.session_maker() as session:
             result = await session.execute(
@@ -94,6 +134,121 @@ class PostToPublishRepository(
                 post = await session.get(self.entity, post_id)
                 post.status = status
 
+    async def set_next_run_at(self, post_id: UUID, next_run_at: Optional[datetime]) -> None:
+        async with self.session_maker() as session:
+            async with session.begin():
+                await session.execute(
+                    update(self.entity)
+                    .where(self.entity.id == post_id)
+                    .values(next_run_at=next_run_at)
+                )
+
+    async def claim_due(
+            self,
+            now: datetime,
+            limit: int = 100,
+            lease: timedelta = timedelta(minutes=10),
+    ) -> list[DuePublication]:
+        due = (
+            select(self.entity.id, self.entity.next_run_at)
+            .where(self.entity.next_run_at <= now, self.entity.deleted_at.is_(None))
+            .order_by(self.entity.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("due")
+        )
+        # however many days were missed, a daily run lands on its first occurrence after now
+        days_behind = func.floor(
+            func.extract("epoch", literal(now, DateTime) - due.c.next_run_at) / 86400
+        ) + 1
+        next_daily_run = due.c.next_run_at + func.make_interval(0, 0, 0, cast(days_behind, Integer))
+
+        async with self.session_maker() as session:
+            async with session.begin():
+                rows = (await session.execute(
+                    update(self.entity)
+                    .where(self.entity.id == due.c.id)
+                    .values(next_run_at=case(
+                        (self.entity.scheduled_type == ScheduledType.EVERYDAY, next_daily_run),
+                        # a one-off run comes due again if its claimer dies before finishing it
+                        else_=literal(now + lease, DateTime),
+                    ))
+                    .returning(self.entity.id, self.entity.scheduled_type, due.c.next_run_at)
+                )).all()
+
+        return [
+            DuePublication(id=row[0], scheduled_type=row[1], due_at=row[2])
+            for row in sorted(rows, key=lambda row: row[2])
+        ]
+
+    async def mark_overdue_stale(self, scheduled_before: datetime) -> int:
+        async with self.session_maker() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(self.entity)
+                    .where(
+                        self.entity.deleted_at.is_(None),
+                        self.entity.scheduled_type == ScheduledType.SINGLE,
+                        self.entity.scheduled_date.is_not(None),
+                        self.entity.status.not_in(TERMINAL_STATUSES),
+                        self.entity.scheduled_date + self.entity.scheduled_time < scheduled_before,
+                    )
+                    .values(status=PublicationStatus.STALE, next_run_at=None)
+                )
+
+        return result.rowcount
+
+    async def stream_unscheduled(
+            self,
+            projection: Projection,
+            batch_size: int = 500,
+    ) -> AsyncIterator[PostToPublishModel]:
+        # a server-side cursor keeps memory flat, so the projection must not join collections
+        async with self.session_maker() as session:
+            result = await session.stream_scalars(
+                select(self.entity)
+                .where(
+                    self.entity.deleted_at.is_(None),
+                    self.entity.next_run_at.is_(None),
+                    self.entity.status.not_in(TERMINAL_STATUSES),
+                )
+                .options(*self._projection_options(projection))
+                .execution_options(yield_per=batch_size)
+            )
+            async for entity in result:
+                yield self._from_projection(entity, projection)
+
+    async def get_next_run_at(self) -> Optional[datetime]:
+        async with self.session_maker() as session:
+            return await session.scalar(
+                select(func.min(self.entity.next_run_at))
+                .where(self.entity.next_run_at.is_not(None), self.entity.deleted_at.is_(None))
+            )
+
+    async def get_request_counters(self, post_id: UUID) -> PublicationRequestCounters:
+        async with self.session_maker() as session:
+            try:
+                row = (await session.execute(
+                    select(
+                        self.entity.requests_planned,
+                        self.entity.requests_sent,
+                        self.entity.requests_failed,
+                        self.entity.requests_stale,
+                        self.entity.requests_cancelled,
+                    )
+                    .where(self.entity.id == post_id)
+                )).one()
+            except NoResultFound:
+                raise NotFoundException
+
+        return PublicationRequestCounters(
+            planned=row.requests_planned,
+            sent=row.requests_sent,
+            failed=row.requests_failed,
+            stale=row.requests_stale,
+            cancelled=row.requests_cancelled,
+        )
+
     async def create(self, obj: CreatePostToPublishDTO) -> UUID:
         async with self.session_maker() as session:
             async with session.begin():
@@ -171,6 +326,7 @@ class PostToPublishRepository(
             scheduled_date=entity.scheduled_date,
             scheduled_time=entity.scheduled_time,
             status=entity.status,
+            next_run_at=entity.next_run_at,
             creator=_map_user(entity.creator),
             responsible_manager=_map_user(entity.responsible_manager),
             chats=[_map_chat(x) for x in entity.chats],
@@ -178,4 +334,9 @@ class PostToPublishRepository(
             created_at=entity.created_at,
             updated_at=entity.updated_at,
             deleted_at=entity.deleted_at,
+            requests_planned=entity.requests_planned,
+            requests_sent=entity.requests_sent,
+            requests_failed=entity.requests_failed,
+            requests_stale=entity.requests_stale,
+            requests_cancelled=entity.requests_cancelled,
         )
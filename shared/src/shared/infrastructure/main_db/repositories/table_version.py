@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from sqlalchemy import select, func, table, column, union_all, literal
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from shared.abstractions.repositories.table_version import TableVersionRepositoryInterface, TableVersion
+
+
+@dataclass
+class TableVersionRepository(TableVersionRepositoryInterface):
+    session_maker: async_sessionmaker
+
+    async def get_version(self, tables: tuple[str, ...]) -> TableVersion:
+        # one round trip for all tables, no rows are loaded
+        per_table = []
+        for position, name in enumerate(tables):
+            source = table(name, column("updated_at"))
+            per_table.append(
+                select(
+                    literal(position).label("position"),
+                    func.count().label("rows"),
+                    func.max(source.c.updated_at).label("last_modified"),
+                ).select_from(source)
+            )
+
+        async with self.session_maker() as session:
+            rows = sorted((await session.execute(union_all(*per_table))).all(), key=lambda row: row.position)
+
+        modified = [row.last_modified for row in rows if row.last_modified is not None]
+        return TableVersion(
+            counts=tuple(row.rows for row in rows),
+            last_modified=max(modified) if modified else None,
+        )
@@ -78,6 +78,19 @@ class UserRepository(
 
         return [self.entity_to_model(x) for x in res] if res else []
 
+    async def get_senders(self) -> List[User]:
+        async with self.session_maker() as session:
+            stmt = select(self.entity).where(
+                self.entity.session_string.is_not(None),
+                self.entity.is_banned.is_(False),
+            )
+            if self.options:
+                stmt = stmt.options(*self.options)
+
+            res = (await session.execute(stmt)).unique().scalars().all()
+
+        return [self.entity_to_model(x) for x in res]
+
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         try:
             async with self.session_maker() as session:
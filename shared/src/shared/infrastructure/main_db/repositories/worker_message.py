@@ -1,10 +1,10 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, update
 
 from shared.abstractions.repositories.worker_message import WorkerMessageRepositoryInterface
 from shared.domain.dto import CreateWorkerMessageDTO, UpdateWorkerMessageDTO
@@ -54,6 +54,55 @@ class WorkerMessageRepository(
 
         return self.entity_to_model(message) if message else None
 
+    async def claim_batch(
+            self,
+            user_ids: list[UUID],
+            limit: int = 1,
+            busy_chats: Sequence[tuple[UUID, int]] = (),
+    ) -> list[WorkerMessageModel]:
+        conditions = [self.entity.user_id.in_(user_ids), self.entity.status == WorkerMessageStatus.PENDING]
+        if busy_chats:
+            conditions.append(tuple_(self.entity.user_id, self.entity.chat_id).not_in(busy_chats))
+
+        messages = await self._claim(
+            conditions,
+            values={"status": WorkerMessageStatus.IN_PROGRESS},
+            limit=limit,
+            options=self.options,
+        )
+
+        return [self.entity_to_model(message) for message in messages]
+
+    async def release_claimed(self, user_ids: list[UUID]) -> int:
+        async with self.session_maker() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(self.entity)
+                    .where(
+                        self.entity.user_id.in_(user_ids),
+                        self.entity.status == WorkerMessageStatus.IN_PROGRESS,
+                    )
+                    .values(status=WorkerMessageStatus.PENDING)
+                    .execution_options(synchronize_session=False)
+                )
+
+        return result.rowcount
+
+    async def fail_queued(self, user_ids: list[UUID]) -> int:
+        async with self.session_maker() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(self.entity)
+                    .where(
+                        self.entity.user_id.in_(user_ids),
+                        self.entity.status.in_([WorkerMessageStatus.PENDING, WorkerMessageStatus.IN_PROGRESS]),
+                    )
+                    .values(status=WorkerMessageStatus.FAILED)
+                    .execution_options(synchronize_session=False)
+                )
+
+        return result.rowcount
+
     async def set_message_status(
             self,
             message_id: UUID,
@@ -5,12 +5,14 @@ from datetime import datetime
 from typing import Type, Optional
 from asyncpg.pgproto.pgproto import UUID as asyncpgUUID
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy.orm import joinedload, InstrumentedAttribute
+from sqlalchemy.orm import joinedload, load_only, raiseload, InstrumentedAttribute
 
 from shared.abstractions.repositories.abstract import CRUDRepositoryInterface
+from shared.abstractions.repositories.pagination import Cursor, Page
+from shared.abstractions.repositories.projection import Projection
 from shared.infrastructure.sqlalchemy.exceptions import NotFoundException
 from sqlalchemy.inspection import inspect as sa_inspect
 
@@ -116,6 +118,24 @@ class AbstractSQLAlchemyRepository[Entity, Model, CreateDTO, UpdateDTO, PK_TYPE]
             except NoResultFound:
                 raise NotFoundException
 
+    async def get_projected(self, obj_id: PK_TYPE, projection: Projection) -> Model:
+        async with self.session_maker() as session:
+            stmt = (
+                select(self.entity)
+                .where(self.entity.id == obj_id)
+                .options(*self._projection_options(projection))
+            )
+            if self._soft_delete:
+                stmt = stmt.where(self.entity.deleted_at.is_(None))
+
+            res = await session.execute(stmt)
+            try:
+                obj = res.unique().scalars().one()
+            except NoResultFound:
+                raise NotFoundException
+
+        return self._from_projection(obj, projection)
+
     async def update(self, obj_id: PK_TYPE, obj: UpdateDTO) -> Model:
         async with self.session_maker() as session:
             async with session.begin():
@@ -167,6 +187,48 @@ class AbstractSQLAlchemyRepository[Entity, Model, CreateDTO, UpdateDTO, PK_TYPE]
 
             return [self.entity_to_model(entity) for entity in objs]
 
+    async def get_page(self, limit: int = 100, after: Cursor | None = None) -> Page[Model]:
+        return await self._get_page(limit, after)
+
+    async def _get_page(self, limit: int, after: Cursor | None, *criteria) -> Page[Model]:
+        """
+        Keyset page over (created_at, id), newest first.
+        `criteria` narrow the listing for subclasses (e.g. by owner).
+        """
+        async with self.session_maker() as session:
+            stmt = (
+                select(self.entity)
+                .where(*criteria)
+                .order_by(self.entity.created_at.desc(), self.entity.id.desc())
+                # one extra row tells whether another page exists
+                .limit(limit + 1)
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(self.entity.created_at, self.entity.id) < tuple_(after.created_at, after.id)
+                )
+            if self._soft_delete:
+                stmt = stmt.where(self.entity.deleted_at.is_(None))
+            if self.options:
+                stmt = stmt.options(*self.options)
+
+            res = await session.execute(stmt)
+
+            if self.options:
+                res = res.unique()
+
+            objs = res.scalars().all()
+
+        next_cursor = None
+        if len(objs) > limit:
+            objs = objs[:limit]
+            next_cursor = Cursor(created_at=objs[-1].created_at, id=objs[-1].id)
+
+        return Page(
+            items=[self.entity_to_model(entity) for entity in objs],
+            next_cursor=next_cursor,
+        )
+
     @abstractmethod
     def entity_to_model(self, entity: Entity) -> Model:
         ...
@@ -175,6 +237,38 @@ class AbstractSQLAlchemyRepository[Entity, Model, CreateDTO, UpdateDTO, PK_TYPE]
     def create_dto_to_entity(self, dto: CreateDTO) -> Entity:
         ...
 
+    def _projection_options(self, projection: Projection, entity=None) -> list:
+        """
+        Loader options fetching only the projected columns and relations.
+        Anything else raises on access instead of silently emitting a lazy load.
+        """
+        entity = entity or self.entity
+        options = [
+            load_only(*(getattr(entity, column) for column in projection.columns), raiseload=True),
+        ]
+        for relation, relation_projection in projection.relations.items():
+            attr_field: InstrumentedAttribute = getattr(entity, relation)
+            related_entity = attr_field.comparator.prop.mapper.entity
+            options.append(
+                joinedload(attr_field).options(*self._projection_options(relation_projection, related_entity))
+            )
+        options.append(raiseload('*'))
+        return options
+
+    @classmethod
+    def _from_projection(cls, entity, projection: Projection):
+        values = {column: getattr(entity, column) for column in projection.columns}
+        for relation, relation_projection in projection.relations.items():
+            related = getattr(entity, relation)
+            if related is None:
+                values[relation] = None
+            elif isinstance(related, list):
+                values[relation] = [cls._from_projection(x, relation_projection) for x in related]
+            else:
+                values[relation] = cls._from_projection(related, relation_projection)
+
+        return projection.model.model_construct(**values)
+
     # добавь в класс AbstractSQLAlchemyRepository
     @staticmethod
     async def _refresh_all(session, entity) -> None:
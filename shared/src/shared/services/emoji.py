@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
 from shared.abstractions.repositories.emojis import EmojisRepositoryInterface
+from shared.abstractions.repositories.pagination import Cursor, Page
 from shared.abstractions.services.emoji import EmojiServiceInterface
 from shared.domain.dto.emoji import CreateEmojiDTO
 from shared.domain.models.emoji import Emoji
@@ -12,8 +13,8 @@ from shared.domain.models.emoji import Emoji
 class EmojiService(EmojiServiceInterface):
     emoji_repository: EmojisRepositoryInterface
 
-    async def get_all_emojis(self) -> List[Emoji]:
-        return await self.emoji_repository.get_all()
+    async def get_all_emojis(self, limit: int = 100, after: Optional[Cursor] = None) -> Page[Emoji]:
+        return await self.emoji_repository.get_page(limit=limit, after=after)
 
     async def create_emoji(self, emoji: CreateEmojiDTO) -> UUID:
         return await self.emoji_repository.create(emoji)
@@ -1,16 +1,27 @@
+import asyncio
+import hashlib
 import logging
 import os
+import time
+from concurrent.futures import Executor
 from dataclasses import field, dataclass
 from pathlib import Path
-from typing import Annotated
+from typing import Optional
 from uuid import uuid4
 
 import aiofiles
 
-from shared.abstractions.services import UploadServiceInterface
+from shared.abstractions.services import UploadServiceInterface, UploadedFile, AsyncReadable
+from .exceptions import FileTooLargeException
+from .previews import render_previews, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, PREVIEW_EXTENSION
 
 logger = logging.getLogger(__name__)
 
+# previews seen on disk, shared by every service instance of the process; names are content-addressed,
+# so an entry only goes stale when the garbage collector removes the file
+_known_previews: set[str] = set()
+KNOWN_PREVIEWS_LIMIT = 100_000
+
 
 @dataclass
 class UploadService(UploadServiceInterface):
@@ -18,37 +29,228 @@ class UploadService(UploadServiceInterface):
     images_dir: str = field(default="/app/upload")
 
     files_endpoint: str = 'upload'
+    # uploads in progress, moved into place once hashed
+    incoming_dir: str = '.incoming'
+
+    chunk_size: int = 1024 * 1024
+    # bytes, None accepts any size
+    max_file_size: Optional[int] = None
+
+    # longest side of the WebP previews rendered next to every image and video
+    preview_sizes: tuple[int, ...] = (256, 1024)
+    # previews are rendered only when there is a pool to render them in
+    preview_pool: Optional[Executor] = None
 
     @staticmethod
     def get_extension(filename: str) -> str:
         return filename.split('.')[-1]
 
-    def get_file_url(self, name: str) -> str:
+    def get_file_url(self, name: str, size: Optional[int] = None) -> str:
+        if size is not None:
+            name = self._get_preview(name, size) or name
+
         return f'{self.public_backend_base_url}/{self.files_endpoint}/{name}'
 
+    def get_filename(self, reference: str) -> str:
+        name = reference
+        if "://" in reference:
+            # the host part may have changed since the URL was stored
+            _, _, name = reference.partition(f'/{self.files_endpoint}/')
+
+        return self._get_preview_original(name) or name
+
     async def upload(self, file: bytes, extension: str) -> str:
-        new_filename, new_filepath = self._get_new_file_path(extension)
+        filename = self._get_blob_name(hashlib.sha256(file).hexdigest(), extension)
+        if self._reuse_blob(filename):
+            await self._render_previews(filename)
+            return filename
+
+        temp_path = self._get_temp_path()
         try:
-            async with aiofiles.open(new_filepath, "wb") as f:
+            async with aiofiles.open(temp_path, "wb") as f:
                 await f.write(file)
 
-            return new_filename
+            self._store_blob(temp_path, filename)
         except Exception:
+            self._discard(temp_path)
             logger.error("There was an error while uploading file", exc_info=True)
             raise
 
-    def get_file_path(self, filename: str) -> str:
-        return os.path.join(self.images_dir, filename)
+        await self._render_previews(filename)
+        return filename
 
-    def _get_new_file_path(
+    async def upload_stream(
             self,
+            stream: AsyncReadable,
             extension: str,
-    ) -> tuple[
-        Annotated[str, 'filename'],
-        Annotated[str, 'file path'],
-    ]:
-        new_filename = f"{uuid4()}.{extension}"
-        return new_filename, self.get_file_path(new_filename)
+            max_size: Optional[int] = None,
+    ) -> UploadedFile:
+        max_size = max_size or self.max_file_size
+        temp_path = self._get_temp_path()
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                while chunk := await stream.read(self.chunk_size):
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise FileTooLargeException(max_size)
+
+                    digest.update(chunk)
+                    await f.write(chunk)
+
+            # the name is only known once the whole file was hashed
+            filename = self._get_blob_name(digest.hexdigest(), extension)
+            self._store_blob(temp_path, filename)
+        except Exception as e:
+            # never leave a partial file behind
+            self._discard(temp_path)
+
+            if not isinstance(e, FileTooLargeException):
+                logger.error("There was an error while uploading file", exc_info=True)
+            raise
+
+        await self._render_previews(filename)
+        return UploadedFile(filename=filename, size=size, sha256=digest.hexdigest())
+
+    def get_file_path(self, filename: str) -> str:
+        root = os.path.realpath(self.images_dir)
+        path = os.path.realpath(os.path.join(root, filename))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError(f"{filename} is outside of the upload directory")
+
+        return path
+
+    async def collect_garbage(self, references: set[str], grace: float) -> int:
+        return await asyncio.to_thread(self._collect_garbage, references, grace)
+
+    def _collect_garbage(self, references: set[str], grace: float) -> int:
+        # anything touched within the grace period may belong to a row not committed yet
+        deadline = time.time() - grace
+        removed = 0
+        for directory, _, names in os.walk(self.images_dir):
+            for name in names:
+                path = os.path.join(directory, name)
+                filename = Path(os.path.relpath(path, self.images_dir)).as_posix()
+                if filename in references or self._get_preview_original(filename) in references:
+                    continue
+
+                try:
+                    if os.stat(path).st_mtime > deadline:
+                        continue
+                    _known_previews.discard(filename)
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+
+                removed += 1
+
+        return removed
+
+    async def _render_previews(self, filename: str) -> None:
+        extension = self.get_extension(filename).lower()
+        if self.preview_pool is None or extension not in IMAGE_EXTENSIONS | VIDEO_EXTENSIONS:
+            return
+
+        targets = {
+            size: self.get_file_path(self._get_preview_name(filename, size))
+            for size in self.preview_sizes
+        }
+        missing = {size: path for size, path in targets.items() if not os.path.isfile(path)}
+        if not missing:
+            return
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self.preview_pool,
+                render_previews,
+                self.get_file_path(filename),
+                missing,
+                extension in VIDEO_EXTENSIONS,
+            )
+        except Exception:
+            # the original is stored, pages fall back to it
+            logger.warning(f"Could not render previews of {filename}", exc_info=True)
+            return
+
+        self._remember_previews([self._get_preview_name(filename, size) for size in missing])
+
+    def _get_preview(self, filename: str, size: int) -> Optional[str]:
+        """Smallest rendered preview at least `size` px on each side."""
+        if self.get_extension(filename).lower() not in IMAGE_EXTENSIONS | VIDEO_EXTENSIONS:
+            return None
+
+        for preview_size in sorted(self.preview_sizes):
+            if preview_size < size:
+                continue
+
+            preview = self._get_preview_name(filename, preview_size)
+            # listings ask for the same previews on every request, the disk is only checked once
+            if preview in _known_previews:
+                return preview
+
+            if os.path.isfile(self.get_file_path(preview)):
+                self._remember_previews([preview])
+                return preview
+
+        return None
+
+    @staticmethod
+    def _remember_previews(previews: list[str]) -> None:
+        if len(_known_previews) + len(previews) > KNOWN_PREVIEWS_LIMIT:
+            _known_previews.clear()
+
+        _known_previews.update(previews)
+
+    @staticmethod
+    def _get_preview_name(filename: str, size: int) -> str:
+        return f"{filename}.{size}.{PREVIEW_EXTENSION}"
+
+    def _get_preview_original(self, filename: str) -> Optional[str]:
+        original, _, suffix = filename.rpartition(".")
+        original, _, size = original.rpartition(".")
+        if suffix != PREVIEW_EXTENSION or not size.isdigit() or int(size) not in self.preview_sizes:
+            return None
+
+        return original
+
+    @staticmethod
+    def _get_blob_name(digest: str, extension: str) -> str:
+        # two levels of fan-out keep every directory small
+        return f"{digest[:2]}/{digest[2:4]}/{digest}.{extension}"
+
+    def _get_temp_path(self) -> str:
+        incoming = os.path.join(self.images_dir, self.incoming_dir)
+        os.makedirs(incoming, exist_ok=True)
+        return os.path.join(incoming, f"{uuid4()}.part")
+
+    def _reuse_blob(self, filename: str) -> bool:
+        path = self.get_file_path(filename)
+        try:
+            # a fresh mtime keeps the garbage collector off a blob that is about to be referenced again
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def _store_blob(self, temp_path: str, filename: str) -> None:
+        if self._reuse_blob(filename):
+            self._discard(temp_path)
+            return
+
+        path = self.get_file_path(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # same file system, so concurrent writers of the same content just replace each other
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
 
     async def initialize(self) -> None:
         images = Path(self.images_dir)
@@ -0,0 +1,4 @@
+class FileTooLargeException(Exception):
+    def __init__(self, max_size: int):
+        super().__init__(f"File is larger than {max_size} bytes")
+        self.max_size = max_size
@@ -0,0 +1,62 @@
+import io
+import os
+import subprocess
+from uuid import uuid4
+
+IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "gif", "bmp", "tiff"})
+VIDEO_EXTENSIONS = frozenset({"mp4", "mov", "m4v", "webm", "mkv", "avi"})
+
+PREVIEW_EXTENSION = "webp"
+
+
+def render_previews(source: str, targets: dict[int, str], is_video: bool) -> None:
+    """
+    Runs in a worker process: writes a WebP no larger than `size` px on each side
+    for every `targets` item. Videos are previewed by their first frame.
+    """
+    # imported here, so services that never render previews don't need Pillow
+    from PIL import Image, ImageOps
+
+    if is_video:
+        frame = _grab_frame(source)
+        image = Image.open(io.BytesIO(frame))
+    else:
+        image = Image.open(source)
+
+    with image:
+        # only the first frame of animations, and camera rotation applied
+        image.seek(0)
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+
+        for size, target in sorted(targets.items(), reverse=True):
+            preview = image.copy()
+            preview.thumbnail((size, size))
+
+            # readers never see a half-written preview
+            temp_path = f"{target}.{uuid4()}.part"
+            try:
+                preview.save(temp_path, format="WEBP", quality=80, method=4)
+                os.replace(temp_path, target)
+            except Exception:
+                try:
+                    os.remove(temp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+
+
+def _grab_frame(source: str) -> bytes:
+    result = subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-i", source,
+            "-frames:v", "1",
+            "-f", "image2pipe", "-vcodec", "png", "-",
+        ],
+        capture_output=True,
+        check=True,
+        timeout=60,
+    )
+    return result.stdout
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
@@ -9,6 +10,8 @@ from shared.settings import AbstractSettings
 class UploadSettings(AbstractSettings):
     host_upload_dir: str = Field('/Users/daria/PycharmProjects/ai_assistant/upload/', alias='HOST_UPLOAD_DIR')
     app_upload_dir: str = Field('/app/upload/')
+    # bytes, unset accepts any size; Telegram user accounts send files of up to 2 GB (4 GB with Premium)
+    max_file_size: Optional[int] = Field(default=None)
 
     model_config = SettingsConfigDict(
         extra="ignore",
@@ -1,22 +1,46 @@
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import AsyncGenerator
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from pydantic import BaseModel
 
 from shared.abstractions.services.watcher_client import WatcherClientInterface
-from shared.domain.requests import MessageSentRequest, RequestProcessingStartedRequest, PublicationStartedRequest, RequestStatusChangedRequest
+from shared.abstractions.singleton import Singleton
+from shared.domain.requests import (
+    MessageSentRequest,
+    RequestProcessingStartedRequest,
+    PublicationStartedRequest,
+    RequestStatusChangedRequest,
+    WatcherBatchRequest,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
-class WatcherClient(WatcherClientInterface):
+class WatcherClient(
+    WatcherClientInterface,
+    Singleton,
+):
     base_url: str
 
     publication_started_endpoint: str = "/watch/publication"
     request_processing_started_endpoint: str = "/watch/request"
-    message_sent_endpoint: str = "/watch/message"
-    request_status_endpoint: str = "/watch/request-status"
+    batch_endpoint: str = "/watch/batch"
+
+    # message and status reports are buffered and sent together
+    batch_size: int = 100
+    flush_interval: float = 1
+    # per kind of report; while the watcher is unreachable the oldest ones are dropped past it
+    max_buffered: int = 10000
+
+    _client: Optional[AsyncClient] = field(default=None, init=False)
+    _messages: list[MessageSentRequest] = field(default_factory=list, init=False)
+    _request_statuses: list[RequestStatusChangedRequest] = field(default_factory=list, init=False)
+    _flush_task: Optional[asyncio.Task] = field(default=None, init=False)
+    _flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
 
     async def report_publication_started(self, request: PublicationStartedRequest) -> None:
         await self._send_post_request(
@@ -31,25 +55,90 @@ class WatcherClient(WatcherClientInterface):
         )
 
     async def report_message_sent(self, request: MessageSentRequest) -> None:
-        await self._send_post_request(
-            request=request,
-            endpoint=self.message_sent_endpoint,
-        )
+        self._messages.append(request)
+        self._trim(self._messages, "message reports")
+        await self._schedule_flush()
 
     async def report_request_status_changed(self, request: RequestStatusChangedRequest) -> None:
-        await self._send_post_request(
-            request=request,
-            endpoint=self.request_status_endpoint,
-        )
+        self._request_statuses.append(request)
+        self._trim(self._request_statuses, "status reports")
+        await self._schedule_flush()
+
+    async def report_requests_status_changed(self, requests: list[RequestStatusChangedRequest]) -> None:
+        if not requests:
+            return
 
-    async def _send_post_request(self, request: BaseModel, endpoint: str) -> None:
-        async with self._get_client() as client:
-            await client.post(
-                url=endpoint,
-                json=request.model_dump(mode="json"),
+        self._request_statuses.extend(requests)
+        self._trim(self._request_statuses, "status reports")
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._messages and not self._request_statuses:
+                return
+
+            batch = WatcherBatchRequest(
+                messages=self._messages,
+                request_statuses=self._request_statuses,
             )
+            self._messages, self._request_statuses = [], []
+
+            try:
+                response = await self._send_post_request(
+                    request=batch,
+                    endpoint=self.batch_endpoint,
+                )
+                response.raise_for_status()
+            except Exception:
+                logger.error(
+                    f"Failed to report batch of {len(batch.messages)} messages "
+                    f"and {len(batch.request_statuses)} statuses, will retry",
+                    exc_info=True,
+                )
+                # put the reports back in front of anything buffered meanwhile
+                self._messages[:0] = batch.messages
+                self._request_statuses[:0] = batch.request_statuses
+                self._trim(self._messages, "message reports")
+                self._trim(self._request_statuses, "status reports")
+                self._start_delayed_flush()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _trim(self, reports: list, kind: str) -> None:
+        overflow = len(reports) - self.max_buffered
+        if overflow > 0:
+            del reports[:overflow]
+            logger.warning(f"Watcher report buffer is full, dropped {overflow} oldest {kind}")
+
+    async def _schedule_flush(self) -> None:
+        if len(self._messages) + len(self._request_statuses) >= self.batch_size:
+            await self.flush()
+        else:
+            self._start_delayed_flush()
+
+    def _start_delayed_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def _send_post_request(self, request: BaseModel, endpoint: str) -> Response:
+        return await self._get_client().post(
+            url=endpoint,
+            json=request.model_dump(mode="json"),
+        )
 
-    @asynccontextmanager
-    async def _get_client(self) -> AsyncGenerator[AsyncClient, None]:
-        async with AsyncClient(base_url=self.base_url) as client:
-            yield client
+    def _get_client(self) -> AsyncClient:
+        # one pooled client for the process lifetime keeps connections to the watcher alive
+        if self._client is None:
+            self._client = AsyncClient(base_url=self.base_url)
+        return self._client
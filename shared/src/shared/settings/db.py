@@ -18,3 +18,11 @@ class DBSettings(AbstractSettings):
             f"postgresql+asyncpg://{self.user}:{self.password.get_secret_value()}"
             f"@{self.host}:{self.port}/{self.name}"
         )
+
+    @property
+    def dsn(self) -> str:
+        # Plain libpq DSN for raw asyncpg connections (e.g. LISTEN/NOTIFY)
+        return (
+            f"postgresql://{self.user}:{self.password.get_secret_value()}"
+            f"@{self.host}:{self.port}/{self.name}"
+        )
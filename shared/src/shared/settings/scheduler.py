@@ -4,4 +4,13 @@ from shared.settings import AbstractSettings
 
 
 class SchedulerSettings(AbstractSettings):
-    job_store_sqlite_path: str = Field(default='/app/jobs.sqlite')
+    # schedules are wall-clock times in this timezone
+    timezone: str = Field(default='Europe/Moscow')
+    # upper bound on how long the due-run loop sleeps without a notification
+    poll_interval: float = Field(default=30)
+    claim_batch_size: int = Field(default=100)
+    # runs claimed later than this after their due time are missed rather than published
+    single_misfire_grace: int = Field(default=60)
+    daily_misfire_grace: int = Field(default=3600)
+    # a claimed one-off run whose replica died is claimed again after this many seconds
+    single_claim_lease: int = Field(default=600)
@@ -1,8 +1,26 @@
+from typing import Optional
+
+from pydantic import Field, model_validator
+
 from shared.domain.models.user import UserWithSessionString
 from shared.settings import AbstractSettings
 
 
 class WorkerSettings(AbstractSettings):
-    user: UserWithSessionString
+    # a worker runs either one account (`user`) or a shard of them (`users`)
+    user: Optional[UserWithSessionString] = None
+    users: list[UserWithSessionString] = Field(default_factory=list)
     api_id: int
     api_hash: str
+    # idle seconds before the worker exits, chosen by the worker-manager per account
+    shutdown_delay: int = Field(default=60)
+
+    @model_validator(mode="after")
+    def _check_accounts(self) -> "WorkerSettings":
+        if self.user is None and not self.users:
+            raise ValueError("either `user` or `users` has to be set")
+        return self
+
+    @property
+    def accounts(self) -> list[UserWithSessionString]:
+        return self.users or [self.user]
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from shared.domain.requests import PublicationStartedRequest, RequestProcessingStartedRequest, MessageSentRequest, RequestStatusChangedRequest
+from shared.domain.requests import PublicationStartedRequest, RequestProcessingStartedRequest, MessageSentRequest, RequestStatusChangedRequest, WatcherBatchRequest
 
 
 class WatcherInterface(
@@ -13,3 +13,7 @@ class WatcherInterface(
     @abstractmethod
     async def register_request_status_change(self, request: RequestStatusChangedRequest) -> None:
         ...
+
+    @abstractmethod
+    async def register_batch(self, request: WatcherBatchRequest) -> None:
+        ...
@@ -1,7 +1,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
-from shared.domain.requests import PublicationStartedRequest, RequestProcessingStartedRequest, MessageSentRequest, RequestStatusChangedRequest
+from shared.domain.requests import PublicationStartedRequest, RequestProcessingStartedRequest, MessageSentRequest, RequestStatusChangedRequest, WatcherBatchRequest
 
 from dependencies.services.watcher import get_watcher
 from services.exceptions import RepeatedRegistrationException
@@ -35,3 +35,16 @@ async def request_status(report: RequestStatusChangedRequest):
             status_code=400,
             detail=str(e),
         )
+
+
+@router.post('/batch')
+async def batch(report: WatcherBatchRequest):
+    watcher = get_watcher()
+    try:
+        await watcher.register_batch(report)
+    except Exception as e:
+        logger.error(e)
+        raise HTTPException(
+            status_code=400,
+            detail=str(e),
+        )
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from shared.abstractions.repositories import PostToPublishRepositoryInterface, SendPostRequestRepositoryInterface
 from shared.domain.dto import UpdatePostToPublishDTO
-from shared.domain.enums import SendPostRequestStatus, PublicationStatus
+from shared.domain.enums import PublicationStatus
 from shared.domain.models import SendingRequest, SendPostRequest
 
 from abstractions.services.publication import PublicationServiceInterface
@@ -17,33 +17,30 @@ class PublicationService(PublicationServiceInterface):
         if not isinstance(request, SendPostRequest):
             return
 
-        requests = await self.posts_request_repository.get_requests_from_same_publication(request.id)
-        statuses = {r.status for r in requests}
+        # Counters are kept up to date by a DB trigger on send_post_requests, no need to load siblings
+        counters = await self.post_to_publish_repository.get_request_counters(request.publication_id)
 
-        # Case 1: all sent -> POSTED (existing behavior)
-        if statuses and statuses.issubset({SendPostRequestStatus.SENT}):
-            await self.post_to_publish_repository.update(
-                obj_id=request.publication_id,
-                obj=UpdatePostToPublishDTO(status=PublicationStatus.POSTED),
-            )
+        # Some requests are still PLANNED or IN_PROGRESS
+        if not counters.total or counters.planned:
+            return
+
+        # Nothing SENT and some CANCELLED: the publication keeps its status
+        if counters.cancelled and not counters.sent:
             return
 
-        # Case 2: all terminal (no PLANNED or IN_PROGRESS)
-        if not (SendPostRequestStatus.PLANNED in statuses or SendPostRequestStatus.IN_PROGRESS in statuses):
-            # If any were SENT and others failed/stale -> FAILED
-            if SendPostRequestStatus.SENT in statuses:
-                await self.post_to_publish_repository.update(
-                    obj_id=request.publication_id,
-                    obj=UpdatePostToPublishDTO(status=PublicationStatus.FAILED),
-                )
-                return
-
-            # If none SENT and all terminal non-sent -> STALE (e.g., all FAILED/STALE)
-            if statuses.issubset({SendPostRequestStatus.FAILED, SendPostRequestStatus.STALE}):
-                await self.post_to_publish_repository.update(
-                    obj_id=request.publication_id,
-                    obj=UpdatePostToPublishDTO(status=PublicationStatus.STALE),
-                )
-                return
+        # Case 1: all sent -> POSTED (existing behavior)
+        if counters.sent == counters.total:
+            status = PublicationStatus.POSTED
+        # Case 2: some were SENT and others failed/stale -> FAILED
+        elif counters.sent:
+            status = PublicationStatus.FAILED
+        # Case 3: none SENT and all terminal non-sent -> STALE (e.g., all FAILED/STALE)
+        else:
+            status = PublicationStatus.STALE
+
+        await self.post_to_publish_repository.update(
+            obj_id=request.publication_id,
+            obj=UpdatePostToPublishDTO(status=status),
+        )
 
         # todo: stories
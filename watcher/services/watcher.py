@@ -4,7 +4,7 @@ from enum import StrEnum
 
 from shared.abstractions.singleton import Singleton
 from shared.domain.enums import WorkerMessageStatus
-from shared.domain.requests import MessageSentRequest, RequestProcessingStartedRequest, PublicationStartedRequest, RequestStatusChangedRequest
+from shared.domain.requests import MessageSentRequest, RequestProcessingStartedRequest, PublicationStartedRequest, RequestStatusChangedRequest, WatcherBatchRequest
 
 from abstractions.services.messages import MessageServiceInterface
 from abstractions.services.publication import PublicationServiceInterface
@@ -44,6 +44,45 @@ class Watcher(
         if sending_request:
             await self.publication_service.register_finished_request(sending_request)
 
+    async def register_batch(self, request: WatcherBatchRequest) -> None:
+        failed = 0
+        for message in {m.message_id: m for m in request.messages}.values():
+            try:
+                await self.register_message(message)
+            except Exception:
+                logger.error(f'Failed to register message {message.message_id}', exc_info=True)
+                failed += 1
+
+        # Siblings share one publication, so re-evaluate each publication once per batch
+        publications = {}
+        for status_change in {r.request_id: r for r in request.request_statuses}.values():
+            # one bad report must not fail the batch, the client would resend all of it
+            try:
+                sending_request = await self.requests_service.get_request(
+                    status_change.request_id,
+                    self._map_publication_type(status_change),
+                )
+            except Exception:
+                logger.error(f'Failed to load request {status_change.request_id}', exc_info=True)
+                failed += 1
+                continue
+
+            if sending_request:
+                publications[sending_request.publication_id] = sending_request
+
+        for sending_request in publications.values():
+            try:
+                await self.publication_service.register_finished_request(sending_request)
+            except Exception:
+                logger.error(f'Failed to update publication {sending_request.publication_id}', exc_info=True)
+                failed += 1
+
+        logger.info(
+            f'Batch registered: {len(request.messages)} messages, '
+            f'{len(request.request_statuses)} status changes over {len(publications)} publications, '
+            f'{failed} failed'
+        )
+
     def _map_publication_type(self, request: RequestStatusChangedRequest):
         # Request carries its type already but helper to keep signature explicit
         return request.type
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 from uuid import UUID
 
 from shared.domain.models import UserWithSessionString
@@ -12,6 +13,12 @@ class WorkerContainer:
     config_path: Path
     restarts: int = 0
     container_id: str = None
+    # hash of the settings the container was started with, ignoring the keep-alive
+    config_hash: Optional[str] = None
+    # found running on startup and not yet checked against the account's current settings
+    adopted: bool = False
+    # accounts the worker sends from, several for a multi-account worker
+    account_ids: set[UUID] = field(default_factory=set)
 
 
 class ContainerManagerInterface(ABC):
@@ -20,7 +27,18 @@ class ContainerManagerInterface(ABC):
         pass
 
     @abstractmethod
-    async def start_container(self, worker_id: UUID, config_path: Path) -> None:
+    async def start_container(
+            self,
+            worker_id: UUID,
+            config_path: Path,
+            config_hash: Optional[str] = None,
+            account_ids: Optional[list[UUID]] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def adopt_running_containers(self) -> int:
+        """Register worker containers left running by a previous manager, returns how many."""
         pass
 
     @abstractmethod
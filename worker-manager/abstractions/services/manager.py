@@ -6,3 +6,13 @@ class AccountManagerInterface(ABC):
     @abstractmethod
     async def send(self, request: SendingRequest):
         ...
+
+    @abstractmethod
+    async def start_prewarming(self) -> None:
+        """Keep starting workers of accounts with sends due soon."""
+        ...
+
+    @abstractmethod
+    async def collect_settings_files(self) -> int:
+        """Remove settings files no running worker uses, returns how many."""
+        ...
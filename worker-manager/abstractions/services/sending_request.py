@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, NoReturn
 
 from shared.domain.models import SendingRequest
 
@@ -9,6 +9,24 @@ class SendingRequestServiceInterface(ABC):
     async def get_queued_message(self) -> Optional[SendingRequest]:
         ...
 
+    @abstractmethod
+    async def claim_queued_messages(self, limit: int) -> list[SendingRequest]:
+        ...
+
+    @abstractmethod
+    async def sweep_stale(self) -> int:
+        """Mark every expired PLANNED request as STALE, returns how many."""
+        ...
+
+    @abstractmethod
+    async def reclaim_expired(self) -> int:
+        """Put requests whose claim lease ran out before they reached a worker back to PLANNED."""
+        ...
+
+    @abstractmethod
+    async def start_sweeping(self) -> NoReturn:
+        ...
+
     @abstractmethod
     async def set_in_progress(self, request: SendingRequest) -> None:
         ...
@@ -1,6 +1,7 @@
+from datetime import timedelta
 from pathlib import Path
 
-from shared.dependencies.repositories import get_user_repository
+from shared.dependencies.repositories import get_user_repository, get_post_request_repository
 from shared.dependencies.repositories.worker_message import get_worker_message_repository
 
 from abstractions.services.manager import AccountManagerInterface
@@ -8,18 +9,34 @@ from dependencies.services.bot_service import get_bot_service
 from dependencies.services.container_manager import get_container_manager
 from dependencies.services.watcher_client import get_watcher_client
 from services.account_manager import AccountManager
+from services.keep_alive import AdaptiveKeepAlive
 from settings import settings
 
 
+# activity history has to outlive the per-call account manager instances
+_keep_alive = AdaptiveKeepAlive(
+    min_keep_alive=settings.worker.keep_alive_min,
+    # without the warm pool every worker exits after the minimal idle time
+    max_keep_alive=settings.worker.keep_alive_max if settings.worker.warm_pool else settings.worker.keep_alive_min,
+)
+
+
 def get_account_manager() -> AccountManagerInterface:
     return AccountManager(
         container_manager=get_container_manager(),
         worker_message_repository=get_worker_message_repository(),
         user_repository=get_user_repository(),
         watcher_client=get_watcher_client(),
+        post_request_repository=get_post_request_repository(),
 
         app_root_config_path=Path(settings.docker.app_root_config_path),
         api_id=settings.worker.api_id,
         api_hash=settings.worker.api_hash,
-        bot_service=get_bot_service()
+        bot_service=get_bot_service(),
+
+        worker_shards=settings.worker.shards,
+        keep_alive=_keep_alive,
+        prewarm_ahead=timedelta(seconds=settings.worker.prewarm_ahead),
+        prewarm_interval=settings.worker.prewarm_interval,
+        publication_sender_id=settings.worker.publication_sender_id,
     )
@@ -1,11 +1,20 @@
+from shared.dependencies.services.notifications import get_notification_listener
+from shared.infrastructure.main_db.notifications import NotificationChannel
+
 from abstractions.services.sending_consumer import SendingConsumerInterface
 from dependencies.services.account_manager import get_account_manager
 from dependencies.services.sending_request import get_sending_request_service
 from services.sending_consumer import SendingConsumer
+from settings import settings
 
 
 def get_consumer() -> SendingConsumerInterface:
     return SendingConsumer(
         account_manager=get_account_manager(),
         sending_request_service=get_sending_request_service(),
+        notifications=get_notification_listener(
+            dsn=settings.db.dsn,
+            channel=NotificationChannel.SEND_POST_REQUESTS,
+        ),
+        batch_size=settings.worker.claim_batch_size,
     )
@@ -13,4 +13,6 @@ def get_sending_request_service() -> SendingRequestServiceInterface:
         post_request_repository=get_post_request_repository(),
         stale_threshold=timedelta(minutes=settings.worker.stale_threshold_minutes),
         watcher_client=get_watcher_client(),
+        stale_sweep_interval=settings.worker.stale_sweep_interval,
+        claim_lease=timedelta(minutes=settings.worker.claim_lease_minutes),
     )
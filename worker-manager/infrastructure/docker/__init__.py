@@ -1,8 +1,10 @@
+import asyncio
+import json
 from asyncio import sleep
 from dataclasses import dataclass, field
 from logging import getLogger
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
 from aiodocker import Docker
@@ -13,6 +15,16 @@ from abstractions.services.container_manager import ContainerManagerInterface, W
 
 logger = getLogger(__name__)
 
+WORKER_ROLE_LABEL = "ai-assistant.role"
+# the account id, or the shard id of a multi-account worker
+ACCOUNT_ID_LABEL = "ai-assistant.account-id"
+ACCOUNT_IDS_LABEL = "ai-assistant.account-ids"
+CONFIG_HASH_LABEL = "ai-assistant.config-hash"
+CONFIG_FILE_LABEL = "ai-assistant.config-file"
+
+# events after which a worker container can no longer be relied on
+TERMINAL_EVENTS = {"die", "oom", "health_status: unhealthy"}
+
 
 @dataclass
 class AsyncDockerAPIRepository(
@@ -35,16 +47,74 @@ class AsyncDockerAPIRepository(
 
     max_restarts: int = 3
 
+    env_file: Path = Path(".env")
+
     _containers: dict[UUID, WorkerContainer] = field(default_factory=dict)
+    # the part of the container spec shared by all workers, built once
+    _base_config: Optional[dict[str, Any]] = None
 
-    container_watcher_delay: float = 5
+    # full reconciliation only backs up the events stream, so it can be rare
+    container_watcher_delay: float = 60
+    events_resubscribe_delay: float = 1
 
     async def start_watching(self) -> None:
         logger.info(f"Starting container watcher, {id(self)}")
+        await asyncio.gather(self._watch_events(), self._reconcile_periodically())
+
+    async def _reconcile_periodically(self) -> None:
         while True:
-            logger.info(f"Refreshing containers!")
-            await self.refresh_containers()
             await sleep(self.container_watcher_delay)
+            logger.info(f"Refreshing containers!")
+            try:
+                await self.refresh_containers()
+            except Exception:
+                logger.error("Failed to refresh containers", exc_info=True)
+
+    async def _watch_events(self) -> None:
+        filters = json.dumps({
+            "type": ["container"],
+            "event": ["die", "oom", "health_status"],
+            "label": [f"{WORKER_ROLE_LABEL}=worker"],
+        })
+        while True:
+            subscriber = self.client.events.subscribe(filters=filters)
+            try:
+                while True:
+                    event = await subscriber.get()
+                    if event is None:
+                        break
+                    self._on_event(event)
+            except Exception:
+                logger.error("Docker events stream failed", exc_info=True)
+            finally:
+                await self.client.events.stop()
+
+            # events might have been missed while the stream was down
+            logger.info("Docker events stream closed, resubscribing")
+            try:
+                await self.refresh_containers()
+            except Exception:
+                logger.error("Failed to refresh containers", exc_info=True)
+            await sleep(self.events_resubscribe_delay)
+
+    def _on_event(self, event: dict) -> None:
+        actor = event.get("Actor", {})
+        action = event.get("Action")
+        if action not in TERMINAL_EVENTS:
+            return
+
+        try:
+            worker_id = UUID(actor.get("Attributes", {}).get(ACCOUNT_ID_LABEL))
+        except (TypeError, ValueError):
+            return
+
+        worker = self._containers.get(worker_id)
+        # the event may belong to a container that has already been replaced
+        if worker is None or worker.container_id != actor.get("ID"):
+            return
+
+        logger.info(f"Container {worker_id} got '{action}', clean up...")
+        del self._containers[worker_id]
 
     async def check_for_active_worker(self, user_id: UUID) -> bool:
         return user_id in self._containers
@@ -53,17 +123,66 @@ class AsyncDockerAPIRepository(
         return self._containers.get(worker_id)
 
     async def refresh_containers(self) -> None:
-        to_remove = []
-        for worker_id, worker in self._containers.items():
-            if not await self.check_health(worker_id):
-                logger.info(f"Container {worker_id} is not running, clean up...")
-                to_remove.append(worker_id)
+        # one listing call regardless of how many workers are tracked
+        running = await self.client.containers.list(
+            filters=json.dumps({"label": [f"{WORKER_ROLE_LABEL}=worker"]}),
+        )
+        running_ids = {container.id for container in running}
 
+        to_remove = [
+            worker_id
+            for worker_id, worker in self._containers.items()
+            if worker.container_id not in running_ids
+        ]
         for worker_id in to_remove:
+            logger.info(f"Container {worker_id} is not running, clean up...")
             del self._containers[worker_id]
 
-    async def start_container(self, worker_id: UUID, config_path: Path) -> None:
+    async def adopt_running_containers(self) -> int:
+        running = await self.client.containers.list(
+            filters=json.dumps({"label": [f"{WORKER_ROLE_LABEL}=worker"]}),
+        )
+
+        adopted = 0
+        for container in running:
+            labels = container["Labels"] or {}
+            try:
+                worker_id = UUID(labels[ACCOUNT_ID_LABEL])
+            except (KeyError, ValueError):
+                continue
+
+            if worker_id in self._containers:
+                continue
+
+            self._containers[worker_id] = WorkerContainer(
+                id=worker_id,
+                config_path=self.host_root_config_path / labels.get(CONFIG_FILE_LABEL, ""),
+                container_id=container.id,
+                config_hash=labels.get(CONFIG_HASH_LABEL),
+                adopted=True,
+                account_ids=self._parse_account_ids(labels.get(ACCOUNT_IDS_LABEL)) or {worker_id},
+            )
+            adopted += 1
+
+        logger.info(f"Adopted {adopted} running worker containers")
+        return adopted
+
+    @staticmethod
+    def _parse_account_ids(value: Optional[str]) -> set[UUID]:
+        try:
+            return {UUID(account_id) for account_id in value.split(",") if account_id}
+        except (AttributeError, ValueError):
+            return set()
+
+    async def start_container(
+            self,
+            worker_id: UUID,
+            config_path: Path,
+            config_hash: Optional[str] = None,
+            account_ids: Optional[list[UUID]] = None,
+    ) -> None:
         logger.info(f"Starting container with worker ID {worker_id} and config {config_path}")
+        account_ids = account_ids or [worker_id]
 
         container_name = f"{self.worker_image}-{worker_id}"
         container = await self.client.containers.create_or_replace(
@@ -72,6 +191,8 @@ class AsyncDockerAPIRepository(
                 self.worker_image,
                 config_path,
                 worker_id,
+                config_hash,
+                account_ids,
             )
         )
         await container.start()
@@ -83,36 +204,66 @@ class AsyncDockerAPIRepository(
             id=worker_id,
             config_path=config_path,
             container_id=container.id,
+            config_hash=config_hash,
+            account_ids=set(account_ids),
         )
 
         self._containers[worker_id] = worker
 
         return container.id
 
-    def _get_container_config(self, image: str, config_path: Path, worker_id: UUID) -> dict[str, Any]:
-        env_map = dotenv_values(str('.env'))
-        env_list = [f"{k}={v}" for k, v in env_map.items() if v is not None]
+    def _get_container_config(
+            self,
+            image: str,
+            config_path: Path,
+            worker_id: UUID,
+            config_hash: Optional[str] = None,
+            account_ids: Optional[list[UUID]] = None,
+    ) -> dict[str, Any]:
+        base_config = self._get_base_config(image)
 
         return {
-            "Image": image,
-            "Env": env_list,
+            **base_config,
+            "Labels": {
+                WORKER_ROLE_LABEL: "worker",
+                ACCOUNT_ID_LABEL: str(worker_id),
+                CONFIG_HASH_LABEL: config_hash or "",
+                CONFIG_FILE_LABEL: config_path.name,
+                ACCOUNT_IDS_LABEL: ",".join(str(account_id) for account_id in account_ids or [worker_id]),
+            },
             "HostConfig": {
+                **base_config["HostConfig"],
                 "Binds": [
                     f"{self.host_root_config_path / config_path.name}:{self.config_file_destination}:ro",
                     f"{self.host_upload_dir}:{self.app_upload_dir}"
                 ],
-                # Пример включения docker logging driver (если решим вернуться к fluentd/loki)
-                # "LogConfig": {
-                #     "Type": "loki",
-                #     "Config": {
-                #         "loki-url": "http://loki:3100/loki/api/v1/push",
-                #         "loki-external-labels": "service=worker,container={{.Name}}"
-                #     }
-                # },
-                "NetworkMode": self.network_name,
             },
         }
 
+    def _get_base_config(self, image: str) -> dict[str, Any]:
+        if self._base_config is None or self._base_config["Image"] != image:
+            # the env file only changes with a redeploy, which restarts the manager anyway
+            env_map = dotenv_values(str(self.env_file))
+            env_list = [f"{k}={v}" for k, v in env_map.items() if v is not None]
+
+            self._base_config = {
+                "Image": image,
+                "Env": env_list,
+                "HostConfig": {
+                    # Пример включения docker logging driver (если решим вернуться к fluentd/loki)
+                    # "LogConfig": {
+                    #     "Type": "loki",
+                    #     "Config": {
+                    #         "loki-url": "http://loki:3100/loki/api/v1/push",
+                    #         "loki-external-labels": "service=worker,container={{.Name}}"
+                    #     }
+                    # },
+                    "NetworkMode": self.network_name,
+                },
+            }
+
+        return self._base_config
+
     async def stop_container(self, worker_id: UUID) -> None:
         logger.info(f"Stopping container {worker_id}")
         bot = self._containers.pop(worker_id, None)
@@ -4,8 +4,11 @@ import logging
 from shared.infrastructure.main_db import init_db
 
 from settings import settings
+from dependencies.services.account_manager import get_account_manager
 from dependencies.services.consumer import get_consumer
 from dependencies.services.container_manager import get_container_manager
+from dependencies.services.sending_request import get_sending_request_service
+from dependencies.services.watcher_client import get_watcher_client
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -22,15 +25,28 @@ async def main():
 
     container_manager = get_container_manager()
 
+    # workers that survived a manager restart keep running instead of being recreated
+    await container_manager.adopt_running_containers()
+    await get_account_manager().collect_settings_files()
+
     logger.info("Service initialized, starting...")
 
     try:
-        await asyncio.gather(consumer.execute(), container_manager.start_watching())
+        tasks = [
+            consumer.execute(),
+            container_manager.start_watching(),
+            get_sending_request_service().start_sweeping(),
+        ]
+        if settings.worker.warm_pool:
+            tasks.append(get_account_manager().start_prewarming())
+
+        await asyncio.gather(*tasks)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
         logger.error("Unexpected exception", exc_info=True)
     finally:
+        await get_watcher_client().close()
         logger.info("Service has been successfully shut down")
 
 
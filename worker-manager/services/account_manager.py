@@ -1,14 +1,20 @@
+import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from uuid import UUID, uuid4
+from typing import Optional
+from uuid import UUID, uuid5, NAMESPACE_URL
 
 from shared.abstractions.services.watcher_client import WatcherClientInterface
 from shared.domain.models import SendingRequest
-from shared.abstractions.repositories import UserRepositoryInterface
+from shared.abstractions.repositories import UserRepositoryInterface, SendPostRequestRepositoryInterface
 from shared.abstractions.repositories.worker_message import WorkerMessageRepositoryInterface
 from shared.domain.dto import CreateWorkerMessageDTO
-from shared.domain.models import SendPostRequest, UserWithSessionString
+from shared.domain.models import SendPostRequest, UserWithSessionString, User
 from shared.domain.enums import WorkerMessageType, WorkerMessageStatus
 from shared.settings.worker import WorkerSettings
 
@@ -17,6 +23,7 @@ from abstractions.services.container_manager import ContainerManagerInterface
 from abstractions.services.manager import AccountManagerInterface
 from dependencies.services.bot_service import get_bot_service
 from services.exceptions import UnknownRequestTypeException
+from services.keep_alive import AdaptiveKeepAlive
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +34,23 @@ class AccountManager(AccountManagerInterface):
     user_repository: UserRepositoryInterface
     bot_service: BotServiceInterface
     watcher_client: WatcherClientInterface
+    post_request_repository: SendPostRequestRepositoryInterface
 
     app_root_config_path: Path
     api_id: int
     api_hash: str
 
+    # 0: a container per account, otherwise accounts are hashed into this many multi-account workers
+    worker_shards: int = 0
+
+    keep_alive: AdaptiveKeepAlive = field(default_factory=AdaptiveKeepAlive)
+    prewarm_ahead: timedelta = timedelta(minutes=2)
+    prewarm_interval: float = 30
+    # publications have no send requests before they run, their sends are expected from this account
+    publication_sender_id: Optional[UUID] = None
+    # unreferenced settings files younger than this may still be about to be mounted
+    settings_files_grace: float = 600
+
     async def send(self, request: SendingRequest) -> None:
         if isinstance(request, SendPostRequest):
             await self._send_post(request)
@@ -56,45 +75,151 @@ class AccountManager(AccountManagerInterface):
 
         await self.worker_message_repository.create(worker_message_dto)
 
+        self.keep_alive.record_activity(request.user_id)
         await self.ensure_worker_running(request.user_id)
 
-    async def ensure_worker_running(self, user_id: UUID) -> None:
-        user = await self.user_repository.get(user_id)
+    async def start_prewarming(self) -> None:
+        logger.info("Starting worker prewarming")
+        while True:
+            try:
+                user_ids = await self.post_request_repository.get_upcoming_senders(
+                    until=datetime.now() + self.prewarm_ahead,
+                    publication_sender_id=self.publication_sender_id,
+                )
+                for user_id in user_ids:
+                    # the worker has to stay up until its sends actually arrive
+                    await self.ensure_worker_running(
+                        user_id,
+                        shutdown_delay=int(self.prewarm_ahead.total_seconds()) + self.keep_alive.get(user_id),
+                    )
+            except Exception:
+                logger.error("Failed to prewarm workers", exc_info=True)
+
+            await asyncio.sleep(self.prewarm_interval)
+
+    async def ensure_worker_running(self, user_id: UUID, shutdown_delay: Optional[int] = None) -> None:
+        worker_id = self._worker_id(user_id)
+        container = await self.container_manager.get_container(worker_id)
+        # a warm worker needs no user lookup at all
+        if container is not None and not container.adopted and user_id in container.account_ids:
+            return
 
-        if await self.container_manager.check_for_active_worker(user.id):
+        users = await self._get_worker_accounts(worker_id, user_id)
+        if not users:
+            logger.warning(f"Account {user_id} has no Telegram session, cannot start its worker")
             return
 
-        worker_settings = self._make_worker_settings(user)
-        worker_settings_file = self.settings_to_file(worker_settings)
+        worker_settings = self._make_worker_settings(
+            users,
+            shutdown_delay or max(self.keep_alive.get(user.id) for user in users),
+        )
+        config_hash = self._config_hash(worker_settings)
+
+        if container is not None:
+            # a container left by the previous manager keeps running unless the account's settings changed since
+            if container.config_hash == config_hash:
+                container.adopted = False
+                return
 
-        logger.info(worker_settings.model_dump())
-        logger.info(worker_settings_file)
-        with worker_settings_file.open('rt') as f:
-            logger.info(f.read())
+            logger.info(f"Settings of worker {worker_id} changed, replacing its container")
+
+        worker_settings_file = self.settings_to_file(
+            worker_settings,
+            name=f"shard-{worker_id}" if self.worker_shards else None,
+        )
+        # the file holds session strings, only its name goes to the logs
+        logger.info(f"Starting worker {worker_id} with settings {worker_settings_file.name}")
 
         await self.container_manager.start_container(
-            worker_id=worker_settings.user.id,
+            worker_id=worker_id,
             config_path=worker_settings_file,
+            config_hash=config_hash,
+            account_ids=[user.id for user in users],
         )
 
-    def _make_worker_settings(self, user: UserWithSessionString) -> WorkerSettings:
+        # files of replaced and idled out workers are garbage by now
+        await self.collect_settings_files()
+
+    def _worker_id(self, user_id: UUID) -> UUID:
+        if not self.worker_shards:
+            return user_id
+
+        # stable across restarts, so adopted shard containers are found again
+        return uuid5(NAMESPACE_URL, f"account-worker-shard-{user_id.int % self.worker_shards}")
+
+    async def _get_worker_accounts(self, worker_id: UUID, user_id: UUID) -> list[User]:
+        if not self.worker_shards:
+            return [await self.user_repository.get(user_id)]
+
+        return [user for user in await self.user_repository.get_senders() if self._worker_id(user.id) == worker_id]
+
+    def _make_worker_settings(self, users: list[UserWithSessionString], shutdown_delay: int) -> WorkerSettings:
+        if self.worker_shards:
+            return WorkerSettings(
+                users=users,
+                api_id=self.api_id,
+                api_hash=self.api_hash,
+                shutdown_delay=shutdown_delay,
+            )
+
         return WorkerSettings(
-            user=user,
+            user=users[0],
             api_id=self.api_id,
             api_hash=self.api_hash,
+            shutdown_delay=shutdown_delay,
         )
 
-    def settings_to_file(self, settings: WorkerSettings) -> Path:
-        filename = f"{settings.user.telegram_username}.{uuid4()}.json"
-        file_path = self.app_root_config_path / filename
+    @staticmethod
+    def _config_hash(settings: WorkerSettings) -> str:
+        # the keep-alive only changes how long the worker idles, not what it runs as
+        return hashlib.sha256(
+            settings.model_dump_json(exclude={"shutdown_delay"}).encode()
+        ).hexdigest()
 
-        if isinstance(settings, WorkerSettings):
-            structured_settings = settings.model_dump_json(
-                indent=4,
-            )
-            with file_path.open('wt') as f:
-                f.write(structured_settings)
-        else:
+    def settings_to_file(self, settings: WorkerSettings, name: Optional[str] = None) -> Path:
+        if not isinstance(settings, WorkerSettings):
             raise Exception('Settings should be of type WorkerSettings')
 
+        structured_settings = settings.model_dump_json(
+            indent=4,
+        )
+        # content-addressed, so unchanged settings map onto the file written last time
+        digest = hashlib.sha256(structured_settings.encode()).hexdigest()[:16]
+        filename = f"{name or settings.user.telegram_username or settings.user.id}.{digest}.json"
+        file_path = self.app_root_config_path / filename
+
+        if file_path.exists():
+            # keeps the reused file out of the garbage collection grace window
+            file_path.touch()
+            return file_path
+
+        # a container must never mount a half-written file
+        tmp_path = file_path.with_suffix(".tmp")
+        with tmp_path.open('wt') as f:
+            f.write(structured_settings)
+        os.replace(tmp_path, file_path)
+
         return file_path
+
+    async def collect_settings_files(self) -> int:
+        referenced = {
+            container.config_path.name
+            for container in await self.container_manager.get_running_containers()
+        }
+        threshold = time.time() - self.settings_files_grace
+
+        removed = 0
+        for file_path in self.app_root_config_path.glob("*.json"):
+            if file_path.name in referenced:
+                continue
+            try:
+                if file_path.stat().st_mtime > threshold:
+                    continue
+                file_path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+
+        if removed:
+            logger.info(f"Removed {removed} unused worker settings files")
+        return removed
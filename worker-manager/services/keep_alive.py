@@ -0,0 +1,51 @@
+import time
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass
+class AdaptiveKeepAlive:
+    """
+    Idle keep-alive per account, learned from the gaps between its bursts of work.
+
+    An account that gets work every few minutes keeps its worker a bit longer than
+    its usual gap, so the next burst finds it warm. Accounts whose gaps exceed
+    `max_keep_alive` would hold a container for nothing and get `min_keep_alive`.
+    """
+    min_keep_alive: int = 60
+    max_keep_alive: int = 1800
+    # gaps shorter than this belong to the same burst
+    burst_gap: float = 10
+    # weight of the newest gap in the moving average
+    smoothing: float = 0.3
+    margin: float = 1.5
+
+    _last_seen: dict[UUID, float] = field(default_factory=dict, init=False)
+    _average_gap: dict[UUID, float] = field(default_factory=dict, init=False)
+
+    def record_activity(self, user_id: UUID) -> None:
+        now = time.monotonic()
+        last_seen = self._last_seen.get(user_id)
+        self._last_seen[user_id] = now
+        if last_seen is None:
+            return
+
+        gap = now - last_seen
+        if gap < self.burst_gap:
+            return
+
+        average = self._average_gap.get(user_id)
+        self._average_gap[user_id] = gap if average is None else (
+            self.smoothing * gap + (1 - self.smoothing) * average
+        )
+
+    def get(self, user_id: UUID) -> int:
+        average = self._average_gap.get(user_id)
+        if average is None:
+            return self.min_keep_alive
+
+        keep_alive = average * self.margin
+        if keep_alive > self.max_keep_alive:
+            return self.min_keep_alive
+
+        return max(self.min_keep_alive, int(keep_alive))
@@ -3,6 +3,8 @@ from asyncio import sleep
 from dataclasses import dataclass
 from typing import NoReturn
 
+from shared.abstractions.services.notifications import NotificationListenerInterface
+
 from abstractions.services.manager import AccountManagerInterface
 from abstractions.services.sending_consumer import SendingConsumerInterface
 from abstractions.services.sending_request import SendingRequestServiceInterface
@@ -14,24 +16,27 @@ logger = logging.getLogger(__name__)
 class SendingConsumer(SendingConsumerInterface):
     account_manager: AccountManagerInterface
     sending_request_service: SendingRequestServiceInterface
+    notifications: NotificationListenerInterface
 
+    batch_size: int = 50
     idle_delay: float = 5
-    global_delay: float = 5
+    global_delay: float = 0
 
     async def execute(self) -> NoReturn:
         while True:
-            message_to_send = await self.sending_request_service.get_queued_message()
-            if message_to_send is None:
-                await sleep(self.idle_delay)
+            messages_to_send = await self.sending_request_service.claim_queued_messages(self.batch_size)
+            if not messages_to_send:
+                # woken up by NOTIFY on send_post_requests inserts, idle_delay is the fallback poll
+                await self.notifications.wait(self.idle_delay)
                 continue
 
-            logger.info(f"new message! {message_to_send.id}")
-            await self.sending_request_service.set_in_progress(message_to_send)
+            for message_to_send in messages_to_send:
+                logger.info(f"new message! {message_to_send.id}")
 
-            try:
-                await self.account_manager.send(message_to_send)
-            except Exception as e:
-                logger.error(e, exc_info=True)
-                await self.sending_request_service.set_failed(message_to_send)
+                try:
+                    await self.account_manager.send(message_to_send)
+                except Exception as e:
+                    logger.error(e, exc_info=True)
+                    await self.sending_request_service.set_failed(message_to_send)
 
             await sleep(self.global_delay)
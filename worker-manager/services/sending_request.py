@@ -1,7 +1,8 @@
 import logging
+from asyncio import sleep
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, NoReturn
 
 from shared.abstractions.repositories import SendPostRequestRepositoryInterface
 from shared.domain.dto import UpdateSendPostRequestDTO
@@ -20,58 +21,97 @@ class SendingRequestService(SendingRequestServiceInterface):
     post_request_repository: SendPostRequestRepositoryInterface
     stale_threshold: timedelta = timedelta(hours=1)
     watcher_client: WatcherClientInterface | None = None
+    # how long a claimed request may go without reaching a worker before another replica takes it over
+    claim_lease: timedelta = timedelta(minutes=10)
+
+    stale_sweep_interval: float = 30
+    stale_sweep_batch_size: int = 1000
 
     async def get_queued_message(self) -> Optional[SendingRequest]:
-        
-        # Defense-in-depth: drop stale queued requests (older than 1 hour)
-        # Context: send post requests are created at the intended send time (MSK).
-        # If services were down, very old PLANNED requests could flood out later.
-        # We mark such requests as FAILED and skip them.
-        stale_threshold = self.stale_threshold
+        # stale requests are swept in bulk instead of being skipped one at a time
+        await self.sweep_stale()
+
+        message = await self.post_request_repository.get_queued_message()
+        if message is not None:
+            logger.info(f"Received message {message}")
+        return message
+
+    async def claim_queued_messages(self, limit: int) -> list[SendingRequest]:
+        # Requests come back already IN_PROGRESS, so no other replica can pick them up.
+        # Expired ones are never claimed, the sweep marks them STALE.
+        claimed = await self.post_request_repository.claim_batch(
+            limit,
+            created_after=datetime.now() - self.stale_threshold,
+        )
+
+        if claimed:
+            logger.info(f"Claimed {len(claimed)} requests")
+            if self.watcher_client:
+                await self.watcher_client.report_requests_status_changed([
+                    PostRequestStatusChangedRequest(request_id=message.id)
+                    for message in claimed
+                ])
+
+        return claimed
+
+    async def sweep_stale(self) -> int:
+        # Defense-in-depth: send post requests are created at the intended send time (MSK).
+        # If services were down, very old PLANNED requests must not flood out later.
+        created_before = datetime.now() - self.stale_threshold  # created_at is stored without tz (DB/MSK)
 
+        # leases go first, so requests of a crashed replica that are already too old end up STALE right away
+        await self.reclaim_expired()
+
+        swept = 0
         while True:
-            message = await self.post_request_repository.get_queued_message()
-            if message is None:
-                return None
+            stale_ids = await self.post_request_repository.mark_stale(created_before, self.stale_sweep_batch_size)
+            # lets the watcher finalize publications whose last requests went stale
+            if stale_ids and self.watcher_client:
+                await self.watcher_client.report_requests_status_changed([
+                    PostRequestStatusChangedRequest(request_id=request_id)
+                    for request_id in stale_ids
+                ])
 
-            try:
-                now = datetime.now()  # created_at is stored without tz (DB/MSK)
-                if (now - message.created_at) > stale_threshold:
-                    age = now - message.created_at
-                    logger.warning(
-                        "Marking request %s as STALE at %s (age=%s > %s)",
-                        getattr(message, 'id', None),
-                        now.isoformat(),
-                        age,
-                        stale_threshold,
-                    )
-                    await self.set_stale(message)
-                    # Continue to check next queued message
-                    continue
-            except Exception:
-                # If comparison fails for any reason, fall back to returning the message
-                logger.error("Failed to evaluate staleness for message %s", getattr(message, 'id', None), exc_info=True)
-                return message
+            swept += len(stale_ids)
+            if len(stale_ids) < self.stale_sweep_batch_size:
+                break
 
-            logger.info(f"Received message {message}")
-            return message
+        if swept:
+            logger.warning(f"Marked {swept} requests created before {created_before} as STALE")
+        return swept
 
-    async def set_stale(self, request: SendingRequest) -> None:
-        if isinstance(request, SendPostRequest):
-            dto = UpdateSendPostRequestDTO(
-                status=SendPostRequestStatus.STALE,
-                stale_at=datetime.now(),
-            )
+    async def reclaim_expired(self) -> int:
+        claimed_before = datetime.now() - self.claim_lease
 
-            await self.post_request_repository.update(
-                obj_id=request.id,
-                obj=dto,
+        reclaimed = 0
+        while True:
+            reclaimed_ids = await self.post_request_repository.reclaim_expired(
+                claimed_before,
+                self.stale_sweep_batch_size,
             )
-            # Notify watcher that a child request became terminal to allow publication finalization
-            if self.watcher_client:
-                await self.watcher_client.report_request_status_changed(
-                    PostRequestStatusChangedRequest(request_id=request.id)
-                )
+            if reclaimed_ids and self.watcher_client:
+                await self.watcher_client.report_requests_status_changed([
+                    PostRequestStatusChangedRequest(request_id=request_id)
+                    for request_id in reclaimed_ids
+                ])
+
+            reclaimed += len(reclaimed_ids)
+            if len(reclaimed_ids) < self.stale_sweep_batch_size:
+                break
+
+        if reclaimed:
+            logger.warning(f"Put {reclaimed} requests claimed before {claimed_before} back to PLANNED")
+        return reclaimed
+
+    async def start_sweeping(self) -> NoReturn:
+        logger.info("Starting stale requests sweeper")
+        while True:
+            try:
+                await self.sweep_stale()
+            except Exception:
+                logger.error("Failed to sweep stale requests", exc_info=True)
+
+            await sleep(self.stale_sweep_interval)
 
     async def set_in_progress(self, request: SendingRequest):
         if isinstance(request, SendPostRequest):
@@ -1,3 +1,6 @@
+from typing import Optional
+from uuid import UUID
+
 from pydantic import Field
 from shared.settings import AbstractSettings
 
@@ -7,3 +10,23 @@ class CommonWorkerSettings(AbstractSettings):
     api_hash: str
     # Max age for a queued send request to still be sent (minutes)
     stale_threshold_minutes: int = Field(default=60)
+    # How often expired send requests are marked STALE in bulk (seconds)
+    stale_sweep_interval: int = Field(default=30)
+    # How many send requests a single worker-manager claims per iteration
+    claim_batch_size: int = Field(default=50)
+    # Claimed requests that have not reached a worker after this long are claimed again (minutes)
+    claim_lease_minutes: int = Field(default=10)
+
+    # Multi-account workers: 0 runs a container per account, N hashes accounts into N shared worker processes
+    shards: int = Field(default=0)
+
+    # Warm pool: keep active accounts' workers alive between bursts and start them ahead of schedule
+    warm_pool: bool = Field(default=False)
+    # Bounds of the adaptive idle keep-alive passed to workers (seconds)
+    keep_alive_min: int = Field(default=60)
+    keep_alive_max: int = Field(default=1800)
+    # How far ahead of scheduled sends workers are started (seconds)
+    prewarm_ahead: int = Field(default=120)
+    prewarm_interval: int = Field(default=30)
+    # Account the posts-service publishes from, its worker is prewarmed ahead of due publications
+    publication_sender_id: Optional[UUID] = Field(default=None, alias="SENDER_MANAGER_ID")
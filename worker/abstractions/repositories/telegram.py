@@ -7,6 +7,14 @@ from shared.domain.dto.post_to_publish import MessageEntityDTO
 class TelegramMessagesRepositoryInterface(
     ABC,
 ):
+    @abstractmethod
+    async def connect(self) -> None:
+        ...
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        ...
+
     @abstractmethod
     async def send_message(
             self,
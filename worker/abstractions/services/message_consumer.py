@@ -1,10 +1,18 @@
 from abc import ABC
+from dataclasses import dataclass
 
 from shared.abstractions.services.consumer import ConsumerInterface
 
+from abstractions.services.rate_limiter import RateLimiterInterface
 from abstractions.services.sender import SenderInterface
 
 
+@dataclass
+class SendingAccount:
+    sender: SenderInterface
+    rate_limiter: RateLimiterInterface
+
+
 class MessageConsumerInterface(
     ConsumerInterface[SenderInterface],
     ABC,
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+
+class RateLimiterInterface(ABC):
+    @abstractmethod
+    def chat_delay(self, chat_id: int) -> float:
+        """Seconds until the chat accepts the next message, 0 if it is ready."""
+        ...
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        """Wait for the account's send budget."""
+        ...
+
+    @abstractmethod
+    def on_sent(self, chat_id: int) -> None:
+        ...
+
+    @abstractmethod
+    def on_flood_wait(self, chat_id: int, seconds: int) -> None:
+        ...
+
+    @abstractmethod
+    def on_slow_mode(self, chat_id: int, seconds: int) -> None:
+        ...
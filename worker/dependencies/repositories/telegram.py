@@ -1,11 +1,22 @@
+from uuid import UUID
+
+from shared.domain.models import UserWithSessionString
+
 from abstractions.repositories import TelegramMessagesRepositoryInterface
 from infrastructure.repositories.telegram import TelethonTelegramMessagesRepository
 from settings import settings
 
+# one connected client per account for the whole process
+_repositories: dict[UUID, TelegramMessagesRepositoryInterface] = {}
+
+
+def get_telegram_message_repository(worker: UserWithSessionString) -> TelegramMessagesRepositoryInterface:
+    repository = _repositories.get(worker.id)
+    if repository is None:
+        repository = _repositories[worker.id] = TelethonTelegramMessagesRepository(
+            api_id=settings.api_id,
+            api_hash=settings.api_hash,
+            worker=worker,
+        )
 
-def get_telegram_message_repository() -> TelegramMessagesRepositoryInterface:
-    return TelethonTelegramMessagesRepository(
-        api_id=settings.api_id,
-        api_hash=settings.api_hash,
-        worker=settings.user,
-    )
+    return repository
@@ -1,14 +1,33 @@
 from shared.dependencies.repositories.worker_message import get_worker_message_repository
+from shared.dependencies.services.notifications import get_notification_listener
+from shared.domain.models import UserWithSessionString
+from shared.infrastructure.main_db.notifications import NotificationChannel
 
-from abstractions.services.message_consumer import MessageConsumerInterface
+from abstractions.services.message_consumer import MessageConsumerInterface, SendingAccount
+from dependencies.services.rate_limiter import get_rate_limiter
 from dependencies.services.sender import get_sender
 from dependencies.services.watcher_client import get_watcher_client
 from services.message_consumer import MessageConsumer
+from settings import settings
 
 
-def get_message_consumer() -> MessageConsumerInterface:
+def get_message_consumer(workers: list[UserWithSessionString]) -> MessageConsumerInterface:
     return MessageConsumer(
-        sender=get_sender(),
         worker_messages_repository=get_worker_message_repository(),
         watcher_client=get_watcher_client(),
+        notifications=get_notification_listener(
+            dsn=settings.db.dsn,
+            channel=NotificationChannel.WORKER_MESSAGES,
+            payloads=[str(worker.id) for worker in workers],
+        ),
+        accounts={
+            worker.id: SendingAccount(
+                sender=get_sender(worker),
+                rate_limiter=get_rate_limiter(),
+            )
+            for worker in workers
+        },
+        max_deferral=settings.rate_limit.max_deferral,
+        concurrency=settings.concurrency,
+        shutdown_delay=settings.shutdown_delay,
     )
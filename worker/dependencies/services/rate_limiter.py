@@ -0,0 +1,12 @@
+from abstractions.services.rate_limiter import RateLimiterInterface
+from services.rate_limiter import TokenBucketRateLimiter
+from settings import settings
+
+
+def get_rate_limiter() -> RateLimiterInterface:
+    return TokenBucketRateLimiter(
+        rate=settings.rate_limit.rate,
+        burst=settings.rate_limit.burst,
+        min_rate=settings.rate_limit.min_rate,
+        max_rate=settings.rate_limit.max_rate,
+    )
@@ -1,9 +1,11 @@
+from shared.domain.models import UserWithSessionString
+
 from abstractions.services.sender import SenderInterface
 from dependencies.repositories.telegram import get_telegram_message_repository
 from services.sender import Sender
 
 
-def get_sender() -> SenderInterface:
+def get_sender(worker: UserWithSessionString) -> SenderInterface:
     return Sender(
-        messenger=get_telegram_message_repository(),
+        messenger=get_telegram_message_repository(worker),
     )
@@ -1,11 +1,13 @@
 import logging
 import re
 from asyncio import IncompleteReadError
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional, Any
 
 from shared.domain.dto.post_to_publish import MessageEntityDTO
 from telethon import TelegramClient as Client
+from telethon.errors import FileReferenceExpiredError, MediaEmptyError, FloodWaitError, SlowModeWaitError
 from telethon.sessions import StringSession
 from telethon.tl.functions.channels import JoinChannelRequest
 from telethon.tl.types import (
@@ -22,6 +24,7 @@ from abstractions.repositories import TelegramMessagesRepositoryInterface
 from shared.domain.models import UserWithSessionString
 
 from dependencies.services.upload import get_upload_service
+from services.exceptions import FloodWaitException, SlowModeWaitException
 from settings import settings
 from .exceptions import ChatJoinError, UnhandlableError
 
@@ -29,6 +32,8 @@ logger = logging.getLogger(__name__)
 client_logger = logger.getChild("client")
 client_logger.setLevel(logging.ERROR)
 
+CONTENT_ADDRESSED_NAME = re.compile(r"[0-9a-f]{64}")
+
 
 @dataclass
 class TelethonTelegramMessagesRepository(
@@ -39,29 +44,93 @@ class TelethonTelegramMessagesRepository(
 
     worker: UserWithSessionString
 
+    max_retries: int = 5
+
+    _client: Optional[Client] = field(default=None, init=False)
+    # file version -> media of an already sent message, reused for every next chat
+    _media_cache: dict[tuple, Any] = field(default_factory=dict, init=False)
+
+    async def connect(self) -> None:
+        if not self.api_id or not self.api_hash or not self.worker.session_string:
+            logger.info(
+                f"One of required parameters "
+                f"(api_id={self.api_id}, api_hash={self.api_hash}, "
+                f"worker={self.worker.session_string[:5]}...{self.worker.session_string[-5:]}) "
+                f"is missing, aborting connection"
+            )
+            raise ValueError("api_id, api_hash and session_string are required")
+
+        if self._client is None:
+            self._client = Client(
+                session=StringSession(self.worker.session_string),
+                api_id=self.api_id,
+                api_hash=self.api_hash,
+                base_logger=client_logger,
+                proxy=self.parse_proxy(self.worker.proxy.proxy_string) if self.worker.proxy else None,
+                auto_reconnect=True,
+            )
+
+        if not self._client.is_connected():
+            await self._client.connect()
+            logger.info("Client connected")
+
+    async def disconnect(self) -> None:
+        if self._client is None:
+            return
+
+        try:
+            await self._client.disconnect()
+            logger.info("Client disconnected")
+        except Exception:
+            logger.warning("Error while disconnecting client", exc_info=True)
+        finally:
+            self._client = None
+
+    async def _get_client(self) -> Client:
+        # health check: auto_reconnect covers dropped sockets, this covers a client that gave up
+        await self.connect()
+        return self._client
+
     async def join_chat(self, chat: str | int):
         logger.info(f"Joining chat {chat} with bot {self.worker.telegram_username} ({self.worker.id})")
 
-        client = Client(
-            session=StringSession(self.worker.session_string),
-            api_id=self.api_id,
-            api_hash=self.api_hash,
-            base_logger=client_logger,
-        )
-
-        await client.connect()
+        client = await self._get_client()
         try:
             entity = await client.get_entity(chat)
 
             await client(JoinChannelRequest(entity))  # noqa
-            await client.disconnect()
         except Exception as e:
-            await client.disconnect()
             raise ChatJoinError(
                 f"There is an error joining chat {chat} with bot {self.worker.telegram_username} ({self.worker.id}):"
                 f" {type(e).__name__}: {e}"
             )
 
+    async def _get_media(self, client: Client, media_path: str) -> tuple[Any, Optional[tuple]]:
+        upload_service = get_upload_service()
+        file_path = Path(upload_service.get_file_path(media_path))
+        if not file_path.exists():
+            # upload dir is not mounted into this worker, let Telegram fetch the file by URL
+            return upload_service.get_file_url(media_path), None
+
+        cache_key = self._get_cache_key(media_path, file_path)
+        cached = self._media_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing uploaded media for {media_path}")
+            return cached, cache_key
+
+        logger.info(f"Uploading file {file_path}")
+        return await client.upload_file(file_path), cache_key
+
+    @staticmethod
+    def _get_cache_key(media_path: str, file_path: Path) -> tuple:
+        # content-addressed uploads are named after their sha256 and never change
+        if CONTENT_ADDRESSED_NAME.fullmatch(file_path.name.split('.')[0]):
+            return (media_path,)
+
+        # older uploads: a stat is enough to notice the file was replaced
+        stat = file_path.stat()
+        return media_path, stat.st_size, stat.st_mtime_ns
+
     async def send_message(
             self,
             chat_id: int,
@@ -71,27 +140,9 @@ class TelethonTelegramMessagesRepository(
             reply_to: Optional[int] = None,
             retry: int = 0,
     ) -> int:
-        if not self.api_id or not self.api_hash or not self.worker.session_string:
-            logger.info(
-                f"One of required parameters "
-                f"(api_id={self.api_id}, api_hash={self.api_hash}, "
-                f"worker={self.worker.session_string[:5]}...{self.worker.session_string[-5:]}) "
-                f"is missing, aborting sending message"
-            )
-            raise ValueError("api_id, api_hash and session_string are required")
-
-        client = Client(
-            session=StringSession(self.worker.session_string),
-            api_id=self.api_id,
-            api_hash=self.api_hash,
-            base_logger=client_logger,
-            proxy=self.parse_proxy(self.worker.proxy.proxy_string) if self.worker.proxy else None,
-            auto_reconnect=True,
-        )
-
+        media_key = None
         try:
-            await client.connect()
-            logger.info("Client connected")
+            client = await self._get_client()
 
             sending_args: dict[str, Any] = {
                 "entity": chat_id,
@@ -102,10 +153,7 @@ class TelethonTelegramMessagesRepository(
                 sending_args['reply_to'] = reply_to
 
             if media_path:
-                upload_service = get_upload_service()
-                logger.info(f"Uploading file {media_path}")
-                sending_args['file'] = upload_service.get_file_url(media_path)
-                logger.info(f"File path: {sending_args['file']}")
+                sending_args['file'], media_key = await self._get_media(client, media_path)
 
             if entities:
                 entities_to_send = self._prepare_entities(entities)
@@ -119,22 +167,42 @@ class TelethonTelegramMessagesRepository(
             message = await client.send_message(**sending_args)
             logger.info('Message sent')
 
-            await client.disconnect()
-            logger.info("Client disconnected")
+            if media_key and message.media:
+                self._media_cache[media_key] = message.media
+
             return message.id
+        except FloodWaitError as e:
+            raise FloodWaitException(e.seconds) from e
+        except SlowModeWaitError as e:
+            raise SlowModeWaitException(e.seconds) from e
+        except (FileReferenceExpiredError, MediaEmptyError) as e:
+            if media_key not in self._media_cache or retry > self.max_retries:
+                raise
+
+            # cached media is no longer accepted by Telegram, upload the file again
+            logger.info(f"Cached media for {media_path} expired ({type(e).__name__}), re-uploading")
+            self._media_cache.pop(media_key, None)
+            return await self.send_message(
+                chat_id=chat_id,
+                text=text,
+                entities=entities,
+                media_path=media_path,
+                reply_to=reply_to,
+                retry=retry + 1,
+            )
         except (RuntimeError, IncompleteReadError, ConnectionResetError) as e:
-            try:
-                await client.disconnect()
-            except:
-                pass
+            # drop the broken client, the retry builds and connects a fresh one
+            await self.disconnect()
 
-            if retry > 5:
+            if retry > self.max_retries:
                 logger.error("Cannot connect to Telegram")
                 raise UnhandlableError from e
 
             return await self.send_message(
                 chat_id=chat_id,
                 text=text,
+                entities=entities,
+                media_path=media_path,
                 reply_to=reply_to,
                 retry=retry + 1,
             )
@@ -1,8 +1,11 @@
 import logging
 
+from shared.dependencies.repositories.worker_message import get_worker_message_repository
 from shared.infrastructure.main_db import init_db
 
+from dependencies.repositories.telegram import get_telegram_message_repository
 from dependencies.services.message_consumer import get_message_consumer
+from dependencies.services.watcher_client import get_watcher_client
 from services.exceptions import NoMessagesShutdown
 from settings import settings
 
@@ -16,27 +19,30 @@ logger = logging.getLogger(__name__)
 async def main():
     init_db(settings.db.url)
 
-    # Test Telegram connection before starting consumer
-    logger.info("Testing Telegram connection...")
-    try:
-        from telethon import TelegramClient
-        from telethon.sessions import StringSession
-
-        client = TelegramClient(
-            session=StringSession(settings.user.session_string),
-            api_id=settings.api_id,
-            api_hash=settings.api_hash,
-        )
-
-        await client.connect()
-        logger.info("Telegram connection test successful")
-        await client.disconnect()
-    except Exception as e:
-        logger.error(f"Telegram connection test failed: {e}")
+    # Every client stays connected for the worker's lifetime and is reused for every message of its account
+    logger.info(f"Connecting {len(settings.accounts)} account(s) to Telegram...")
+    workers = []
+    broken = []
+    for worker in settings.accounts:
+        try:
+            await get_telegram_message_repository(worker).connect()
+            workers.append(worker)
+            logger.info(f"Telegram connection of {worker.telegram_username} ({worker.id}) successful")
+        except Exception as e:
+            # one broken session must not take down the other accounts of the shard
+            logger.error(f"Telegram connection of {worker.telegram_username} ({worker.id}) failed: {e}")
+            broken.append(worker.id)
+
+    if broken:
+        # nobody else sends from these accounts, their queue would wait forever
+        failed = await get_worker_message_repository().fail_queued(broken)
+        logger.error(f"Failed {failed} queued message(s) of {len(broken)} account(s) that cannot connect")
+
+    if not workers:
         logger.error("Worker cannot connect to Telegram. Check network, proxy settings, or session validity.")
         exit(1)
 
-    consumer = get_message_consumer()
+    consumer = get_message_consumer(workers)
 
     try:
         await consumer.execute()
@@ -49,6 +55,11 @@ async def main():
     except Exception as e:
         logger.error(e, exc_info=True)
         exit(1)
+    finally:
+        # buffered reports must reach the watcher before the container exits
+        await get_watcher_client().close()
+        for worker in workers:
+            await get_telegram_message_repository(worker).disconnect()
 
 
 if __name__ == '__main__':
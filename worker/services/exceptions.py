@@ -3,3 +3,17 @@ class NoMessagesShutdown(Exception):
 
 class CannotSendMessageException(Exception):
     ...
+
+
+class RateLimitedException(Exception):
+    def __init__(self, seconds: int):
+        super().__init__(f"Rate limited for {seconds}s")
+        self.seconds = seconds
+
+
+class FloodWaitException(RateLimitedException):
+    ...
+
+
+class SlowModeWaitException(RateLimitedException):
+    ...
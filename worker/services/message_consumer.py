@@ -1,71 +1,186 @@
+import asyncio
+import functools
 import logging
-from asyncio import sleep
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import NoReturn
+from uuid import UUID
 
 from shared.abstractions.repositories.worker_message import WorkerMessageRepositoryInterface
+from shared.abstractions.services.notifications import NotificationListenerInterface
 from shared.abstractions.services.watcher_client import WatcherClientInterface
 from shared.domain.dto import UpdateWorkerMessageDTO
 from shared.domain.enums import WorkerMessageStatus
+from shared.domain.models import WorkerMessage
 from shared.domain.requests import MessageSentRequest, PostMessageSentRequest
 
-from abstractions.services.message_consumer import MessageConsumerInterface
-from abstractions.services.sender import SenderInterface
-from services.exceptions import NoMessagesShutdown, CannotSendMessageException
+from abstractions.services.message_consumer import MessageConsumerInterface, SendingAccount
+from services.exceptions import (
+    NoMessagesShutdown,
+    CannotSendMessageException,
+    FloodWaitException,
+    SlowModeWaitException,
+)
 
 logger = logging.getLogger(__name__)
 
 @dataclass
 class MessageConsumer(MessageConsumerInterface):
-    sender: SenderInterface
+    """
+    Every chat of every account gets a lane that sends its messages strictly in claim order.
+    Lanes run concurrently, at most `concurrency` of them sending at once per account,
+    each account through its own client and rate limiter. One claim loop serves all accounts.
+    A chat's next message is only claimed once its lane is done with the previous one,
+    so nothing waits in memory that another worker could not pick up after a restart.
+    A lane waiting out FloodWait or slow mode does not hold a send slot.
+    """
     worker_messages_repository: WorkerMessageRepositoryInterface
     watcher_client: WatcherClientInterface
+    notifications: NotificationListenerInterface
 
-    global_delay: int = 1
+    # accounts this worker sends from; messages of other accounts are never claimed
+    accounts: dict[UUID, SendingAccount]
+
+    concurrency: int = 1
     shutdown_delay: int = 60
+    # messages whose chat is blocked for longer are failed instead of held
+    max_deferral: int = 300
+
+    _slots: dict[UUID, asyncio.Semaphore] = field(init=False)
+    _slot_released: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    # (account, chat) -> the message its lane is sending
+    _lanes: dict[tuple[UUID, int], WorkerMessage] = field(default_factory=dict, init=False)
+    # lanes currently holding a send slot of their account
+    _holding_slot: set[tuple[UUID, int]] = field(default_factory=set, init=False)
+    _lane_tasks: set[asyncio.Task] = field(default_factory=set, init=False)
+
+    def __post_init__(self):
+        self._slots = {user_id: asyncio.Semaphore(self.concurrency) for user_id in self.accounts}
 
     async def execute(self) -> NoReturn:
+        # this worker is the only one sending from its accounts, anything left IN_PROGRESS
+        # was claimed by a previous container that was killed or replaced mid-way
+        released = await self.worker_messages_repository.release_claimed(list(self.accounts))
+        if released:
+            logger.warning(f"Released {released} message(s) left in progress by a previous worker")
+
         to_shutdown = False
         while True:
-            message = await self.worker_messages_repository.get_queued_message()
+            # a message is only claimed for accounts that have a free slot to send it
+            ready = [user_id for user_id, slots in self._slots.items() if not slots.locked()]
+            if not ready:
+                await self._slot_released.wait()
+                self._slot_released.clear()
+                continue
+
+            # set again by any lane that finishes while the claim is running
+            self._slot_released.clear()
+            claimed = await self.worker_messages_repository.claim_batch(ready, busy_chats=list(self._lanes))
+            message = claimed[0] if claimed else None
             logger.info(f"message: {message}")
             if not message:
-                if to_shutdown:
+                if to_shutdown and not self._lanes:
                     raise NoMessagesShutdown
 
-                to_shutdown = True
-                await sleep(self.shutdown_delay)
+                # a finished lane may unblock its chat's next message, so it ends the wait as well
+                notified = asyncio.create_task(self.notifications.wait(self.shutdown_delay))
+                slot_released = asyncio.create_task(self._slot_released.wait())
+                done, pending = await asyncio.wait({notified, slot_released}, return_when=asyncio.FIRST_COMPLETED)
+                for task in pending:
+                    task.cancel()
+
+                # only shut down after a full shutdown_delay passes without new messages for this account
+                to_shutdown = notified in done and not notified.result()
+                continue
+
+            to_shutdown = False
+
+            key = (message.user_id, message.chat_id)
+            # only waits if a deferred lane took the slot back while the claim was running
+            await self._slots[message.user_id].acquire()
+            self._holding_slot.add(key)
+            self._lanes[key] = message
+            task = asyncio.create_task(self._run_lane(key))
+            self._lane_tasks.add(task)
+            task.add_done_callback(functools.partial(self._on_lane_done, key))
+
+    async def _run_lane(self, key: tuple[UUID, int]) -> None:
+        user_id, chat_id = key
+        account = self.accounts[user_id]
+        slots = self._slots[user_id]
+        message = self._lanes[key]
+        # the slot acquired for the message is handed over to the lane
+        while True:
+            delay = account.rate_limiter.chat_delay(chat_id)
+            if delay > self.max_deferral:
+                logger.error(f"Chat {chat_id} is blocked for {delay:.0f}s, failing message {message.id}")
+                await self._set_failed(message)
+                return
+
+            if delay > 0:
+                # other chats keep sending while this one waits
+                self._release(key)
+                logger.info(f"Chat {chat_id} deferred for {delay:.0f}s")
+                await asyncio.sleep(delay)
                 continue
 
+            if key not in self._holding_slot:
+                await slots.acquire()
+                self._holding_slot.add(key)
+
+            await account.rate_limiter.acquire()
+            if await self._process(account, message):
+                return
+
+            self._release(key)
+
+    def _on_lane_done(self, key: tuple[UUID, int], task: asyncio.Task) -> None:
+        self._lane_tasks.discard(task)
+        self._release(key)
+        message = self._lanes.pop(key)
+        if not task.cancelled() and task.exception() is not None:
+            # the message stays IN_PROGRESS and is released when the worker restarts
+            logger.error(f"Lane of chat {key[1]} crashed on message {message.id}", exc_info=task.exception())
+
+    def _release(self, key: tuple[UUID, int]) -> None:
+        if key not in self._holding_slot:
+            return
+
+        self._holding_slot.remove(key)
+        self._slots[key[0]].release()
+        self._slot_released.set()
+
+    async def _process(self, account: SendingAccount, message: WorkerMessage) -> bool:
+        """Returns False if the message has to be retried once its chat is ready."""
+        try:
+            await account.sender.send(message)
+            account.rate_limiter.on_sent(message.chat_id)
             await self.worker_messages_repository.set_message_status(
                 message_id=message.id,
-                status=WorkerMessageStatus.IN_PROGRESS,
+                status=WorkerMessageStatus.SENT,
+                sent_at=datetime.now(),
             )
+            report = PostMessageSentRequest(
+                message_id=message.id,
+            )
+            await self.watcher_client.report_message_sent(report)
+        except FloodWaitException as e:
+            account.rate_limiter.on_flood_wait(message.chat_id, e.seconds)
+            return False
+        except SlowModeWaitException as e:
+            account.rate_limiter.on_slow_mode(message.chat_id, e.seconds)
+            return False
+        except CannotSendMessageException:
+            await self._set_failed(message)
+            logger.error("Cannot send message", exc_info=True)
+        except Exception as e:
+            logger.error(e, exc_info=True)
+            await self._set_failed(message)
+
+        return True
 
-            try:
-                await self.sender.send(message)
-                await self.worker_messages_repository.set_message_status(
-                    message_id=message.id,
-                    status=WorkerMessageStatus.SENT,
-                    sent_at=datetime.now(),
-                )
-                report = PostMessageSentRequest(
-                    message_id=message.id,
-                )
-                await self.watcher_client.report_message_sent(report)
-            except CannotSendMessageException:
-                await self.worker_messages_repository.set_message_status(
-                    message_id=message.id,
-                    status=WorkerMessageStatus.FAILED,
-                )
-                logger.error("Cannot send message", exc_info=True)
-            except Exception as e:
-                logger.error(e, exc_info=True)
-                await self.worker_messages_repository.set_message_status(
-                    message_id=message.id,
-                    status=WorkerMessageStatus.FAILED,
-                )
-
-
-            await sleep(self.global_delay)
+    async def _set_failed(self, message: WorkerMessage) -> None:
+        await self.worker_messages_repository.set_message_status(
+            message_id=message.id,
+            status=WorkerMessageStatus.FAILED,
+        )
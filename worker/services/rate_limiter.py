@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from abstractions.services.rate_limiter import RateLimiterInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenBucketRateLimiter(RateLimiterInterface):
+    """
+    Per-account token bucket with per-chat cooldowns.
+
+    The send rate adapts: every FloodWait halves it, every successful send
+    nudges it back up towards `max_rate`, which is the starting rate unless
+    the operator opts in to a higher one.
+    FloodWait and slow mode only block the chat they were raised for.
+    """
+    rate: float = 1.0
+    burst: int = 3
+
+    min_rate: float = 0.1
+    # None keeps `rate` as the ceiling: probing for more only ends in FloodWaits on a user account
+    max_rate: Optional[float] = None
+    # added to the rate after each successful send
+    recovery: float = 0.05
+    # the rate is multiplied by it on FloodWait
+    backoff: float = 0.5
+
+    _tokens: float = field(default=0, init=False)
+    _updated_at: float = field(default_factory=time.monotonic, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    # chat_id -> monotonic time the chat accepts messages again
+    _chat_ready_at: dict[int, float] = field(default_factory=dict, init=False)
+    # chat_id -> learned slow mode interval
+    _chat_interval: dict[int, float] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        self._tokens = self.burst
+        if self.max_rate is None:
+            self.max_rate = self.rate
+
+    def chat_delay(self, chat_id: int) -> float:
+        ready_at = self._chat_ready_at.get(chat_id)
+        if ready_at is None:
+            return 0
+
+        delay = ready_at - time.monotonic()
+        if delay <= 0:
+            del self._chat_ready_at[chat_id]
+            return 0
+
+        return delay
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_sent(self, chat_id: int) -> None:
+        self.rate = min(self.max_rate, self.rate + self.recovery)
+
+        interval = self._chat_interval.get(chat_id)
+        if interval:
+            self._chat_ready_at[chat_id] = time.monotonic() + interval
+
+    def on_flood_wait(self, chat_id: int, seconds: int) -> None:
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * self.backoff)
+        self._chat_ready_at[chat_id] = time.monotonic() + seconds
+        logger.warning(f"FloodWait of {seconds}s in chat {chat_id}, send rate lowered to {self.rate:.2f}/s")
+
+    def on_slow_mode(self, chat_id: int, seconds: int) -> None:
+        # the error carries the remaining wait, so the interval is learned as the longest one seen
+        self._chat_interval[chat_id] = max(self._chat_interval.get(chat_id, 0), seconds)
+        self._chat_ready_at[chat_id] = time.monotonic() + seconds
+        logger.info(f"Slow mode in chat {chat_id}, next message in {seconds}s")
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
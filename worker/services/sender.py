@@ -7,7 +7,7 @@ from shared.domain.requests import PostMessageSentRequest
 
 from abstractions.repositories import TelegramMessagesRepositoryInterface
 from abstractions.services.sender import SenderInterface
-from services.exceptions import CannotSendMessageException
+from services.exceptions import CannotSendMessageException, RateLimitedException
 
 
 @dataclass
@@ -27,5 +27,8 @@ class Sender(SenderInterface):
                 entities=message.entities,
                 media_path=message.media_path,
             )
+        except RateLimitedException:
+            # not a failure, the consumer retries the message once the chat is ready
+            raise
         except Exception as e:
             raise CannotSendMessageException from e
@@ -1,19 +1,34 @@
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 from shared.infrastructure.main_db import MainDBSettings
 from shared.services.upload.settings import UploadSettings
 from shared.services.watcher_client import WatcherSettings
-from shared.settings import EnvironmentSettings
+from shared.settings import EnvironmentSettings, AbstractSettings
 from shared.settings.worker import WorkerSettings
 
 
+class RateLimitSettings(AbstractSettings):
+    # sends per second the account starts with, adapted on FloodWait
+    rate: float = Field(default=1.0)
+    burst: int = Field(default=3)
+    min_rate: float = Field(default=0.1)
+    # opt-in: lets successful sends push the rate above `rate`; unset never exceeds it
+    max_rate: Optional[float] = Field(default=None)
+    # longer waits fail the message instead of holding it in the worker
+    max_deferral: int = Field(default=300)
+
+
 class Settings(WorkerSettings):
     db: MainDBSettings = Field(default_factory=MainDBSettings)
     upload: UploadSettings = Field(default_factory=UploadSettings)
     watcher: WatcherSettings = Field(default_factory=WatcherSettings)
     environment: EnvironmentSettings = Field(default_factory=EnvironmentSettings)
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
+    # sends kept in flight at once per account, each to a different chat
+    concurrency: int = Field(default=1)
 
     model_config = SettingsConfigDict(
         extra="ignore",